@@ -3,13 +3,14 @@ AI Dashboard Widget API
 Real-time chat with AI assistant in multiple languages
 """
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 import uuid
 from datetime import datetime
 
 from models.ai_widget import (
-    ChatMessageCreate, ChatMessageResponse, ChatConversationCreate,
+    ChatMessageCreate, ChatConversationCreate,
     ChatConversationResponse, ChatConversationWithMessages,
     WidgetSettingsUpdate, WidgetSettingsResponse,
     AIWidgetSessionCreate, AIWidgetSessionResponse,
@@ -19,9 +20,10 @@ from db_models.ai_widget import ChatConversationDB, ChatMessageDB, AIWidgetSessi
 from db_models.user import UserDB
 from config.database import get_db
 from config.dependencies import get_current_user
+from config.uuid_type import uuid7
 from services.ai_service import AIService
 
-router = APIRouter(prefix="/api/ai-widget", tags=["AI Widget"])
+router = APIRouter(prefix="/api/ai-widget", tags=["AI Widget"], default_response_class=ORJSONResponse)
 
 
 @router.post("/conversations", response_model=ChatConversationResponse, status_code=status.HTTP_201_CREATED)
@@ -33,7 +35,7 @@ async def create_conversation(
     """Create a new chat conversation"""
     
     new_conversation = ChatConversationDB(
-        conversation_id=uuid.uuid4(),
+        conversation_id=uuid7(),
         user_id=current_user["user_id"],
         title=conversation.title,
         language_code=conversation.language_code,
@@ -66,15 +68,16 @@ async def get_conversations(
         ChatConversationDB.user_id == current_user["user_id"]
     ).order_by(ChatConversationDB.updated_at.desc()).all()
     
+    # Plain dicts: the response model validates them once (building models here would validate twice)
     return [
-        ChatConversationResponse(
-            conversation_id=str(conv.conversation_id),
-            user_id=conv.user_id,
-            title=conv.title,
-            language_code=conv.language_code,
-            created_at=conv.created_at,
-            updated_at=conv.updated_at
-        )
+        {
+            "conversation_id": str(conv.conversation_id),
+            "user_id": conv.user_id,
+            "title": conv.title,
+            "language_code": conv.language_code,
+            "created_at": conv.created_at,
+            "updated_at": conv.updated_at
+        }
         for conv in conversations
     ]
 
@@ -102,24 +105,24 @@ async def get_conversation_with_messages(
         ChatMessageDB.conversation_id == uuid.UUID(conversation_id)
     ).order_by(ChatMessageDB.created_at.asc()).all()
     
-    return ChatConversationWithMessages(
-        conversation_id=str(conversation.conversation_id),
-        title=conversation.title,
-        language_code=conversation.language_code,
-        messages=[
-            ChatMessageResponse(
-                message_id=str(msg.message_id),
-                conversation_id=str(msg.conversation_id),
-                role=msg.role,
-                content=msg.content,
-                audio_url=msg.audio_url,
-                created_at=msg.created_at
-            )
+    return {
+        "conversation_id": str(conversation.conversation_id),
+        "title": conversation.title,
+        "language_code": conversation.language_code,
+        "messages": [
+            {
+                "message_id": str(msg.message_id),
+                "conversation_id": str(msg.conversation_id),
+                "role": msg.role,
+                "content": msg.content,
+                "audio_url": msg.audio_url,
+                "created_at": msg.created_at
+            }
             for msg in messages
         ],
-        created_at=conversation.created_at,
-        updated_at=conversation.updated_at
-    )
+        "created_at": conversation.created_at,
+        "updated_at": conversation.updated_at
+    }
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -148,7 +151,7 @@ async def send_chat_message(
         title = await AIService.generate_conversation_title(request.message, language)
         
         conversation = ChatConversationDB(
-            conversation_id=uuid.uuid4(),
+            conversation_id=uuid7(),
             user_id=current_user["user_id"],
             title=title,
             language_code=language,
@@ -161,7 +164,7 @@ async def send_chat_message(
     
     # Save user message
     user_message = ChatMessageDB(
-        message_id=uuid.uuid4(),
+        message_id=uuid7(),
         conversation_id=conversation.conversation_id,
         role="user",
         content=request.message,
@@ -194,7 +197,7 @@ async def send_chat_message(
     
     # Save AI response
     ai_message = ChatMessageDB(
-        message_id=uuid.uuid4(),
+        message_id=uuid7(),
         conversation_id=conversation.conversation_id,
         role="assistant",
         content=ai_content,
@@ -309,7 +312,7 @@ async def create_widget_session(
     """Create a new AI widget session (for tracking usage)"""
     
     new_session = AIWidgetSessionDB(
-        session_id=uuid.uuid4(),
+        session_id=uuid7(),
         user_id=current_user["user_id"],
         session_type=session.session_type,
         message_count=0,
@@ -10,6 +10,7 @@ from datetime import datetime, date
 import uuid
 
 from config.database import get_db
+from config.uuid_type import MoneyType
 from db_models.aiml_training import (
     AIMLCourseDB,
     AIMLLessonDB,
@@ -559,7 +560,8 @@ def get_placement_stats(db: Session = Depends(get_db)):
     """Get job placement statistics"""
     total_placements = db.query(AIMLJobPlacementDB).count()
     avg_salary = db.query(AIMLJobPlacementDB).with_entities(
-        func.avg(AIMLJobPlacementDB.salary_jpy)
+        # Stored in minor units; type_ converts the average back to yen
+        func.avg(AIMLJobPlacementDB.salary_jpy, type_=MoneyType)
     ).scalar()
     
     return {
@@ -5,7 +5,6 @@ User registration and login with PostgreSQL
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
 import bcrypt
 
 from models.user import UserCreate, UserLogin, UserResponse
@@ -49,9 +48,7 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     hashed_password = hash_password(user.password)
     
     # Create user in database
-    user_id = str(uuid.uuid4())
     new_user = UserDB(
-        user_id=user_id,
         email=user.email,
         hashed_password=hashed_password,
         role=user.role,
@@ -60,7 +57,6 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
     return UserResponse(
         user_id=new_user.user_id,
@@ -5,7 +5,6 @@ Generate certificates for completed lessons with PostgreSQL
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
 from typing import List
 
 from models.certificate import CertificateResponse
@@ -50,10 +49,7 @@ async def generate_certificate(
         )
     
     # Create certificate
-    certificate_id = str(uuid.uuid4())
-    
     new_certificate = CertificateDB(
-        certificate_id=certificate_id,
         user_id=current_user["user_id"],
         lesson_id=lesson_id,
         issued_at=datetime.utcnow()
@@ -61,7 +57,6 @@ async def generate_certificate(
     
     db.add(new_certificate)
     db.commit()
-    db.refresh(new_certificate)
     
     return CertificateResponse(
         certificate_id=new_certificate.certificate_id,
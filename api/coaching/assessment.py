@@ -2,19 +2,22 @@
 Assessment API
 Endpoints for evaluating student answers and retrieving assessment results
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import uuid
 
 from config.database import get_db
 from config.dependencies import get_current_user
+from config.uuid_type import uuid7
 from db_models.wallet import AssessmentResult
 from services.assessment_service import AssessmentService
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, conlist
 
 router = APIRouter(prefix="/api/coaching/assessment", tags=["Assessment"])
 
+MAX_BATCH_ANSWERS = 50
+
 
 # ==================== PYDANTIC SCHEMAS ====================
 
@@ -54,6 +57,13 @@ class EvaluateAnswerResponse(BaseModel):
     expected_keigo_level: str
 
 
+class BatchEvaluateAnswerResult(BaseModel):
+    """One entry of a batch evaluation; exactly one of evaluation and error is set"""
+    question_id: str
+    evaluation: Optional[EvaluateAnswerResponse] = None
+    error: Optional[str] = None
+
+
 class AssessmentResultResponse(BaseModel):
     """Assessment result response model"""
     assessment_id: str
@@ -104,7 +114,7 @@ async def evaluate_answer(
             try:
                 session_uuid = uuid.UUID(request.session_id)
                 assessment_record = AssessmentResult(
-                    assessment_id=uuid.uuid4(),
+                    assessment_id=uuid7(),
                     user_id=current_user["user_id"],
                     session_id=session_uuid,
                     assessment_type=request.question_type or "general",
@@ -135,6 +145,50 @@ async def evaluate_answer(
         )
 
 
+@router.post("/evaluate/batch", response_model=List[BatchEvaluateAnswerResult])
+async def evaluate_answers_batch(
+    requests: conlist(EvaluateAnswerRequest, min_items=1, max_items=MAX_BATCH_ANSWERS),
+    response: Response,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Evaluate several answers in one request; the GPT-4 calls run concurrently
+    
+    Results are returned in request order, each with its evaluation or an error.
+    Responds 207 Multi-Status if any answer failed to evaluate. Results are not
+    linked to sessions; use /evaluate with session_id for that.
+    """
+    results = await AssessmentService.evaluate_answers_batch([
+        {
+            "question_id": request.question_id,
+            "student_answer": request.student_answer,
+            "track": request.track,
+            "expected_keigo_level": request.expected_keigo_level,
+            "question_text": request.question_text or "",
+            "question_type": request.question_type or "general"
+        }
+        for request in requests
+    ])
+    
+    items = []
+    for request, result in zip(requests, results):
+        if isinstance(result, Exception):
+            items.append(BatchEvaluateAnswerResult(
+                question_id=request.question_id,
+                error=f"Error evaluating answer: {str(result)}"
+            ))
+        else:
+            items.append(BatchEvaluateAnswerResult(
+                question_id=request.question_id,
+                evaluation=EvaluateAnswerResponse(**result)
+            ))
+    
+    if any(item.error for item in items):
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    
+    return items
+
+
 @router.get("/results", response_model=List[AssessmentResultResponse])
 async def get_assessment_results(
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
@@ -10,7 +10,7 @@ import uuid
 
 from config.database import get_db
 from config.dependencies import get_current_user
-from db_models.wallet import VideoSession
+from db_models.wallet import VideoSession, SessionStatus
 from services.video_session_service import VideoSessionService
 from pydantic import BaseModel, Field
 
@@ -282,7 +282,7 @@ async def complete_session(
 async def get_user_sessions(
     limit: int = Query(50, ge=1, le=100, description="Number of sessions to return"),
     offset: int = Query(0, ge=0, description="Number of sessions to skip"),
-    status_filter: Optional[str] = Query(None, description="Filter by status"),
+    status_filter: Optional[SessionStatus] = Query(None, description="Filter by status"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -303,7 +303,7 @@ async def get_user_sessions(
         
         # Apply status filter if provided
         if status_filter:
-            query = query.filter(VideoSession.status == status_filter)
+            query = query.filter(VideoSession.status == status_filter.value)
         
         # Order by created_at descending and apply pagination
         sessions = query.order_by(
@@ -3,13 +3,19 @@ Voice Coaching API
 Endpoints for voice coaching sessions with Standard and Realtime modes
 """
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from decimal import Decimal
+from datetime import datetime
 import uuid
+import httpx
+import openai
+import orjson
 
 from config.database import get_db
 from config.dependencies import get_current_user
+from db_models.wallet import VoiceCoachingSession, OPEN_SESSION_STATUSES
 from services.voice_coaching_service import VoiceCoachingService
 from pydantic import BaseModel, Field
 
@@ -69,6 +75,7 @@ class MessageResponse(BaseModel):
     response_text: str
     tokens_used: int
     audio_url: Optional[str] = None
+    cache_hit: bool = False
 
 
 class EndSessionRequest(BaseModel):
@@ -149,6 +156,35 @@ async def start_session(
         )
 
 
+def _get_active_session(db: Session, session_uuid: uuid.UUID, user_id: str):
+    """Load the user's session for a new message, activating it if still reserved"""
+    # Verify session belongs to user
+    session = db.query(VoiceCoachingSession).filter(
+        VoiceCoachingSession.session_id == session_uuid,
+        VoiceCoachingSession.user_id == user_id
+    ).first()
+    
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found"
+        )
+    
+    if session.status not in OPEN_SESSION_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Session is in {session.status} status and cannot receive messages"
+        )
+    
+    # Update session to active if it's still reserved
+    if session.status == "reserved":
+        session.status = "active"
+        session.started_at = datetime.utcnow()
+        db.commit()
+    
+    return session
+
+
 @router.post("/{session_id}/message", response_model=MessageResponse)
 async def send_message(
     session_id: str,
@@ -171,32 +207,7 @@ async def send_message(
     """
     try:
         session_uuid = uuid.UUID(session_id)
-        
-        # Verify session belongs to user
-        from db_models.wallet import VoiceCoachingSession
-        session = db.query(VoiceCoachingSession).filter(
-            VoiceCoachingSession.session_id == session_uuid,
-            VoiceCoachingSession.user_id == current_user["user_id"]
-        ).first()
-        
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found"
-            )
-        
-        if session.status not in ["reserved", "active"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Session is in {session.status} status and cannot receive messages"
-            )
-        
-        # Update session to active if it's still reserved
-        if session.status == "reserved":
-            from datetime import datetime
-            session.status = "active"
-            session.started_at = datetime.utcnow()
-            db.commit()
+        session = _get_active_session(db, session_uuid, current_user["user_id"])
         
         # Read audio file if provided
         audio_input = None
@@ -241,6 +252,74 @@ async def send_message(
         )
 
 
+@router.post("/{session_id}/message/stream")
+async def stream_message(
+    session_id: str,
+    request: MessageRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Send a text message to a standard mode session and stream the reply
+    
+    Returns Server-Sent Events as the reply is generated, so the client can render
+    it before the full completion arrives. Each event's data is a JSON object with
+    `delta` (new text) and `finish_reason` (set on the last event).
+    
+    - **session_id**: Session ID from /start endpoint
+    - **text_input**: Text input
+    - **track**: Track type for context
+    - **conversation_history**: Optional conversation history
+    """
+    try:
+        session_uuid = uuid.UUID(session_id)
+        session = _get_active_session(db, session_uuid, current_user["user_id"])
+        
+        if session.mode != "standard":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Streaming is only available for standard mode sessions"
+            )
+        
+        # Nothing below touches the database: return the pooled connection now rather than
+        # when get_db cleans up after the whole stream has been sent
+        db.close()
+        
+        deltas = await VoiceCoachingService.stream_standard_mode(
+            session_id=session_uuid,
+            audio_input=None,
+            text_input=request.text_input,
+            track=request.track,
+            conversation_history=request.conversation_history
+        )
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing message: {str(e)}"
+        )
+    
+    async def events():
+        try:
+            async for delta in deltas:
+                yield b"data: " + orjson.dumps(delta) + b"\n\n"
+        except (openai.APIError, httpx.HTTPError) as e:
+            # Terminal event, so the client can tell a failed reply from a finished one
+            yield b"data: " + orjson.dumps({"error": f"OpenAI API error: {str(e)}"}) + b"\n\n"
+        finally:
+            # Also runs when the client disconnects: stop the upstream completion
+            await deltas.aclose()
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post("/{session_id}/end", response_model=EndSessionResponse)
 async def end_session(
     session_id: str,
@@ -3,6 +3,7 @@ Dashboard Analytics API - Database Version
 User statistics and analytics with PostgreSQL
 """
 from fastapi import APIRouter, Depends
+from sqlalchemy import select, func, bindparam
 from sqlalchemy.orm import Session
 
 from models.dashboard import DashboardStats
@@ -14,6 +15,27 @@ from config.dependencies import get_current_user
 
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
+# All counts and the average are computed by the database in one round trip,
+# so no progress, certificate or attempt rows are loaded into Python
+DASHBOARD_STATS = select(
+    select(func.count()).select_from(ProgressDB).where(
+        ProgressDB.user_id == bindparam("user_id")
+    ).scalar_subquery().label("total_lessons_enrolled"),
+    select(func.count()).select_from(ProgressDB).where(
+        ProgressDB.user_id == bindparam("user_id"),
+        ProgressDB.completed_percentage == 100
+    ).scalar_subquery().label("lessons_completed"),
+    select(func.count()).select_from(CertificateDB).where(
+        CertificateDB.user_id == bindparam("user_id")
+    ).scalar_subquery().label("certificates_earned"),
+    select(func.count()).select_from(QuizAttemptDB).where(
+        QuizAttemptDB.user_id == bindparam("user_id")
+    ).scalar_subquery().label("quizzes_taken"),
+    select(func.avg(QuizAttemptDB.score)).where(
+        QuizAttemptDB.user_id == bindparam("user_id")
+    ).scalar_subquery().label("average_quiz_score")
+)
+
 
 @router.get("/my-stats", response_model=DashboardStats)
 async def get_my_dashboard_stats(
@@ -21,33 +43,15 @@ async def get_my_dashboard_stats(
     current_user: dict = Depends(get_current_user)
 ):
     """Get comprehensive dashboard statistics for current user from PostgreSQL"""
+    stats = db.execute(DASHBOARD_STATS, {"user_id": current_user["user_id"]}).one()
     
-    user_id = current_user["user_id"]
-    
-    # Get progress data
-    all_progress = db.query(ProgressDB).filter(ProgressDB.user_id == user_id).all()
-    total_lessons_enrolled = len(all_progress)
-    lessons_completed = sum(1 for p in all_progress if p.completed_percentage == 100)
-    
-    # Get certificates
-    certificates = db.query(CertificateDB).filter(CertificateDB.user_id == user_id).all()
-    certificates_earned = len(certificates)
-    
-    # Get quiz attempts
-    quiz_attempts = db.query(QuizAttemptDB).filter(QuizAttemptDB.user_id == user_id).all()
-    quizzes_taken = len(quiz_attempts)
-    
-    # Calculate average quiz score
-    if quizzes_taken > 0:
-        total_score = sum(attempt.score for attempt in quiz_attempts)
-        average_quiz_score = round(total_score / quizzes_taken, 2)
-    else:
-        average_quiz_score = 0.0
+    # AVG is NULL when there are no attempts
+    average_quiz_score = round(float(stats.average_quiz_score), 2) if stats.quizzes_taken else 0.0
     
     return DashboardStats(
-        total_lessons_enrolled=total_lessons_enrolled,
-        lessons_completed=lessons_completed,
-        certificates_earned=certificates_earned,
-        quizzes_taken=quizzes_taken,
+        total_lessons_enrolled=stats.total_lessons_enrolled,
+        lessons_completed=stats.lessons_completed,
+        certificates_earned=stats.certificates_earned,
+        quizzes_taken=stats.quizzes_taken,
         average_quiz_score=average_quiz_score
     )
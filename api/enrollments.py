@@ -5,7 +5,6 @@ Manage lesson enrollments with PostgreSQL
 from fastapi import APIRouter, HTTPException, status, Depends, Response
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
 from typing import List
 
 from models.enrollment import EnrollmentResponse
@@ -37,10 +36,7 @@ async def enroll_in_lesson(
         )
     
     # Create enrollment
-    enrollment_id = str(uuid.uuid4())
-    
     new_enrollment = EnrollmentDB(
-        enrollment_id=enrollment_id,
         user_id=current_user["user_id"],
         lesson_id=lesson_id,
         status="active",
@@ -49,7 +45,6 @@ async def enroll_in_lesson(
     
     db.add(new_enrollment)
     db.commit()
-    db.refresh(new_enrollment)
     
     return EnrollmentResponse(
         enrollment_id=new_enrollment.enrollment_id,
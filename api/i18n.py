@@ -2,7 +2,7 @@
 Internationalization (i18n) API
 Endpoints for multilingual content management
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Security, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
 import uuid
@@ -11,12 +11,13 @@ from datetime import datetime
 from models.i18n import (
     LanguageInfo, TranslationCreate, TranslationUpdate, 
     TranslationResponse, ContentTranslations, UserLanguagePreference,
-    MultilingualContent
+    MultilingualContent, LanguageCode
 )
 from db_models.i18n import ContentTranslationDB, LanguageDB
 from db_models.user import UserDB
 from config.database import get_db
-from config.dependencies import get_current_user, require_admin
+from config.dependencies import get_current_user
+from config.uuid_type import uuid7
 
 router = APIRouter(prefix="/api/i18n", tags=["Internationalization"])
 
@@ -50,7 +51,7 @@ async def get_available_languages(
 async def create_translation(
     translation: TranslationCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Create a new content translation (admin only)"""
     
@@ -69,7 +70,7 @@ async def create_translation(
     
     # Create new translation
     new_translation = ContentTranslationDB(
-        translation_id=uuid.uuid4(),
+        translation_id=uuid7(),
         content_type=translation.content_type,
         content_id=uuid.UUID(translation.content_id),
         language_code=translation.language_code,
@@ -100,7 +101,7 @@ async def create_translation(
 async def get_translated_content(
     content_type: str,
     content_id: str,
-    language: str = Query(default="en", regex="^(ne|en|ja)$"),
+    language: LanguageCode = Query(default="en"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -173,7 +174,7 @@ async def update_translation(
     translation_id: str,
     update: TranslationUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Update an existing translation (admin only)"""
     
@@ -260,7 +261,7 @@ async def get_user_language_preference(
 async def delete_translation(
     translation_id: str,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Delete a translation (admin only)"""
     
@@ -2,13 +2,15 @@
 Japanese Language Training API Routes
 Endpoints for N5-N1 JLPT courses, lessons, vocabulary, kanji, and progress tracking
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime, date
 import uuid
 
 from config.database import get_db
+from config.uuid_type import uuid7
 from db_models.japanese_training import (
     JapaneseCourseDB,
     JapaneseLessonDB,
@@ -20,6 +22,7 @@ from db_models.japanese_training import (
     JapaneseVocabProgressDB,
     JapaneseKanjiProgressDB,
     JapaneseQuizDB,
+    JapaneseQuizQuestionDB,
     JapaneseQuizAttemptDB,
     JapaneseMockTestDB,
     JapaneseMockTestAttemptDB,
@@ -34,6 +37,35 @@ from decimal import Decimal
 
 router = APIRouter(prefix="/api/japanese", tags=["Japanese Training"])
 
+# Hot per-user lookups
+OPEN_ENROLLMENT = select(JapaneseEnrollmentDB).where(
+    JapaneseEnrollmentDB.user_id == bindparam("user_id"),
+    JapaneseEnrollmentDB.course_id == bindparam("course_id"),
+    JapaneseEnrollmentDB.status.in_(["enrolled", "active"])
+)
+MY_ENROLLMENTS = select(JapaneseEnrollmentDB).where(
+    JapaneseEnrollmentDB.user_id == bindparam("user_id")
+)
+USER_ENROLLMENT = select(JapaneseEnrollmentDB).where(
+    JapaneseEnrollmentDB.enrollment_id == bindparam("enrollment_id"),
+    JapaneseEnrollmentDB.user_id == bindparam("user_id")
+)
+ACTIVE_ENROLLMENT = select(JapaneseEnrollmentDB).where(
+    JapaneseEnrollmentDB.user_id == bindparam("user_id"),
+    JapaneseEnrollmentDB.status == "active"
+)
+# Only the columns covered by ix_vocab_progress_user_next_review
+DUE_REVIEWS = select(
+    JapaneseVocabProgressDB.vocab_progress_id,
+    JapaneseVocabProgressDB.vocab_id,
+    JapaneseVocabProgressDB.srs_level,
+    JapaneseVocabProgressDB.times_reviewed
+).where(
+    JapaneseVocabProgressDB.user_id == bindparam("user_id"),
+    JapaneseVocabProgressDB.next_review_date <= bindparam("now"),
+    JapaneseVocabProgressDB.is_mastered == False
+)
+
 
 # ==================== PYDANTIC SCHEMAS ====================
 
@@ -118,6 +150,17 @@ class QuizAttemptResponse(BaseModel):
         orm_mode = True
 
 
+class QuizQuestionResponse(BaseModel):
+    question_index: int
+    question_type: Optional[str]
+    prompt: str
+    options: Optional[Any]
+    points: int
+    
+    class Config:
+        orm_mode = True
+
+
 class MockTestAttemptCreate(BaseModel):
     mock_test_id: uuid.UUID
 
@@ -221,11 +264,10 @@ def enroll_in_course(
         raise HTTPException(status_code=404, detail="Course not found")
     
     # Check if already enrolled
-    existing = db.query(JapaneseEnrollmentDB).filter(
-        JapaneseEnrollmentDB.user_id == current_user_id,
-        JapaneseEnrollmentDB.course_id == enrollment_data.course_id,
-        JapaneseEnrollmentDB.status.in_(["enrolled", "active"])
-    ).first()
+    existing = db.execute(OPEN_ENROLLMENT, {
+        "user_id": current_user_id,
+        "course_id": enrollment_data.course_id
+    }).scalars().first()
     
     if existing:
         raise HTTPException(status_code=400, detail="Already enrolled in this course")
@@ -251,9 +293,7 @@ def get_my_enrollments(
     db: Session = Depends(get_db)
 ):
     """Get all courses user is enrolled in"""
-    enrollments = db.query(JapaneseEnrollmentDB).filter(
-        JapaneseEnrollmentDB.user_id == current_user_id
-    ).all()
+    enrollments = db.execute(MY_ENROLLMENTS, {"user_id": current_user_id}).scalars().all()
     
     return enrollments
 
@@ -266,10 +306,10 @@ def update_enrollment_progress(
     db: Session = Depends(get_db)
 ):
     """Update enrollment progress percentage"""
-    enrollment = db.query(JapaneseEnrollmentDB).filter(
-        JapaneseEnrollmentDB.enrollment_id == enrollment_id,
-        JapaneseEnrollmentDB.user_id == current_user_id
-    ).first()
+    enrollment = db.execute(USER_ENROLLMENT, {
+        "enrollment_id": enrollment_id,
+        "user_id": current_user_id
+    }).scalars().first()
     
     if not enrollment:
         raise HTTPException(status_code=404, detail="Enrollment not found")
@@ -454,6 +494,30 @@ def get_quiz(quiz_id: uuid.UUID, db: Session = Depends(get_db)):
     return quiz
 
 
+def _quiz_exists(db: Session, quiz_id: uuid.UUID) -> bool:
+    """Check for a quiz without loading its questions blob"""
+    return db.query(JapaneseQuizDB.quiz_id).filter(JapaneseQuizDB.quiz_id == quiz_id).first() is not None
+
+
+@router.get("/quizzes/{quiz_id}/questions", response_model=List[QuizQuestionResponse])
+def get_quiz_questions(
+    quiz_id: uuid.UUID,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=200),
+    db: Session = Depends(get_db)
+):
+    """Get a page of quiz questions (without answers), in order"""
+    questions = db.query(JapaneseQuizQuestionDB).filter(
+        JapaneseQuizQuestionDB.quiz_id == quiz_id,
+        JapaneseQuizQuestionDB.question_index >= offset
+    ).order_by(JapaneseQuizQuestionDB.question_index).limit(limit).all()
+    
+    if not questions and not _quiz_exists(db, quiz_id):
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    
+    return questions
+
+
 @router.post("/quizzes/{quiz_id}/attempt", response_model=QuizAttemptResponse)
 def start_quiz_attempt(
     quiz_id: uuid.UUID,
@@ -461,11 +525,7 @@ def start_quiz_attempt(
     db: Session = Depends(get_db)
 ):
     """Start a new quiz attempt"""
-    quiz = db.query(JapaneseQuizDB).filter(
-        JapaneseQuizDB.quiz_id == quiz_id
-    ).first()
-    
-    if not quiz:
+    if not _quiz_exists(db, quiz_id):
         raise HTTPException(status_code=404, detail="Quiz not found")
     
     # Count previous attempts
@@ -495,18 +555,14 @@ def submit_quiz(
     db: Session = Depends(get_db)
 ):
     """Submit quiz answers and get results"""
-    quiz = db.query(JapaneseQuizDB).filter(
-        JapaneseQuizDB.quiz_id == quiz_id
-    ).first()
-    
-    if not quiz:
+    if not _quiz_exists(db, quiz_id):
         raise HTTPException(status_code=404, detail="Quiz not found")
     
     # TODO: Implement auto-grading logic
     # For now, return mock results
     
     return {
-        "attempt_id": uuid.uuid4(),
+        "attempt_id": uuid7(),
         "quiz_id": quiz_id,
         "score": Decimal("85.50"),
         "passed": True,
@@ -523,10 +579,7 @@ def get_progress_overview(
 ):
     """Get overall learning progress"""
     # Get current enrollment
-    enrollment = db.query(JapaneseEnrollmentDB).filter(
-        JapaneseEnrollmentDB.user_id == current_user_id,
-        JapaneseEnrollmentDB.status == "active"
-    ).first()
+    enrollment = db.execute(ACTIVE_ENROLLMENT, {"user_id": current_user_id}).scalars().first()
     
     # Count mastered vocab and kanji
     vocab_mastered = db.query(JapaneseVocabProgressDB).filter(
@@ -564,11 +617,7 @@ def get_due_reviews(
     """Get vocabulary due for review (SRS)"""
     now = datetime.utcnow()
     
-    due_vocab = db.query(JapaneseVocabProgressDB).filter(
-        JapaneseVocabProgressDB.user_id == current_user_id,
-        JapaneseVocabProgressDB.next_review_date <= now,
-        JapaneseVocabProgressDB.is_mastered == False
-    ).all()
+    due_vocab = db.execute(DUE_REVIEWS, {"user_id": current_user_id, "now": now}).all()
     
     return {
         "due_count": len(due_vocab),
@@ -2,31 +2,51 @@
 Lesson Management API - Database Version
 CRUD operations for Japanese lessons with PostgreSQL
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Response
+from fastapi import APIRouter, HTTPException, status, Depends, Security, Response
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
-from typing import List
+from typing import List, Dict
+from pydantic import conlist
+import io
 
-from models.lesson import LessonCreate, LessonUpdate, LessonResponse
+from models.lesson import (
+    LessonCreate, LessonUpdate, LessonResponse, LessonBatchRequest, LessonBulkResponse
+)
 from db_models.lesson import LessonDB
 from config.database import get_db
-from config.dependencies import require_admin
+from config.uuid_type import generate_id, json_dumps
+from config.dependencies import get_current_user
 
 router = APIRouter(prefix="/api/lessons", tags=["Lessons"])
 
+# On PostgreSQL the response body is built server-side from the JSONB column,
+# so content_json is never decoded and re-encoded in Python on the read path.
+ALL_LESSONS_JSON = text("SELECT coalesce(jsonb_agg(to_jsonb(l)), '[]'::jsonb)::text FROM lessons l")
+LESSON_JSON = text("SELECT to_jsonb(l)::text FROM lessons l WHERE l.lesson_id = :lesson_id")
+
+MAX_BULK_LESSONS = 1000
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _csv_field(value) -> str:
+    """Quote every value, so COPY reads only None (an unquoted empty field) as NULL"""
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
 
 @router.post("", response_model=LessonResponse, status_code=status.HTTP_201_CREATED)
 async def create_lesson(
     lesson: LessonCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Create a new lesson (admin only) - stores in PostgreSQL"""
-    lesson_id = str(uuid.uuid4())
-    
     new_lesson = LessonDB(
-        lesson_id=lesson_id,
         level=lesson.level,
         title=lesson.title,
         description=lesson.description,
@@ -36,7 +56,6 @@ async def create_lesson(
     
     db.add(new_lesson)
     db.commit()
-    db.refresh(new_lesson)
     
     return LessonResponse(
         lesson_id=new_lesson.lesson_id,
@@ -48,13 +67,69 @@ async def create_lesson(
     )
 
 
+@router.post("/bulk", response_model=LessonBulkResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_lessons(
+    lessons: conlist(LessonCreate, max_items=MAX_BULK_LESSONS),
+    db: Session = Depends(get_db),
+    current_user: dict = Security(get_current_user, scopes=["admin"])
+):
+    """Import many lessons in a single transaction (admin only)"""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "lesson_id": generate_id(),
+            "level": lesson.level,
+            "title": lesson.title,
+            "description": lesson.description,
+            "content_json": lesson.content_json,
+            "created_at": now
+        }
+        for lesson in lessons
+    ]
+    
+    if rows:
+        if _is_postgres(db):
+            # COPY is far cheaper than per-row INSERTs for large imports
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write(",".join(_csv_field(value) for value in (
+                    row["lesson_id"],
+                    row["level"],
+                    row["title"],
+                    row["description"],
+                    json_dumps(row["content_json"]),
+                    row["created_at"].isoformat()
+                )) + "\n")
+            buffer.seek(0)
+            
+            db.execute(text("SET LOCAL synchronous_commit = OFF"))
+            with db.connection().connection.cursor() as cursor:
+                cursor.copy_expert(
+                    "COPY lessons (lesson_id, level, title, description, content_json, created_at) "
+                    "FROM STDIN WITH (FORMAT csv)",
+                    buffer
+                )
+        else:
+            db.execute(LessonDB.__table__.insert(), rows)
+        db.commit()
+    
+    return LessonBulkResponse(
+        created=len(rows),
+        lesson_ids=[row["lesson_id"] for row in rows]
+    )
+
+
 @router.get("", response_model=List[LessonResponse])
 async def get_all_lessons(db: Session = Depends(get_db)):
     """Get all lessons from PostgreSQL"""
+    if _is_postgres(db):
+        body = db.execute(ALL_LESSONS_JSON).scalar()
+        return Response(content=body, media_type="application/json")
+    
     lessons = db.query(LessonDB).all()
     
     return [
-        LessonResponse(
+        LessonResponse.construct(
             lesson_id=lesson.lesson_id,
             level=lesson.level,
             title=lesson.title,
@@ -66,9 +141,36 @@ async def get_all_lessons(db: Session = Depends(get_db)):
     ]
 
 
+@router.post("/batch", response_model=Dict[str, LessonResponse])
+async def get_lessons_batch(batch: LessonBatchRequest, db: Session = Depends(get_db)):
+    """Get several lessons in one query, keyed by lesson_id (unknown IDs are omitted)"""
+    lessons = db.query(LessonDB).filter(LessonDB.lesson_id.in_(set(batch.lesson_ids))).all()
+    
+    return {
+        lesson.lesson_id: LessonResponse.construct(
+            lesson_id=lesson.lesson_id,
+            level=lesson.level,
+            title=lesson.title,
+            description=lesson.description,
+            content_json=lesson.content_json,
+            created_at=lesson.created_at
+        )
+        for lesson in lessons
+    }
+
+
 @router.get("/{lesson_id}", response_model=LessonResponse)
 async def get_lesson(lesson_id: str, db: Session = Depends(get_db)):
     """Get specific lesson by ID from PostgreSQL"""
+    if _is_postgres(db):
+        body = db.execute(LESSON_JSON, {"lesson_id": lesson_id}).scalar()
+        if body is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Lesson not found"
+            )
+        return Response(content=body, media_type="application/json")
+    
     lesson = db.query(LessonDB).filter(LessonDB.lesson_id == lesson_id).first()
     
     if not lesson:
@@ -92,7 +194,7 @@ async def update_lesson(
     lesson_id: str,
     lesson_update: LessonUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Update a lesson (admin only) in PostgreSQL"""
     lesson = db.query(LessonDB).filter(LessonDB.lesson_id == lesson_id).first()
@@ -114,7 +216,6 @@ async def update_lesson(
         lesson.content_json = lesson_update.content_json
     
     db.commit()
-    db.refresh(lesson)
     
     return LessonResponse(
         lesson_id=lesson.lesson_id,
@@ -130,7 +231,7 @@ async def update_lesson(
 async def delete_lesson(
     lesson_id: str,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Delete a lesson (admin only) from PostgreSQL"""
     lesson = db.query(LessonDB).filter(LessonDB.lesson_id == lesson_id).first()
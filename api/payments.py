@@ -3,21 +3,31 @@ Payment Processing API - Database Version
 Stripe payment integration with PostgreSQL
 """
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
 import stripe
 
 from models.payment import PaymentIntentCreate, PaymentIntentResponse, PaymentHistoryResponse
 from db_models.payment import PaymentDB
 from config.database import get_db
 from config.dependencies import get_current_user
-from config.stripe_config import get_stripe_key
+from config.cache import cache_get, cache_set, cache_delete
 
 router = APIRouter(prefix="/api/payments", tags=["Payments"])
 
-# Configure Stripe
-stripe.api_key = get_stripe_key()
+PAYMENT_HISTORY_TTL = 60  # seconds
+
+# Exactly the PaymentHistoryResponse fields, so rows map straight to response dicts
+MY_PAYMENTS = select(
+    PaymentDB.payment_id,
+    PaymentDB.payment_intent_id,
+    PaymentDB.amount,
+    PaymentDB.currency,
+    PaymentDB.status,
+    PaymentDB.created_at
+).where(PaymentDB.user_id == bindparam("user_id"))
 
 
 @router.post("/create-intent", response_model=PaymentIntentResponse, status_code=status.HTTP_201_CREATED)
@@ -44,10 +54,7 @@ async def create_payment_intent(
         )
         
         # Store in database
-        payment_id = str(uuid.uuid4())
-        
         new_payment = PaymentDB(
-            payment_id=payment_id,
             user_id=current_user["user_id"],
             payment_intent_id=intent.id,
             amount=payment_data.amount,
@@ -58,7 +65,7 @@ async def create_payment_intent(
         
         db.add(new_payment)
         db.commit()
-        db.refresh(new_payment)
+        cache_delete(f"user:{current_user['user_id']}:payments")
         
         return PaymentIntentResponse(
             payment_id=new_payment.payment_id,
@@ -81,22 +88,24 @@ async def get_my_payment_history(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get payment history for current user from PostgreSQL"""
-    payments = db.query(PaymentDB).filter(
-        PaymentDB.user_id == current_user["user_id"]
-    ).all()
+    """
+    Get payment history for current user (cached briefly per user)
     
-    return [
-        PaymentHistoryResponse(
-            payment_id=payment.payment_id,
-            payment_intent_id=payment.payment_intent_id,
-            amount=payment.amount,
-            currency=payment.currency,
-            status=payment.status,
-            created_at=payment.created_at
-        )
-        for payment in payments
+    Rows already have the response shape, so they are encoded with orjson directly
+    instead of being built into models and re-validated against response_model.
+    """
+    cache_key = f"user:{current_user['user_id']}:payments"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    history = [
+        row._asdict()
+        for row in db.execute(MY_PAYMENTS, {"user_id": current_user["user_id"]})
     ]
+    cache_set(cache_key, history, PAYMENT_HISTORY_TTL)
+    
+    return ORJSONResponse(history)
 
 
 @router.get("/status/{payment_intent_id}", response_model=PaymentHistoryResponse)
@@ -2,19 +2,33 @@
 Progress Tracking API - Database Version
 Track user progress through lessons with PostgreSQL
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Security
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
 from typing import List
 
 from models.progress import ProgressCreate, ProgressUpdate, ProgressResponse
 from db_models.progress import ProgressDB
 from config.database import get_db
-from config.dependencies import get_current_user, require_admin
+from config.dependencies import get_current_user
+from config.cache import cache_get, cache_set, cache_delete
 
 router = APIRouter(prefix="/api/progress", tags=["Progress"])
 
+PROGRESS_TTL = 60  # seconds
+
+# Exactly the ProgressResponse fields, so rows map straight to response dicts
+MY_PROGRESS = select(
+    ProgressDB.progress_id,
+    ProgressDB.user_id,
+    ProgressDB.lesson_id,
+    ProgressDB.completed_percentage,
+    ProgressDB.notes,
+    ProgressDB.last_updated
+).where(ProgressDB.user_id == bindparam("user_id"))
+
 
 @router.post("", response_model=ProgressResponse, status_code=status.HTTP_201_CREATED)
 async def create_or_update_progress(
@@ -45,7 +59,7 @@ async def create_or_update_progress(
         existing_progress.last_updated = datetime.utcnow()
         
         db.commit()
-        db.refresh(existing_progress)
+        cache_delete(f"user:{current_user['user_id']}:progress")
         
         return ProgressResponse(
             progress_id=existing_progress.progress_id,
@@ -57,10 +71,7 @@ async def create_or_update_progress(
         )
     else:
         # Create new progress
-        progress_id = str(uuid.uuid4())
-        
         new_progress = ProgressDB(
-            progress_id=progress_id,
             user_id=current_user["user_id"],
             lesson_id=progress_data.lesson_id,
             completed_percentage=progress_data.completed_percentage,
@@ -70,7 +81,7 @@ async def create_or_update_progress(
         
         db.add(new_progress)
         db.commit()
-        db.refresh(new_progress)
+        cache_delete(f"user:{current_user['user_id']}:progress")
         
         return ProgressResponse(
             progress_id=new_progress.progress_id,
@@ -87,29 +98,31 @@ async def get_my_progress(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get all progress for current user from PostgreSQL"""
-    progress_records = db.query(ProgressDB).filter(
-        ProgressDB.user_id == current_user["user_id"]
-    ).all()
+    """
+    Get all progress for current user (cached briefly per user)
     
-    return [
-        ProgressResponse(
-            progress_id=p.progress_id,
-            user_id=p.user_id,
-            lesson_id=p.lesson_id,
-            completed_percentage=p.completed_percentage,
-            notes=p.notes,
-            last_updated=p.last_updated
-        )
-        for p in progress_records
+    Rows already have the response shape, so they are encoded with orjson directly
+    instead of being built into models and re-validated against response_model.
+    """
+    cache_key = f"user:{current_user['user_id']}:progress"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    progress = [
+        row._asdict()
+        for row in db.execute(MY_PROGRESS, {"user_id": current_user["user_id"]})
     ]
+    cache_set(cache_key, progress, PROGRESS_TTL)
+    
+    return ORJSONResponse(progress)
 
 
 @router.get("/lesson/{lesson_id}/stats")
 async def get_lesson_progress_stats(
     lesson_id: str,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Get progress statistics for a lesson (admin only) from PostgreSQL"""
     progress_records = db.query(ProgressDB).filter(
@@ -2,155 +2,215 @@
 Quiz Management API - Database Version
 Quiz creation and grading with PostgreSQL
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Security, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select, bindparam, tuple_, cast, Float
 from sqlalchemy.orm import Session
 from datetime import datetime
-import uuid
-from typing import List, Union, Dict
+import base64
+import binascii
+import operator
+from typing import List, Optional, Tuple
 
-from models.quiz import QuizCreate, QuizResponse, QuizResultResponse, QuizAttemptResponse
+from models.quiz import (
+    QuizCreate, QuizResponse, QuizSummaryResponse, QuizSubmission, QuizResultResponse,
+    QuizAttemptResponse
+)
 from db_models.quiz import QuizDB, QuizAttemptDB
 from config.database import get_db
-from config.dependencies import get_current_user, require_admin
+from config.dependencies import get_current_user
+from services.quiz_cache_service import QuizCacheService
 
-router = APIRouter(prefix="/api/quizzes", tags=["Quizzes"])
+router = APIRouter(prefix="/api/quizzes", tags=["Quizzes"], default_response_class=ORJSONResponse)
+
+# Selects only the columns we return so the answers JSON is never fetched; rows are
+# encoded without QuizAttemptResponse, so columns are cast to the model's types here
+MY_ATTEMPTS = select(
+    QuizAttemptDB.attempt_id,
+    QuizAttemptDB.quiz_id,
+    QuizAttemptDB.user_id,
+    cast(QuizAttemptDB.score, Float).label("score"),
+    QuizAttemptDB.total_questions,
+    QuizAttemptDB.correct_answers,
+    QuizAttemptDB.submitted_at
+).where(
+    QuizAttemptDB.user_id == bindparam("user_id")
+).order_by(
+    QuizAttemptDB.submitted_at.desc(),
+    QuizAttemptDB.attempt_id.desc()
+).limit(bindparam("limit"))
+
+# Next page: keyset on (submitted_at, attempt_id), so deep pages cost the same as the first
+MY_ATTEMPTS_AFTER = MY_ATTEMPTS.where(
+    tuple_(QuizAttemptDB.submitted_at, QuizAttemptDB.attempt_id)
+    < tuple_(
+        bindparam("cursor_ts", type_=QuizAttemptDB.submitted_at.type),
+        bindparam("cursor_id", type_=QuizAttemptDB.attempt_id.type)
+    )
+)
+
+
+def encode_cursor(submitted_at: datetime, attempt_id: str) -> str:
+    """Opaque cursor pointing just past an attempt"""
+    raw = f"{submitted_at.isoformat()}|{attempt_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Parse a cursor from encode_cursor; raises 400 if it is malformed"""
+    try:
+        submitted_at, attempt_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(submitted_at), attempt_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
 
 @router.post("", response_model=QuizResponse, status_code=status.HTTP_201_CREATED)
-async def create_quiz(
+def create_quiz(
     quiz_data: QuizCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(require_admin)
+    current_user: dict = Security(get_current_user, scopes=["admin"])
 ):
     """Create a quiz for a lesson (admin only) - stores in PostgreSQL"""
-    quiz_id = str(uuid.uuid4())
+    created_at = datetime.utcnow()
     
-    new_quiz = QuizDB(
-        quiz_id=quiz_id,
-        lesson_id=quiz_data.lesson_id,
-        title=quiz_data.title,
-        questions=quiz_data.questions,
-        created_at=datetime.utcnow()
+    # Core INSERT: every returned field is already known, so no ORM refresh is needed
+    result = db.execute(
+        insert(QuizDB).values(
+            lesson_id=quiz_data.lesson_id,
+            title=quiz_data.title,
+            questions=quiz_data.questions,
+            answer_key=[question.get("correct_answer") for question in quiz_data.questions],
+            created_at=created_at
+        )
     )
-    
-    db.add(new_quiz)
+    quiz_id = result.inserted_primary_key[0]
     db.commit()
-    db.refresh(new_quiz)
+    QuizCacheService.invalidate(quiz_id, quiz_data.lesson_id)
     
     return QuizResponse(
-        quiz_id=new_quiz.quiz_id,
-        lesson_id=new_quiz.lesson_id,
-        title=new_quiz.title,
-        questions=new_quiz.questions,
-        created_at=new_quiz.created_at
+        quiz_id=quiz_id,
+        lesson_id=quiz_data.lesson_id,
+        title=quiz_data.title,
+        questions=quiz_data.questions,
+        created_at=created_at
     )
 
 
-@router.get("/lesson/{lesson_id}", response_model=List[QuizResponse])
-async def get_quizzes_for_lesson(
+@router.get("/lesson/{lesson_id}", response_model=List[QuizSummaryResponse])
+def get_quizzes_for_lesson(
     lesson_id: str,
     db: Session = Depends(get_db)
 ):
-    """Get all quizzes for a specific lesson from PostgreSQL"""
-    quizzes = db.query(QuizDB).filter(QuizDB.lesson_id == lesson_id).all()
-    
-    return [
-        QuizResponse(
-            quiz_id=quiz.quiz_id,
-            lesson_id=quiz.lesson_id,
-            title=quiz.title,
-            questions=quiz.questions,
-            created_at=quiz.created_at
-        )
-        for quiz in quizzes
-    ]
+    """List quizzes for a specific lesson (without questions; fetch a quiz by ID for those)"""
+    # Cached summaries are already in response shape: encode directly, skipping per-item validation
+    return ORJSONResponse(QuizCacheService.get_lesson_quizzes(db, lesson_id))
 
 
 @router.post("/{quiz_id}/submit", response_model=QuizResultResponse, status_code=status.HTTP_201_CREATED)
-async def submit_quiz(
+def submit_quiz(
     quiz_id: str,
-    submission: Dict[str, Union[List[str], Dict[str, str]]],
+    submission: QuizSubmission,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Submit quiz answers and get automatic grading from PostgreSQL"""
     
-    # Get quiz
-    quiz = db.query(QuizDB).filter(QuizDB.quiz_id == quiz_id).first()
-    if not quiz:
+    # Only the answer key is needed for grading (cached; changes only on admin writes)
+    correct_key = QuizCacheService.get_answer_key(db, quiz_id)
+    if correct_key is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Quiz not found"
         )
     
-    answers = submission.get("answers", [])
+    answers = submission.answers
+    total_questions = len(correct_key)
     
-    # Convert list answers to dict format (index-based)
+    # Grade straight from an index-ordered list; dict submissions are converted once
     if isinstance(answers, list):
-        answers_dict = {str(i): ans for i, ans in enumerate(answers)}
+        user_answers = answers
     else:
-        answers_dict = answers
+        user_answers = [answers.get(str(i)) for i in range(total_questions)]
     
-    # Grade the quiz
-    total_questions = len(quiz.questions)
-    correct_answers = 0
+    # Grade the quiz (unanswered questions count as wrong)
+    correct_answers = sum(map(operator.eq, user_answers, correct_key))
     
-    for i, question in enumerate(quiz.questions):
-        correct_answer = question.get("correct_answer")
-        user_answer = answers_dict.get(str(i))
-        
-        if user_answer == correct_answer:
-            correct_answers += 1
+    # Whole percent, as quiz_attempts.score is an Integer column; the response returns exactly what is stored
+    score = round(correct_answers * 100 / total_questions) if total_questions > 0 else 0
     
-    score = round((correct_answers / total_questions) * 100, 2) if total_questions > 0 else 0
+    # Attempts are stored keyed by index; only list submissions need converting
+    answers_dict = answers if isinstance(answers, dict) else {str(i): ans for i, ans in enumerate(answers)}
     
-    # Save attempt (store as dict for consistency)
-    attempt_id = str(uuid.uuid4())
+    # Save attempt in a single INSERT
+    submitted_at = datetime.utcnow()
+    result = db.execute(
+        insert(QuizAttemptDB).values(
+            quiz_id=quiz_id,
+            user_id=current_user["user_id"],
+            answers=answers_dict,
+            score=score,
+            total_questions=total_questions,
+            correct_answers=correct_answers,
+            submitted_at=submitted_at
+        )
+    )
+    attempt_id = result.inserted_primary_key[0]
+    db.commit()
     
-    new_attempt = QuizAttemptDB(
+    return QuizResultResponse(
         attempt_id=attempt_id,
         quiz_id=quiz_id,
-        user_id=current_user["user_id"],
-        answers=answers_dict,
         score=score,
         total_questions=total_questions,
         correct_answers=correct_answers,
-        submitted_at=datetime.utcnow()
-    )
-    
-    db.add(new_attempt)
-    db.commit()
-    db.refresh(new_attempt)
-    
-    return QuizResultResponse(
-        attempt_id=new_attempt.attempt_id,
-        quiz_id=new_attempt.quiz_id,
-        score=new_attempt.score,
-        total_questions=new_attempt.total_questions,
-        correct_answers=new_attempt.correct_answers,
-        submitted_at=new_attempt.submitted_at
+        submitted_at=submitted_at
     )
 
 
 @router.get("/my-attempts", response_model=List[QuizAttemptResponse])
-async def get_my_quiz_attempts(
+def get_my_quiz_attempts(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get all quiz attempts for current user from PostgreSQL"""
-    attempts = db.query(QuizAttemptDB).filter(
-        QuizAttemptDB.user_id == current_user["user_id"]
-    ).all()
+    """
+    Get quiz attempts for current user, newest first
+    
+    When more attempts may follow, the X-Next-Cursor header holds the cursor for the next page.
+    """
+    params = {"user_id": current_user["user_id"], "limit": limit}
+    if cursor:
+        params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+        attempts = db.execute(MY_ATTEMPTS_AFTER, params).all()
+    else:
+        attempts = db.execute(MY_ATTEMPTS, params).all()
+    
+    headers = {}
+    if len(attempts) == limit:
+        last = attempts[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.submitted_at, last.attempt_id)
+    
+    # Rows select exactly the QuizAttemptResponse fields: encode directly, skipping per-item validation
+    return ORJSONResponse([row._asdict() for row in attempts], headers=headers)
+
+
+@router.get("/{quiz_id}", response_model=QuizResponse)
+def get_quiz(
+    quiz_id: str,
+    db: Session = Depends(get_db)
+):
+    """Get a single quiz including its questions"""
+    quiz = QuizCacheService.get_quiz(db, quiz_id)
     
-    return [
-        QuizAttemptResponse(
-            attempt_id=attempt.attempt_id,
-            quiz_id=attempt.quiz_id,
-            user_id=attempt.user_id,
-            score=attempt.score,
-            total_questions=attempt.total_questions,
-            correct_answers=attempt.correct_answers,
-            submitted_at=attempt.submitted_at
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Quiz not found"
         )
-        for attempt in attempts
-    ]
+    
+    return quiz
@@ -0,0 +1,80 @@
+"""
+Redis Cache Configuration
+Short-lived per-user caching; disabled when REDIS_URL is not set
+"""
+import os
+import json
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_client = None
+
+
+def get_redis():
+    """Get the shared Redis client, or None when caching is disabled"""
+    global _client
+    if _client is None and REDIS_URL and redis is not None:
+        pool = redis.ConnectionPool.from_url(REDIS_URL, max_connections=50)
+        _client = redis.Redis(connection_pool=pool)
+    return _client
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=str).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """Get a cached value, or None on a miss (or if Redis is unavailable)"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+    except redis.RedisError:
+        return None
+    return _loads(raw) if raw is not None else None
+
+
+def cache_set(key: str, value: Any, ttl: int) -> None:
+    """Cache a JSON-serializable value for ttl seconds"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.set(key, _dumps(value), ex=ttl)
+    except redis.RedisError:
+        pass
+
+
+def cache_delete(*keys: str) -> None:
+    """Invalidate cached values after a write"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError:
+        pass
@@ -30,6 +30,20 @@ MIN_VIDEO_SESSION_DURATION = 10
 MAX_VOICE_SESSION_DURATION = 60
 MAX_VIDEO_SESSION_DURATION = 120
 
+# Session cost by whole minutes (0 to the maximum duration), precomputed so pricing is a lookup
+VOICE_COACHING_STANDARD_COSTS = {
+    minutes: VOICE_COACHING_STANDARD_COST_PER_MINUTE * minutes
+    for minutes in range(MAX_VOICE_SESSION_DURATION + 1)
+}
+VOICE_COACHING_REALTIME_COSTS = {
+    minutes: VOICE_COACHING_REALTIME_COST_PER_MINUTE * minutes
+    for minutes in range(MAX_VOICE_SESSION_DURATION + 1)
+}
+VIDEO_SESSION_COSTS = {
+    minutes: VIDEO_SESSION_COST_PER_MINUTE * minutes
+    for minutes in range(MAX_VIDEO_SESSION_DURATION + 1)
+}
+
 # Topup bonus tiers
 TOPUP_BONUS_TIER_1_AMOUNT = Decimal("1000.00")  # NPR
 TOPUP_BONUS_TIER_1_PERCENTAGE = Decimal("10.00")  # 10%
@@ -2,22 +2,69 @@
 Authentication Dependencies
 JWT token verification and role checking
 """
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import threading
+import time
+
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, SecurityScopes
 from config.auth import verify_token
 
 security = HTTPBearer()
 
+# Verified token payloads, keyed by a hash of the token (raw tokens are not retained)
+TOKEN_CACHE_SIZE = 8192
+TOKEN_CACHE_TTL = 60  # seconds
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """
+    Verify a JWT, reusing recent successful verifications
+    
+    Entries expire after TOKEN_CACHE_TTL seconds, and never outlive the token's exp claim.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            payload, expires_at = entry
+            if now < expires_at:
+                _token_cache.move_to_end(key)
+                return payload
+            del _token_cache[key]
+    
+    payload = verify_token(token)
+    if payload:
+        expires_at = min(now + TOKEN_CACHE_TTL, payload.get("exp", now + TOKEN_CACHE_TTL))
+        with _token_cache_lock:
+            _token_cache[key] = (payload, expires_at)
+            if len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    
+    return payload
+
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+def get_current_user(
+    security_scopes: SecurityScopes,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
     """
     Get current user from JWT token
     
+    Role checks read the role claim, so admin routes need no extra dependency:
+    use Security(get_current_user, scopes=["admin"])
+    
     Returns user data: {email, user_id, role}
-    Raises 401 if token invalid
+    Raises 401 if token invalid, 403 if the role is not in the required scopes
     """
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     
     if not payload:
         raise HTTPException(
@@ -25,20 +72,11 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             detail="Invalid or expired token"
         )
     
-    return payload
-
-
-def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
-    """
-    Require admin role
-    
-    Returns user data if admin
-    Raises 403 if not admin
-    """
-    if current_user.get("role") != "admin":
+    if security_scopes.scopes and payload.get("role") not in security_scopes.scopes:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
     
-    return current_user
+    # Copy so handlers can't mutate the cached payload
+    return dict(payload)
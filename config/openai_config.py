@@ -0,0 +1,41 @@
+﻿"""
+OpenAI Configuration
+"""
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from config.settings import get_settings
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> "AsyncOpenAI":
+    """
+    Get the process-wide async OpenAI client (created on first use).
+    
+    All services share one pooled HTTP/2 client, so connections and TLS sessions
+    are kept alive and concurrent completions are multiplexed over them instead
+    of each setting up its own. The SDK is imported here rather than at module
+    level, so processes that never call OpenAI (workers, scripts, tests) don't
+    pay for importing it.
+    """
+    import httpx
+    from openai import AsyncOpenAI
+    
+    api_key = get_settings().openai_api_key
+    return AsyncOpenAI(
+        api_key=api_key.get_secret_value() if api_key else None,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    )
+
+
+async def close_openai_client() -> None:
+    """Close the shared client's connections, if it was ever created"""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
@@ -0,0 +1,25 @@
+﻿"""
+Application Settings
+Environment configuration, read and validated once per process
+"""
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import BaseSettings, SecretStr
+
+
+class Settings(BaseSettings):
+    """Values come from the environment or .env (e.g. DATABASE_URL, STRIPE_SECRET_KEY, OPENAI_API_KEY)"""
+    database_url: str
+    use_pgbouncer: bool = False
+    stripe_secret_key: Optional[SecretStr] = None
+    openai_api_key: Optional[SecretStr] = None
+    
+    class Config:
+        env_file = ".env"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings (raises on missing or invalid values)"""
+    return Settings()
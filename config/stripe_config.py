@@ -1,17 +1,33 @@
 ﻿"""
 Stripe Configuration
 """
-import os
-from dotenv import load_dotenv
+import requests
+import stripe
+
+from config.settings import get_settings
 
-load_dotenv()
 
 def get_stripe_key() -> str:
-    """Get Stripe secret key from environment"""
-    stripe_key = os.getenv("STRIPE_SECRET_KEY")
+    """Get Stripe secret key from settings"""
+    stripe_key = get_settings().stripe_secret_key
     if not stripe_key:
         raise ValueError(
             "STRIPE_SECRET_KEY not found in environment variables. "
             "Please set it in .env file or environment."
         )
-    return stripe_key
+    return stripe_key.get_secret_value()
+
+
+def configure_stripe() -> None:
+    """
+    Configure the Stripe SDK once at application startup.
+    
+    Uses a single pooled HTTP session shared by all requests and lets the SDK
+    retry transient network failures.
+    """
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=20))
+    
+    stripe.api_key = get_stripe_key()
+    stripe.max_network_retries = 2
+    stripe.default_http_client = stripe.http_client.RequestsClient(session=session)
@@ -1,10 +1,56 @@
 ﻿"""
 SQLite-compatible UUID and JSONB types for testing
 """
-from sqlalchemy import TypeDecorator, String, Text
+from sqlalchemy import TypeDecorator, String, Text, BigInteger
 from sqlalchemy.dialects.postgresql import UUID as pgUUID, JSONB as pgJSONB
+import os
+import time
 import uuid
 import json
+from decimal import Decimal, ROUND_HALF_UP
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7).
+    
+    48-bit Unix millisecond timestamp followed by random bits, so new keys land at the
+    right edge of the primary key index instead of on random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def generate_id():
+    """
+    Generate a primary key for the String-keyed tables.
+    
+    Uses the 32-char hex form (no dashes) of a UUIDv7 to keep keys and their indexes
+    compact and inserts in key order.
+    """
+    return uuid7().hex
+
+
+def json_dumps(value) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def json_loads(value):
+    """Parse a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
 
 
 class UUID(TypeDecorator):
@@ -71,7 +117,7 @@ class JSONB(TypeDecorator):
         elif dialect.name == 'postgresql':
             return value
         else:
-            return json.dumps(value)
+            return json_dumps(value)
     
     def process_result_value(self, value, dialect):
         if value is None:
@@ -80,5 +126,29 @@ class JSONB(TypeDecorator):
             return value
         else:
             if isinstance(value, str):
-                return json.loads(value)
+                return json_loads(value)
+            return value
+
+
+class MoneyType(TypeDecorator):
+    """
+    Money stored as a BIGINT count of minor units (cents, paisa).
+    
+    Python sees Decimal amounts with two places; the database stores fixed-width
+    integers, so SUM/compare run on integer arithmetic.
+    """
+    impl = BigInteger
+    cache_ok = True
+    
+    CENTS = Decimal("0.01")
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        amount = value if isinstance(value, Decimal) else Decimal(str(value))
+        return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
             return value
+        return (Decimal(value) / 100).quantize(self.CENTS)
@@ -0,0 +1,5 @@
+-- Migration 007: Store lesson content as JSONB
+-- Lets PostgreSQL build lesson response bodies directly (see api/lessons.py)
+
+ALTER TABLE lessons
+    ALTER COLUMN content_json TYPE JSONB USING content_json::jsonb;
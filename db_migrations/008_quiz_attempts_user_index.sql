@@ -0,0 +1,8 @@
+-- Migration 008: Composite index for a user's quiz attempt history
+-- Backs GET /api/quizzes/my-attempts (WHERE user_id = ? ORDER BY submitted_at DESC LIMIT ?)
+
+CREATE INDEX IF NOT EXISTS ix_quiz_attempts_user_submitted
+    ON quiz_attempts (user_id, submitted_at DESC);
+
+-- Superseded by the composite index above
+DROP INDEX IF EXISTS ix_quiz_attempts_user_id;
@@ -0,0 +1,6 @@
+-- Migration 009: Reference quizzes from quiz_attempts
+-- NOT VALID skips the full-table check for existing rows; run VALIDATE CONSTRAINT off-peak
+
+ALTER TABLE quiz_attempts
+    ADD CONSTRAINT quiz_attempts_quiz_id_fkey
+    FOREIGN KEY (quiz_id) REFERENCES quizzes(quiz_id) ON DELETE CASCADE NOT VALID;
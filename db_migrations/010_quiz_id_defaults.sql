@@ -0,0 +1,11 @@
+-- Migration 010: Database-side id defaults for quizzes and quiz attempts
+-- Same 32-char hex form the application generates (config.uuid_type.generate_id),
+-- so rows written by SQL scripts or COPY can omit the id.
+
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+ALTER TABLE quizzes
+    ALTER COLUMN quiz_id SET DEFAULT replace(gen_random_uuid()::text, '-', '');
+
+ALTER TABLE quiz_attempts
+    ALTER COLUMN attempt_id SET DEFAULT replace(gen_random_uuid()::text, '-', '');
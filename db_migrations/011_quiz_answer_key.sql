@@ -0,0 +1,13 @@
+-- Migration 011: Denormalized answer key on quizzes
+-- Grading reads this small array instead of the full questions JSON
+
+ALTER TABLE quizzes ADD COLUMN IF NOT EXISTS answer_key JSON;
+
+UPDATE quizzes
+SET answer_key = (
+    SELECT COALESCE(json_agg(q.value -> 'correct_answer' ORDER BY q.ordinality), '[]'::json)
+    FROM json_array_elements(quizzes.questions) WITH ORDINALITY AS q(value, ordinality)
+)
+WHERE answer_key IS NULL;
+
+ALTER TABLE quizzes ALTER COLUMN answer_key SET NOT NULL;
@@ -0,0 +1,8 @@
+-- Migration 012: Add attempt_id to the attempt history index
+-- Backs keyset pagination on GET /api/quizzes/my-attempts
+-- (WHERE user_id = ? AND (submitted_at, attempt_id) < (?, ?) ORDER BY submitted_at DESC, attempt_id DESC)
+
+DROP INDEX IF EXISTS ix_quiz_attempts_user_submitted;
+
+CREATE INDEX IF NOT EXISTS ix_quiz_attempts_user_submitted
+    ON quiz_attempts (user_id, submitted_at DESC, attempt_id DESC);
@@ -0,0 +1,4 @@
+-- Migration 013: Drop the duplicate index on users.user_id
+-- users_pkey already indexes user_id; the extra B-tree only cost writes and cache space
+
+DROP INDEX IF EXISTS ix_users_user_id;
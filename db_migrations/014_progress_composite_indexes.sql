@@ -0,0 +1,29 @@
+-- Migration 014: Composite indexes for the progress and wallet history lookups
+-- Each replaces a single-column index scan plus filter with one range scan
+
+-- GET /api/japanese/srs/due-reviews and POST /vocabulary/{id}/review
+CREATE INDEX IF NOT EXISTS ix_vocab_progress_user_vocab
+    ON japanese_vocab_progress (user_id, vocab_id);
+CREATE INDEX IF NOT EXISTS ix_vocab_progress_user_next_review
+    ON japanese_vocab_progress (user_id, next_review_date)
+    WHERE is_mastered = false;
+CREATE INDEX IF NOT EXISTS ix_vocab_progress_user_mastered
+    ON japanese_vocab_progress (user_id, is_mastered);
+
+-- Superseded by the user_id-leading indexes above
+DROP INDEX IF EXISTS idx_japanese_vocab_progress_user;
+
+-- One progress row per user and kanji (fails if duplicates exist; dedupe those first)
+CREATE UNIQUE INDEX IF NOT EXISTS ux_kanji_progress_user_kanji
+    ON japanese_kanji_progress (user_id, kanji_id);
+
+CREATE INDEX IF NOT EXISTS ix_lesson_progress_enrollment_lesson
+    ON japanese_lesson_progress (enrollment_id, lesson_id);
+
+-- GET /api/coaching/wallet/transactions (WHERE wallet_id = ? ORDER BY created_at DESC)
+CREATE INDEX IF NOT EXISTS ix_wallet_transactions_wallet_created
+    ON wallet_transactions (wallet_id, created_at DESC);
+
+-- Superseded by the composite index above
+DROP INDEX IF EXISTS idx_wallet_transactions_wallet_id;
+DROP INDEX IF EXISTS ix_wallet_transactions_wallet_id;
@@ -0,0 +1,28 @@
+-- Migration 015: One row per Japanese quiz question
+-- japanese_quizzes.questions stays as a denormalized copy; this table serves paging
+-- (GET /api/japanese/quizzes/{id}/questions) and per-question analytics with plain indexes
+
+CREATE TABLE IF NOT EXISTS japanese_quiz_questions (
+    quiz_id UUID NOT NULL REFERENCES japanese_quizzes(quiz_id) ON DELETE CASCADE,
+    question_index INTEGER NOT NULL,
+    question_type VARCHAR(50),
+    prompt TEXT NOT NULL,
+    options JSONB,
+    correct_answer JSONB,
+    points INTEGER DEFAULT 1,
+    PRIMARY KEY (quiz_id, question_index)
+);
+
+-- Backfill from the existing question arrays (0-based index, matching array order)
+INSERT INTO japanese_quiz_questions (quiz_id, question_index, question_type, prompt, options, correct_answer, points)
+SELECT
+    q.quiz_id,
+    (item.ordinality - 1)::int,
+    item.value ->> 'type',
+    COALESCE(item.value ->> 'question', item.value ->> 'prompt', item.value ->> 'question_text', ''),
+    item.value -> 'options',
+    item.value -> 'correct_answer',
+    COALESCE((item.value ->> 'points')::int, 1)
+FROM japanese_quizzes q
+CROSS JOIN LATERAL jsonb_array_elements(q.questions) WITH ORDINALITY AS item(value, ordinality)
+ON CONFLICT (quiz_id, question_index) DO NOTHING;
@@ -0,0 +1,21 @@
+-- Migration 016: Native enums for wallet transaction types and coaching session statuses
+-- Fixed-width 4-byte values instead of varchar; indexes on these columns are rebuilt by the type change
+
+CREATE TYPE wallet_transaction_type AS ENUM ('topup', 'reserve', 'charge', 'refund', 'bonus');
+CREATE TYPE coaching_session_status AS ENUM ('reserved', 'active', 'completed', 'cancelled', 'refunded');
+
+ALTER TABLE wallet_transactions
+    ALTER COLUMN transaction_type TYPE wallet_transaction_type
+    USING transaction_type::wallet_transaction_type;
+
+ALTER TABLE voice_coaching_sessions ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE voice_coaching_sessions
+    ALTER COLUMN status TYPE coaching_session_status
+    USING status::coaching_session_status;
+ALTER TABLE voice_coaching_sessions ALTER COLUMN status SET DEFAULT 'reserved';
+
+ALTER TABLE video_sessions ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE video_sessions
+    ALTER COLUMN status TYPE coaching_session_status
+    USING status::coaching_session_status;
+ALTER TABLE video_sessions ALTER COLUMN status SET DEFAULT 'reserved';
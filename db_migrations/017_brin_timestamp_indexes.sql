@@ -0,0 +1,12 @@
+-- Migration 017: BRIN indexes on insert-only timestamp columns
+-- Rows are inserted in time order and never updated, so block ranges stay tightly correlated
+-- with the timestamp and a BRIN index serves range scans at a tiny fraction of a B-tree's size
+
+CREATE INDEX IF NOT EXISTS ix_wallet_transactions_created_brin
+    ON wallet_transactions USING brin (created_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_assessment_results_created_brin
+    ON assessment_results USING brin (created_at) WITH (pages_per_range = 32);
+
+-- Replaced by the BRIN index above (per-wallet history uses ix_wallet_transactions_wallet_created)
+DROP INDEX IF EXISTS idx_wallet_transactions_created_at;
+DROP INDEX IF EXISTS ix_wallet_transactions_created_at;
@@ -0,0 +1,37 @@
+-- Migration 018: Store money as BIGINT minor units (cents, paisa)
+-- Fixed-width integers instead of numeric; the application converts via config.uuid_type.MoneyType
+
+ALTER TABLE user_wallets ALTER COLUMN balance DROP DEFAULT;
+ALTER TABLE user_wallets ALTER COLUMN reserved_balance DROP DEFAULT;
+ALTER TABLE user_wallets
+    ALTER COLUMN balance TYPE BIGINT USING round(balance * 100)::bigint,
+    ALTER COLUMN reserved_balance TYPE BIGINT USING round(reserved_balance * 100)::bigint;
+ALTER TABLE user_wallets ALTER COLUMN balance SET DEFAULT 0;
+ALTER TABLE user_wallets ALTER COLUMN reserved_balance SET DEFAULT 0;
+
+ALTER TABLE wallet_transactions
+    ALTER COLUMN amount TYPE BIGINT USING round(amount * 100)::bigint,
+    ALTER COLUMN balance_before TYPE BIGINT USING round(balance_before * 100)::bigint,
+    ALTER COLUMN balance_after TYPE BIGINT USING round(balance_after * 100)::bigint;
+
+ALTER TABLE voice_coaching_sessions
+    ALTER COLUMN cost TYPE BIGINT USING round(cost * 100)::bigint;
+
+ALTER TABLE video_sessions
+    ALTER COLUMN cost TYPE BIGINT USING round(cost * 100)::bigint;
+
+ALTER TABLE japanese_courses
+    ALTER COLUMN price_self_paced TYPE BIGINT USING round(price_self_paced * 100)::bigint,
+    ALTER COLUMN price_interactive TYPE BIGINT USING round(price_interactive * 100)::bigint,
+    ALTER COLUMN price_premium TYPE BIGINT USING round(price_premium * 100)::bigint,
+    ALTER COLUMN price_vr TYPE BIGINT USING round(price_vr * 100)::bigint;
+
+ALTER TABLE aiml_courses
+    ALTER COLUMN price TYPE BIGINT USING round(price * 100)::bigint;
+
+ALTER TABLE aiml_learning_paths
+    ALTER COLUMN total_price TYPE BIGINT USING round(total_price * 100)::bigint;
+
+ALTER TABLE aiml_job_placements
+    ALTER COLUMN salary_jpy TYPE BIGINT USING round(salary_jpy * 100)::bigint,
+    ALTER COLUMN placement_fee TYPE BIGINT USING round(placement_fee * 100)::bigint;
@@ -0,0 +1,15 @@
+-- Migration 019: Covering index for SRS due reviews; drop unused wallet_transactions indexes
+
+-- GET /api/japanese/srs/due-reviews reads only these columns -> index-only scan
+DROP INDEX IF EXISTS ix_vocab_progress_user_next_review;
+CREATE INDEX IF NOT EXISTS ix_vocab_progress_user_next_review
+    ON japanese_vocab_progress (user_id, next_review_date)
+    INCLUDE (vocab_progress_id, vocab_id, srs_level, times_reviewed)
+    WHERE is_mastered = false;
+
+-- No query filters wallet_transactions by user_id alone, and transaction_type is only
+-- ever combined with wallet_id (served by ix_wallet_transactions_wallet_created)
+DROP INDEX IF EXISTS idx_wallet_transactions_user_id;
+DROP INDEX IF EXISTS ix_wallet_transactions_user_id;
+DROP INDEX IF EXISTS idx_wallet_transactions_type;
+DROP INDEX IF EXISTS ix_wallet_transactions_transaction_type;
@@ -0,0 +1,9 @@
+-- Migration 020: Unique kanji by INTEGER code point instead of CHAR(1)
+-- Equality and the unique index compare 4-byte integers, not collated text; character stays for display
+
+ALTER TABLE japanese_kanji ADD COLUMN IF NOT EXISTS character_cp INTEGER;
+UPDATE japanese_kanji SET character_cp = ascii(character) WHERE character_cp IS NULL;
+ALTER TABLE japanese_kanji ALTER COLUMN character_cp SET NOT NULL;
+
+ALTER TABLE japanese_kanji DROP CONSTRAINT IF EXISTS japanese_kanji_character_key;
+ALTER TABLE japanese_kanji ADD CONSTRAINT japanese_kanji_character_cp_key UNIQUE (character_cp);
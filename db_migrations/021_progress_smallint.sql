@@ -0,0 +1,18 @@
+-- Migration 021: SMALLINT for bounded SRS/kanji counters and levels
+-- Narrower rows on the per-user progress tables (and kanji reference data)
+
+ALTER TABLE japanese_vocab_progress
+    ALTER COLUMN times_reviewed TYPE SMALLINT,
+    ALTER COLUMN times_correct TYPE SMALLINT,
+    ALTER COLUMN times_incorrect TYPE SMALLINT,
+    ALTER COLUMN srs_level TYPE SMALLINT,
+    ALTER COLUMN difficulty_rating TYPE SMALLINT;
+
+ALTER TABLE japanese_kanji_progress
+    ALTER COLUMN recognition_level TYPE SMALLINT,
+    ALTER COLUMN writing_level TYPE SMALLINT,
+    ALTER COLUMN times_practiced TYPE SMALLINT;
+
+ALTER TABLE japanese_kanji
+    ALTER COLUMN stroke_count TYPE SMALLINT,
+    ALTER COLUMN frequency_rank TYPE SMALLINT;
@@ -3,9 +3,8 @@ AI Widget Database Models
 SQLAlchemy models for chat system
 """
 from sqlalchemy import Column, String, Text, Integer, Boolean, TIMESTAMP, ForeignKey, CheckConstraint
-from config.uuid_type import UUID
+from config.uuid_type import UUID, uuid7
 from sqlalchemy.sql import func
-import uuid
 
 from config.database import Base
 
@@ -14,7 +13,7 @@ class ChatConversationDB(Base):
     """Chat conversation sessions"""
     __tablename__ = "chat_conversations"
     
-    conversation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    conversation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey('users.user_id'), nullable=False)
     title = Column(String(255), nullable=True)
     language_code = Column(String(5), default='en')
@@ -30,7 +29,7 @@ class ChatMessageDB(Base):
     """Individual chat messages"""
     __tablename__ = "chat_messages"
     
-    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey('chat_conversations.conversation_id', ondelete='CASCADE'), nullable=False)
     role = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
@@ -46,7 +45,7 @@ class AIWidgetSessionDB(Base):
     """AI widget usage sessions for billing tracking"""
     __tablename__ = "ai_widget_sessions"
     
-    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey('users.user_id'), nullable=False)
     session_type = Column(String(20), nullable=False)
     message_count = Column(Integer, default=0)
@@ -3,9 +3,8 @@ AI/ML Training Database Models
 Level 1-5 courses, projects, and certifications
 """
 from sqlalchemy import Column, String, Integer, Boolean, DECIMAL, Text, TIMESTAMP, ForeignKey, Date
-from config.uuid_type import UUID, JSONB
+from config.uuid_type import UUID, JSONB, uuid7, MoneyType
 from sqlalchemy.sql import func
-import uuid
 
 from config.database import Base
 
@@ -13,12 +12,12 @@ from config.database import Base
 class AIMLCourseDB(Base):
     __tablename__ = "aiml_courses"
     
-    course_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    course_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     course_name = Column(String(255), nullable=False)
     level = Column(Integer, nullable=False)
     track = Column(String(50))
     duration_weeks = Column(Integer, nullable=False)
-    price = Column(DECIMAL(10, 2), nullable=False)
+    price = Column(MoneyType, nullable=False)
     description = Column(Text)
     prerequisites = Column(JSONB)
     syllabus_url = Column(String(500))
@@ -31,7 +30,7 @@ class AIMLCourseDB(Base):
 class AIMLLessonDB(Base):
     __tablename__ = "aiml_lessons"
     
-    lesson_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    lesson_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     course_id = Column(UUID(as_uuid=True), ForeignKey("aiml_courses.course_id", ondelete="CASCADE"))
     week_number = Column(Integer, nullable=False)
     lesson_number = Column(Integer, nullable=False)
@@ -50,7 +49,7 @@ class AIMLLessonDB(Base):
 class AIMLEnrollmentDB(Base):
     __tablename__ = "aiml_enrollments"
     
-    enrollment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    enrollment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     course_id = Column(UUID(as_uuid=True), ForeignKey("aiml_courses.course_id", ondelete="CASCADE"))
     enrolled_at = Column(TIMESTAMP, server_default=func.now())
@@ -65,7 +64,7 @@ class AIMLEnrollmentDB(Base):
 class AIMLLessonProgressDB(Base):
     __tablename__ = "aiml_lesson_progress"
     
-    progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     enrollment_id = Column(UUID(as_uuid=True), ForeignKey("aiml_enrollments.enrollment_id", ondelete="CASCADE"))
     lesson_id = Column(UUID(as_uuid=True), ForeignKey("aiml_lessons.lesson_id", ondelete="CASCADE"))
     started_at = Column(TIMESTAMP)
@@ -78,7 +77,7 @@ class AIMLLessonProgressDB(Base):
 class AIMLCodeSubmissionDB(Base):
     __tablename__ = "aiml_code_submissions"
     
-    submission_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    submission_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     lesson_id = Column(UUID(as_uuid=True), ForeignKey("aiml_lessons.lesson_id", ondelete="CASCADE"))
     code_content = Column(Text, nullable=False)
@@ -93,7 +92,7 @@ class AIMLCodeSubmissionDB(Base):
 class AIMLProjectDB(Base):
     __tablename__ = "aiml_projects"
     
-    project_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    project_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     course_id = Column(UUID(as_uuid=True), ForeignKey("aiml_courses.course_id", ondelete="CASCADE"))
     project_title = Column(String(255), nullable=False)
@@ -111,7 +110,7 @@ class AIMLProjectDB(Base):
 class AIMLCertificateDB(Base):
     __tablename__ = "aiml_certificates"
     
-    certificate_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    certificate_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     course_id = Column(UUID(as_uuid=True), ForeignKey("aiml_courses.course_id", ondelete="CASCADE"))
     certificate_type = Column(String(100), nullable=False)
@@ -126,12 +125,12 @@ class AIMLCertificateDB(Base):
 class AIMLLearningPathDB(Base):
     __tablename__ = "aiml_learning_paths"
     
-    path_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    path_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     path_name = Column(String(255), nullable=False)
     description = Column(Text)
     courses = Column(JSONB, nullable=False)
     total_duration_weeks = Column(Integer, nullable=False)
-    total_price = Column(DECIMAL(10, 2), nullable=False)
+    total_price = Column(MoneyType, nullable=False)
     job_placement_guarantee = Column(Boolean, default=False)
     guarantee_percentage = Column(Integer)
     is_active = Column(Boolean, default=True)
@@ -141,7 +140,7 @@ class AIMLLearningPathDB(Base):
 class AIMLPathEnrollmentDB(Base):
     __tablename__ = "aiml_path_enrollments"
     
-    path_enrollment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    path_enrollment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     path_id = Column(UUID(as_uuid=True), ForeignKey("aiml_learning_paths.path_id", ondelete="CASCADE"))
     enrolled_at = Column(TIMESTAMP, server_default=func.now())
@@ -154,7 +153,7 @@ class AIMLPathEnrollmentDB(Base):
 class AIMLLeaderboardDB(Base):
     __tablename__ = "aiml_leaderboard"
     
-    leaderboard_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    leaderboard_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, unique=True)
     total_xp = Column(Integer, default=0)
     badges_earned = Column(JSONB, default='[]')
@@ -166,13 +165,13 @@ class AIMLLeaderboardDB(Base):
 class AIMLJobPlacementDB(Base):
     __tablename__ = "aiml_job_placements"
     
-    placement_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    placement_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     company_name = Column(String(255), nullable=False)
     job_title = Column(String(255), nullable=False)
-    salary_jpy = Column(DECIMAL(12, 2))
+    salary_jpy = Column(MoneyType)
     placement_date = Column(Date, nullable=False)
-    placement_fee = Column(DECIMAL(10, 2))
+    placement_fee = Column(MoneyType)
     visa_status = Column(String(50))
     is_verified = Column(Boolean, default=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
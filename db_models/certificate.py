@@ -3,12 +3,13 @@ Database Model - Certificate
 """
 from sqlalchemy import Column, String, DateTime
 from config.database import Base
+from config.uuid_type import generate_id
 
 
 class CertificateDB(Base):
     __tablename__ = "certificates"
     
-    certificate_id = Column(String, primary_key=True)
+    certificate_id = Column(String, primary_key=True, default=generate_id)
     user_id = Column(String, nullable=False, index=True)
     lesson_id = Column(String, nullable=False, index=True)
     issued_at = Column(DateTime, nullable=False)
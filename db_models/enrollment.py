@@ -3,12 +3,13 @@ Database Model - Enrollment
 """
 from sqlalchemy import Column, String, DateTime
 from config.database import Base
+from config.uuid_type import generate_id
 
 
 class EnrollmentDB(Base):
     __tablename__ = "enrollments"
     
-    enrollment_id = Column(String, primary_key=True)
+    enrollment_id = Column(String, primary_key=True, default=generate_id)
     user_id = Column(String, nullable=False, index=True)
     lesson_id = Column(String, nullable=False, index=True)
     status = Column(String, nullable=False)
@@ -3,9 +3,8 @@ Multilingual Database Models
 SQLAlchemy models for i18n support
 """
 from sqlalchemy import Column, String, Text, Boolean, Integer, TIMESTAMP, ForeignKey, CheckConstraint
-from config.uuid_type import UUID
+from config.uuid_type import UUID, uuid7
 from sqlalchemy.sql import func
-import uuid
 
 from config.database import Base
 
@@ -14,7 +13,7 @@ class ContentTranslationDB(Base):
     """Content translations for multilingual support"""
     __tablename__ = "content_translations"
     
-    translation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    translation_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     content_type = Column(String(50), nullable=False)  # 'lesson', 'quiz', etc.
     content_id = Column(UUID(as_uuid=True), nullable=False)
     language_code = Column(String(5), nullable=False)
@@ -2,10 +2,12 @@
 Japanese Language Training Database Models
 N5-N1 JLPT preparation courses
 """
-from sqlalchemy import Column, String, Integer, Boolean, DECIMAL, Text, TIMESTAMP, ForeignKey, Date, CHAR
-from config.uuid_type import UUID, JSONB
+from sqlalchemy import Column, String, Integer, Boolean, DECIMAL, Text, TIMESTAMP, ForeignKey, Date, CHAR, Index, SmallInteger
+from sqlalchemy import event, delete, insert
+from sqlalchemy.orm.attributes import get_history
+from typing import List, Optional
+from config.uuid_type import UUID, JSONB, uuid7, MoneyType
 from sqlalchemy.sql import func
-import uuid
 
 from config.database import Base
 
@@ -13,15 +15,15 @@ from config.database import Base
 class JapaneseCourseDB(Base):
     __tablename__ = "japanese_courses"
     
-    course_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    course_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     level = Column(String(10), nullable=False)
     course_name = Column(String(255), nullable=False)
     jlpt_level_num = Column(Integer, nullable=False)
     duration_weeks = Column(Integer, nullable=False)
-    price_self_paced = Column(DECIMAL(10, 2), nullable=False)
-    price_interactive = Column(DECIMAL(10, 2))
-    price_premium = Column(DECIMAL(10, 2))
-    price_vr = Column(DECIMAL(10, 2))
+    price_self_paced = Column(MoneyType, nullable=False)
+    price_interactive = Column(MoneyType)
+    price_premium = Column(MoneyType)
+    price_vr = Column(MoneyType)
     description = Column(Text)
     prerequisites = Column(JSONB)
     learning_objectives = Column(JSONB)
@@ -36,7 +38,7 @@ class JapaneseCourseDB(Base):
 class JapaneseLessonDB(Base):
     __tablename__ = "japanese_lessons"
     
-    lesson_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    lesson_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     course_id = Column(UUID(as_uuid=True), ForeignKey("japanese_courses.course_id", ondelete="CASCADE"))
     week_number = Column(Integer, nullable=False)
     lesson_number = Column(Integer, nullable=False)
@@ -56,7 +58,7 @@ class JapaneseLessonDB(Base):
 class JapaneseVocabularyDB(Base):
     __tablename__ = "japanese_vocabulary"
     
-    vocab_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    vocab_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     word_hiragana = Column(String(100), nullable=False)
     word_kanji = Column(String(100))
     word_romaji = Column(String(100))
@@ -72,28 +74,35 @@ class JapaneseVocabularyDB(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
 
 
+def kanji_codepoint(context) -> int:
+    """Column default for character_cp: the code point of the row's character"""
+    return ord(context.get_current_parameters()["character"])
+
+
 class JapaneseKanjiDB(Base):
     __tablename__ = "japanese_kanji"
     
-    kanji_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    character = Column(CHAR(1), nullable=False, unique=True)
+    kanji_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    character = Column(CHAR(1), nullable=False)  # display only
+    # Uniqueness and lookups use the 4-byte code point rather than collated text
+    character_cp = Column(Integer, nullable=False, unique=True, default=kanji_codepoint)
     kunyomi = Column(String(100))
     onyomi = Column(String(100))
     english_meaning = Column(Text, nullable=False)
-    stroke_count = Column(Integer, nullable=False)
+    stroke_count = Column(SmallInteger, nullable=False)
     jlpt_level = Column(String(10))
     radical = Column(String(50))
     stroke_order_animation_url = Column(String(500))
     example_words = Column(JSONB)
     mnemonic = Column(Text)
-    frequency_rank = Column(Integer)
+    frequency_rank = Column(SmallInteger)
     created_at = Column(TIMESTAMP, server_default=func.now())
 
 
 class JapaneseGrammarDB(Base):
     __tablename__ = "japanese_grammar"
     
-    grammar_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    grammar_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     pattern_name = Column(String(255), nullable=False)
     pattern_structure = Column(Text, nullable=False)
     english_explanation = Column(Text, nullable=False)
@@ -109,7 +118,7 @@ class JapaneseGrammarDB(Base):
 class JapaneseEnrollmentDB(Base):
     __tablename__ = "japanese_enrollments"
     
-    enrollment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    enrollment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     course_id = Column(UUID(as_uuid=True), ForeignKey("japanese_courses.course_id", ondelete="CASCADE"))
     delivery_mode = Column(String(50), nullable=False)
@@ -127,7 +136,7 @@ class JapaneseEnrollmentDB(Base):
 class JapaneseLessonProgressDB(Base):
     __tablename__ = "japanese_lesson_progress"
     
-    progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     enrollment_id = Column(UUID(as_uuid=True), ForeignKey("japanese_enrollments.enrollment_id", ondelete="CASCADE"))
     lesson_id = Column(UUID(as_uuid=True), ForeignKey("japanese_lessons.lesson_id", ondelete="CASCADE"))
     started_at = Column(TIMESTAMP)
@@ -137,41 +146,66 @@ class JapaneseLessonProgressDB(Base):
     quiz_best_score = Column(DECIMAL(5, 2))
     mastery_level = Column(String(20))
     notes = Column(Text)
+    
+    __table_args__ = (
+        Index("ix_lesson_progress_enrollment_lesson", enrollment_id, lesson_id),
+    )
 
 
 class JapaneseVocabProgressDB(Base):
     __tablename__ = "japanese_vocab_progress"
     
-    vocab_progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    vocab_progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     vocab_id = Column(UUID(as_uuid=True), ForeignKey("japanese_vocabulary.vocab_id", ondelete="CASCADE"))
-    times_reviewed = Column(Integer, default=0)
-    times_correct = Column(Integer, default=0)
-    times_incorrect = Column(Integer, default=0)
-    srs_level = Column(Integer, default=1)
+    # Small bounded counters and levels: SMALLINT keeps these hot rows narrow
+    times_reviewed = Column(SmallInteger, default=0)
+    times_correct = Column(SmallInteger, default=0)
+    times_incorrect = Column(SmallInteger, default=0)
+    srs_level = Column(SmallInteger, default=1)
     next_review_date = Column(TIMESTAMP)
     last_reviewed_at = Column(TIMESTAMP)
     is_mastered = Column(Boolean, default=False)
-    difficulty_rating = Column(Integer)
+    difficulty_rating = Column(SmallInteger)
+    
+    __table_args__ = (
+        # Get-or-create on review
+        Index("ix_vocab_progress_user_vocab", user_id, vocab_id),
+        # Due reviews only ever look at words not yet mastered; INCLUDE covers the
+        # columns the review list returns so it is answered by an index-only scan
+        Index(
+            "ix_vocab_progress_user_next_review",
+            user_id,
+            next_review_date,
+            postgresql_where=is_mastered == False,
+            postgresql_include=["vocab_progress_id", "vocab_id", "srs_level", "times_reviewed"]
+        ),
+        # Mastered-word counts on the progress summary
+        Index("ix_vocab_progress_user_mastered", user_id, is_mastered),
+    )
 
 
 class JapaneseKanjiProgressDB(Base):
     __tablename__ = "japanese_kanji_progress"
     
-    kanji_progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kanji_progress_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     kanji_id = Column(UUID(as_uuid=True), ForeignKey("japanese_kanji.kanji_id", ondelete="CASCADE"))
-    recognition_level = Column(Integer, default=0)
-    writing_level = Column(Integer, default=0)
-    times_practiced = Column(Integer, default=0)
+    recognition_level = Column(SmallInteger, default=0)
+    writing_level = Column(SmallInteger, default=0)
+    times_practiced = Column(SmallInteger, default=0)
     last_practiced_at = Column(TIMESTAMP)
     is_mastered = Column(Boolean, default=False)
+    
+    __table_args__ = (
+        Index("ux_kanji_progress_user_kanji", user_id, kanji_id, unique=True),
+    )
 
 
 class JapaneseQuizDB(Base):
     __tablename__ = "japanese_quizzes"
     
-    quiz_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    quiz_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     lesson_id = Column(UUID(as_uuid=True), ForeignKey("japanese_lessons.lesson_id", ondelete="CASCADE"))
     quiz_title = Column(String(255), nullable=False)
     quiz_type = Column(String(50), nullable=False)
@@ -183,10 +217,55 @@ class JapaneseQuizDB(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
 
 
+class JapaneseQuizQuestionDB(Base):
+    """One row per quiz question, so questions can be paged and analysed without reading the whole JSONB blob"""
+    __tablename__ = "japanese_quiz_questions"
+    
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("japanese_quizzes.quiz_id", ondelete="CASCADE"), primary_key=True)
+    question_index = Column(Integer, primary_key=True)
+    question_type = Column(String(50))
+    prompt = Column(Text, nullable=False)
+    options = Column(JSONB)
+    correct_answer = Column(JSONB)
+    points = Column(Integer, default=1)
+
+
+def quiz_question_rows(quiz_id, questions: Optional[List[dict]]) -> List[dict]:
+    """japanese_quiz_questions rows for a quiz's questions array (same mapping as migration 015's backfill)"""
+    return [
+        {
+            "quiz_id": quiz_id,
+            "question_index": index,
+            "question_type": question.get("type"),
+            "prompt": question.get("question") or question.get("prompt") or question.get("question_text") or "",
+            "options": question.get("options"),
+            "correct_answer": question.get("correct_answer"),
+            "points": 1 if question.get("points") is None else int(question["points"])
+        }
+        for index, question in enumerate(questions or [])
+    ]
+
+
+@event.listens_for(JapaneseQuizDB, "after_insert")
+@event.listens_for(JapaneseQuizDB, "after_update")
+def sync_quiz_questions(mapper, connection, quiz):
+    """
+    Rewrite a quiz's japanese_quiz_questions rows whenever the quiz is written through the ORM
+    
+    Runs inside the flush, so the rows commit (or roll back) with the quiz itself.
+    """
+    if not get_history(quiz, "questions").has_changes():
+        return
+    connection.execute(delete(JapaneseQuizQuestionDB).where(JapaneseQuizQuestionDB.quiz_id == quiz.quiz_id))
+    rows = quiz_question_rows(quiz.quiz_id, quiz.questions)
+    if rows:
+        connection.execute(insert(JapaneseQuizQuestionDB), rows)
+
+
 class JapaneseQuizAttemptDB(Base):
     __tablename__ = "japanese_quiz_attempts"
     
-    attempt_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    attempt_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     enrollment_id = Column(UUID(as_uuid=True), ForeignKey("japanese_enrollments.enrollment_id", ondelete="CASCADE"))
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("japanese_quizzes.quiz_id", ondelete="CASCADE"))
     started_at = Column(TIMESTAMP, server_default=func.now())
@@ -202,7 +281,7 @@ class JapaneseQuizAttemptDB(Base):
 class JapaneseMockTestDB(Base):
     __tablename__ = "japanese_mock_tests"
     
-    mock_test_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    mock_test_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     jlpt_level = Column(String(10), nullable=False)
     test_name = Column(String(255), nullable=False)
     sections = Column(JSONB, nullable=False)
@@ -216,7 +295,7 @@ class JapaneseMockTestDB(Base):
 class JapaneseMockTestAttemptDB(Base):
     __tablename__ = "japanese_mock_test_attempts"
     
-    attempt_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    attempt_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     mock_test_id = Column(UUID(as_uuid=True), ForeignKey("japanese_mock_tests.mock_test_id", ondelete="CASCADE"))
     started_at = Column(TIMESTAMP, server_default=func.now())
@@ -234,7 +313,7 @@ class JapaneseMockTestAttemptDB(Base):
 class JapaneseSpeakingPracticeDB(Base):
     __tablename__ = "japanese_speaking_practice"
     
-    practice_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    practice_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     lesson_id = Column(UUID(as_uuid=True), ForeignKey("japanese_lessons.lesson_id"))
     prompt_text = Column(Text, nullable=False)
@@ -250,7 +329,7 @@ class JapaneseSpeakingPracticeDB(Base):
 class JapaneseWritingPracticeDB(Base):
     __tablename__ = "japanese_writing_practice"
     
-    writing_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    writing_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     lesson_id = Column(UUID(as_uuid=True), ForeignKey("japanese_lessons.lesson_id"))
     prompt_text = Column(Text, nullable=False)
@@ -267,7 +346,7 @@ class JapaneseWritingPracticeDB(Base):
 class JapaneseCertificateDB(Base):
     __tablename__ = "japanese_certificates"
     
-    certificate_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    certificate_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     course_id = Column(UUID(as_uuid=True), ForeignKey("japanese_courses.course_id", ondelete="CASCADE"))
     jlpt_level = Column(String(10), nullable=False)
@@ -283,7 +362,7 @@ class JapaneseCertificateDB(Base):
 class JapaneseStudyStreakDB(Base):
     __tablename__ = "japanese_study_streaks"
     
-    streak_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    streak_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     current_streak_days = Column(Integer, default=0)
     longest_streak_days = Column(Integer, default=0)
@@ -296,7 +375,7 @@ class JapaneseStudyStreakDB(Base):
 class JapaneseAchievementDB(Base):
     __tablename__ = "japanese_achievements"
     
-    achievement_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    achievement_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     achievement_type = Column(String(100), nullable=False)
     achievement_name = Column(String(255), nullable=False)
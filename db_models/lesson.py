@@ -1,16 +1,17 @@
 ﻿"""
 Database Model - Lesson
 """
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime
 from config.database import Base
+from config.uuid_type import generate_id, JSONB
 
 
 class LessonDB(Base):
     __tablename__ = "lessons"
     
-    lesson_id = Column(String, primary_key=True, index=True)
+    lesson_id = Column(String, primary_key=True, default=generate_id, index=True)
     level = Column(String, nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(String)
-    content_json = Column(JSON)
+    content_json = Column(JSONB)
     created_at = Column(DateTime, nullable=False)
@@ -3,12 +3,13 @@ Database Model - Payment
 """
 from sqlalchemy import Column, String, DateTime, Float
 from config.database import Base
+from config.uuid_type import generate_id
 
 
 class PaymentDB(Base):
     __tablename__ = "payments"
     
-    payment_id = Column(String, primary_key=True)
+    payment_id = Column(String, primary_key=True, default=generate_id)
     user_id = Column(String, nullable=False, index=True)
     payment_intent_id = Column(String, nullable=False)
     amount = Column(Float, nullable=False)
@@ -3,12 +3,13 @@ Database Model - Progress
 """
 from sqlalchemy import Column, String, DateTime, Integer
 from config.database import Base
+from config.uuid_type import generate_id
 
 
 class ProgressDB(Base):
     __tablename__ = "progress"
     
-    progress_id = Column(String, primary_key=True)
+    progress_id = Column(String, primary_key=True, default=generate_id)
     user_id = Column(String, nullable=False, index=True)
     lesson_id = Column(String, nullable=False, index=True)
     completed_percentage = Column(Integer, nullable=False)
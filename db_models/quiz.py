@@ -1,28 +1,42 @@
 ﻿"""
 Database Model - Quiz
 """
-from sqlalchemy import Column, String, DateTime, JSON, Integer
+from sqlalchemy import Column, String, DateTime, JSON, Integer, Index, ForeignKey
+from sqlalchemy.orm import relationship
 from config.database import Base
+from config.uuid_type import generate_id
 
 
 class QuizDB(Base):
     __tablename__ = "quizzes"
     
-    quiz_id = Column(String, primary_key=True)
+    quiz_id = Column(String, primary_key=True, default=generate_id)
     lesson_id = Column(String, nullable=False, index=True)
     title = Column(String, nullable=False)
     questions = Column(JSON, nullable=False)
+    # correct_answer of each question, in order; grading reads only this
+    answer_key = Column(JSON, nullable=False)
     created_at = Column(DateTime, nullable=False)
+    
+    # lazy="raise": load explicitly (e.g. selectinload) where attempts are needed
+    attempts = relationship("QuizAttemptDB", back_populates="quiz", lazy="raise", passive_deletes=True)
 
 
 class QuizAttemptDB(Base):
     __tablename__ = "quiz_attempts"
     
-    attempt_id = Column(String, primary_key=True)
-    quiz_id = Column(String, nullable=False, index=True)
-    user_id = Column(String, nullable=False, index=True)
+    attempt_id = Column(String, primary_key=True, default=generate_id)
+    quiz_id = Column(String, ForeignKey("quizzes.quiz_id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(String, nullable=False)
     answers = Column(JSON, nullable=False)
     score = Column(Integer, nullable=False)
     total_questions = Column(Integer, nullable=False)
     correct_answers = Column(Integer, nullable=False)
     submitted_at = Column(DateTime, nullable=False)
+    
+    quiz = relationship("QuizDB", back_populates="attempts", lazy="raise")
+    
+    __table_args__ = (
+        # Backs the "my attempts, newest first" listing
+        Index("ix_quiz_attempts_user_submitted", user_id, submitted_at.desc(), attempt_id.desc()),
+    )
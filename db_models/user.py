@@ -4,6 +4,7 @@ SQLAlchemy models for database tables
 """
 from sqlalchemy import Column, String, DateTime, Enum, Boolean
 from config.database import Base
+from config.uuid_type import generate_id
 import enum
 
 class UserRole(str, enum.Enum):
@@ -13,7 +14,8 @@ class UserRole(str, enum.Enum):
 class UserDB(Base):
     __tablename__ = "users"
     
-    user_id = Column(String, primary_key=True, index=True)
+    # The primary key index already covers lookups and FK probes; no separate index
+    user_id = Column(String, primary_key=True, default=generate_id)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     role = Column(Enum(UserRole), nullable=False, default=UserRole.student)
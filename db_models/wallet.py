@@ -2,11 +2,10 @@
 Database Models - Wallet System
 SQLAlchemy models for wallet, transactions, and coaching sessions
 """
-from sqlalchemy import Column, String, Integer, DECIMAL, Text, TIMESTAMP, ForeignKey
-from config.uuid_type import UUID, JSONB
+from sqlalchemy import Column, String, Integer, DECIMAL, Text, TIMESTAMP, ForeignKey, Index, Enum
+from config.uuid_type import UUID, JSONB, uuid7, MoneyType
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 
 from config.database import Base
@@ -37,53 +36,85 @@ class SessionStatus(str, enum.Enum):
     refunded = "refunded"
 
 
+# Statuses in which a session still accepts messages/answers and can be ended (status
+# columns read back as plain strings, so this holds the values)
+OPEN_SESSION_STATUSES = frozenset({SessionStatus.reserved.value, SessionStatus.active.value})
+
+
+# Native PostgreSQL enums (4 bytes per row instead of a varchar). Built from the values
+# so columns keep reading back as plain strings; non-PostgreSQL databases use VARCHAR.
+TransactionTypeEnum = Enum(*[t.value for t in TransactionType], name="wallet_transaction_type")
+SessionStatusEnum = Enum(*[s.value for s in SessionStatus], name="coaching_session_status")
+
+
 class UserWallet(Base):
     """User wallet model"""
     __tablename__ = "user_wallets"
     
-    wallet_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    wallet_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), nullable=False, unique=True, index=True)
-    balance = Column(DECIMAL(10, 2), nullable=False, default=0.00)
-    reserved_balance = Column(DECIMAL(10, 2), nullable=False, default=0.00)
+    balance = Column(MoneyType, nullable=False, default=0.00)
+    reserved_balance = Column(MoneyType, nullable=False, default=0.00)
     currency = Column(String(3), nullable=False, default="NPR")
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
     
     # Relationships
-    transactions = relationship("WalletTransaction", back_populates="wallet", cascade="all, delete-orphan")
+    # lazy="raise": load explicitly, e.g. selectinload(UserWallet.transactions), where needed;
+    # passive_deletes leaves removing transactions to the ON DELETE CASCADE foreign key
+    transactions = relationship(
+        "WalletTransaction",
+        back_populates="wallet",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
+    )
 
 
 class WalletTransaction(Base):
     """Wallet transaction model"""
     __tablename__ = "wallet_transactions"
     
-    transaction_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    wallet_id = Column(UUID(as_uuid=True), ForeignKey("user_wallets.wallet_id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(String(255), nullable=False, index=True)
-    transaction_type = Column(String(50), nullable=False, index=True)
-    amount = Column(DECIMAL(10, 2), nullable=False)
-    balance_before = Column(DECIMAL(10, 2), nullable=False)
-    balance_after = Column(DECIMAL(10, 2), nullable=False)
+    transaction_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    wallet_id = Column(UUID(as_uuid=True), ForeignKey("user_wallets.wallet_id", ondelete="CASCADE"), nullable=False)
+    # History is read per wallet; user_id and the 5-value type need no indexes of their own
+    user_id = Column(String(255), nullable=False)
+    transaction_type = Column(TransactionTypeEnum, nullable=False)
+    amount = Column(MoneyType, nullable=False)
+    balance_before = Column(MoneyType, nullable=False)
+    balance_after = Column(MoneyType, nullable=False)
     session_id = Column(UUID(as_uuid=True))  # Can reference voice or video sessions
     payment_method_id = Column(String(255))  # For topup transactions
     description = Column(Text)
     transaction_metadata = Column("metadata", JSONB)  # Column name is 'metadata' in DB
-    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
     
     # Relationships
-    wallet = relationship("UserWallet", back_populates="transactions")
+    wallet = relationship("UserWallet", back_populates="transactions", lazy="raise")
+    
+    __table_args__ = (
+        # Paginated transaction history (also serves plain wallet_id lookups)
+        Index("ix_wallet_transactions_wallet_created", wallet_id, created_at.desc()),
+        # Never updated, so rows stay physically in created_at order: a BRIN index is tiny
+        Index(
+            "ix_wallet_transactions_created_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
 
 
 class VoiceCoachingSession(Base):
     """Voice coaching session model"""
     __tablename__ = "voice_coaching_sessions"
     
-    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), nullable=False, index=True)
     mode = Column(String(50), nullable=False)
     duration_minutes = Column(Integer, nullable=False)
-    cost = Column(DECIMAL(10, 2), nullable=False)
-    status = Column(String(50), nullable=False, default="reserved", index=True)
+    cost = Column(MoneyType, nullable=False)
+    status = Column(SessionStatusEnum, nullable=False, default="reserved", index=True)
     reserved_at = Column(TIMESTAMP)
     started_at = Column(TIMESTAMP)
     completed_at = Column(TIMESTAMP)
@@ -97,11 +128,11 @@ class VideoSession(Base):
     """Video session model"""
     __tablename__ = "video_sessions"
     
-    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), nullable=False, index=True)
     duration_minutes = Column(Integer, nullable=False)
-    cost = Column(DECIMAL(10, 2), nullable=False)
-    status = Column(String(50), nullable=False, default="reserved", index=True)
+    cost = Column(MoneyType, nullable=False)
+    status = Column(SessionStatusEnum, nullable=False, default="reserved", index=True)
     reserved_at = Column(TIMESTAMP)
     started_at = Column(TIMESTAMP)
     completed_at = Column(TIMESTAMP)
@@ -115,7 +146,7 @@ class AssessmentResult(Base):
     """Assessment result model"""
     __tablename__ = "assessment_results"
     
-    assessment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    assessment_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(255), nullable=False, index=True)
     session_id = Column(UUID(as_uuid=True), ForeignKey("voice_coaching_sessions.session_id", ondelete="SET NULL"), index=True)
     assessment_type = Column(String(50), nullable=False, index=True)
@@ -123,4 +154,14 @@ class AssessmentResult(Base):
     feedback = Column(Text)
     details = Column(JSONB)
     created_at = Column(TIMESTAMP, server_default=func.now())
+    
+    __table_args__ = (
+        # Insert-only like wallet_transactions
+        Index(
+            "ix_assessment_results_created_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
 
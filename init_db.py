@@ -1,8 +1,18 @@
 ﻿"""
 Initialize Database Tables
-Creates all tables in PostgreSQL database
+Creates all tables in PostgreSQL database and bulk-loads seed data
 """
-from config.database import Base, engine
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, List
+
+from sqlalchemy import Enum, Table, insert, inspect
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from config.database import Base, engine, SessionLocal
 from db_models.user import UserDB
 from db_models.lesson import LessonDB
 from db_models.progress import ProgressDB
@@ -10,14 +20,152 @@ from db_models.payment import PaymentDB
 from db_models.enrollment import EnrollmentDB
 from db_models.quiz import QuizDB, QuizAttemptDB
 from db_models.certificate import CertificateDB
+from db_models.japanese_training import JapaneseVocabularyDB, JapaneseKanjiDB
+
+SEED_BATCH_SIZE = 10_000
+DDL_WORKERS = 8  # well under the engine's pool_size
 
 
 def init_db():
-    """Create all database tables"""
+    """Create any database tables that do not exist yet"""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("✓ All tables created successfully!")
+    # One catalog query up front instead of a has_table round trip per model;
+    # on an up-to-date database nothing else is sent
+    existing = set(inspect(engine).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        create_tables(missing)
+    print(f"✓ {len(missing)} tables created, {len(existing)} already present")
+
+
+def dependency_levels(tables: List[Table]) -> List[List[Table]]:
+    """
+    Group tables so each group only references tables in earlier groups (or already existing ones)
+    
+    Tables within a group have no foreign keys between them and can be created concurrently.
+    Tables in a foreign key cycle are left out of every group.
+    """
+    pending = set(tables)
+    levels = []
+    while pending:
+        level = [
+            table for table in tables
+            if table in pending and not any(
+                fk.referred_table in pending and fk.referred_table is not table
+                for fk in table.foreign_key_constraints
+            )
+        ]
+        if not level:
+            # Foreign key cycle: the rest is left to create_tables to create sequentially
+            break
+        levels.append(level)
+        pending.difference_update(level)
+    return levels
+
+
+def create_tables(tables: List[Table]) -> None:
+    """
+    Create tables, issuing independent CREATE TABLEs concurrently on PostgreSQL
+    
+    Other backends (e.g. SQLite, which locks the whole file for DDL) create them sequentially.
+    """
+    if engine.dialect.name != "postgresql":
+        Base.metadata.create_all(bind=engine, tables=tables)
+        return
+    
+    # Native enum types are shared between tables; create them first so
+    # concurrent CREATE TABLEs don't race to create the same type
+    enums = {}
+    for table in tables:
+        for column in table.columns:
+            if isinstance(column.type, Enum) and column.type.native_enum:
+                enums[column.type.name] = column.type
+    with engine.begin() as connection:
+        for enum in enums.values():
+            enum.create(connection, checkfirst=True)
+    
+    levels = dependency_levels(tables)
+    with ThreadPoolExecutor(max_workers=DDL_WORKERS) as pool:
+        for level in levels:
+            list(pool.map(create_table, level))
+    
+    # Tables in a foreign key cycle: create_all orders them and defers the cyclic constraints
+    created = {table for level in levels for table in level}
+    remaining = [table for table in tables if table not in created]
+    if remaining:
+        Base.metadata.create_all(bind=engine, tables=remaining)
+
+
+def create_table(table: Table) -> None:
+    """
+    Emit CREATE TABLE and its CREATE INDEXes without existence checks
+    
+    init_db already knows the table is missing, and CreateTable (unlike table.create)
+    does not fire CREATE TYPE for the enums create_tables made up front.
+    """
+    with engine.begin() as connection:
+        connection.execute(CreateTable(table))
+        for index in table.indexes:
+            connection.execute(CreateIndex(index))
+
+
+def seed_rows(model, rows: Iterable[dict], batch_size: int = SEED_BATCH_SIZE) -> int:
+    """
+    Insert seed rows in batches of batch_size (one executemany per batch)
+    
+    Rows are consumed lazily, so large generators are never fully in memory.
+    On PostgreSQL rows whose key already exists are skipped, so reseeding is safe.
+    
+    Prefer this (a Core insert with a list of dicts) over session.add /
+    bulk_save_objects for bulk loads: psycopg2 sends each batch as multi-row
+    VALUES pages (see executemany_mode in config/database.py).
+    
+    Returns:
+        Number of rows sent to the database
+    """
+    if engine.dialect.name == "postgresql":
+        statement = pg_insert(model).on_conflict_do_nothing()
+    else:
+        statement = insert(model)
+    
+    rows = iter(rows)
+    total = 0
+    db = SessionLocal()
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            db.execute(statement, batch)
+            db.commit()
+            total += len(batch)
+    finally:
+        db.close()
+    
+    return total
+
+
+def seed_vocabulary(rows: Iterable[dict]) -> int:
+    """Bulk-load JLPT vocabulary (dicts keyed by JapaneseVocabularyDB column names)"""
+    return seed_rows(JapaneseVocabularyDB, rows)
+
+
+def seed_kanji(rows: Iterable[dict]) -> int:
+    """Bulk-load JLPT kanji (dicts keyed by JapaneseKanjiDB column names)"""
+    return seed_rows(JapaneseKanjiDB, rows)
+
+
+def seed_from_file(model, path: str) -> int:
+    """Bulk-load a JSON file containing a list of row dicts"""
+    with open(path, encoding="utf-8") as f:
+        return seed_rows(model, json.load(f))
 
 
 if __name__ == "__main__":
     init_db()
+    
+    # Optional: python init_db.py <vocabulary.json> [<kanji.json>]
+    if len(sys.argv) > 1:
+        print(f"✓ Seeded {seed_from_file(JapaneseVocabularyDB, sys.argv[1])} vocabulary rows")
+    if len(sys.argv) > 2:
+        print(f"✓ Seeded {seed_from_file(JapaneseKanjiDB, sys.argv[2])} kanji rows")
@@ -3,20 +3,23 @@ List all coaching system endpoints
 """
 from main import app
 
-print("\nCoaching System Endpoints:")
-print("=" * 60)
-coaching_routes = []
-for route in app.routes:
-    if hasattr(route, 'path') and '/coaching' in route.path:
-        methods = ', '.join(route.methods) if hasattr(route, 'methods') else 'N/A'
-        coaching_routes.append((methods, route.path))
+# Sorted by path; importers reuse it without rescanning app.routes
+COACHING_ROUTES = tuple(sorted(
+    (
+        ', '.join(sorted(route.methods)) if getattr(route, 'methods', None) else 'N/A',
+        route.path
+    )
+    for route in app.routes
+    if '/coaching' in getattr(route, 'path', '')
+), key=lambda x: x[1])
 
-# Sort by path
-coaching_routes.sort(key=lambda x: x[1])
-
-for methods, path in coaching_routes:
-    print(f"  {methods:20} {path}")
-
-print(f"\nTotal coaching endpoints: {len(coaching_routes)}")
-print("=" * 60)
 
+if __name__ == "__main__":
+    print("\nCoaching System Endpoints:")
+    print("=" * 60)
+    
+    for methods, path in COACHING_ROUTES:
+        print(f"  {methods:20} {path}")
+    
+    print(f"\nTotal coaching endpoints: {len(COACHING_ROUTES)}")
+    print("=" * 60)
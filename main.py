@@ -1,4 +1,6 @@
+import anyio
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 from api.auth import router as auth_router
 from api.lessons import router as lessons_router
@@ -16,6 +18,9 @@ from api.coaching.wallet import router as wallet_router
 from api.coaching.voice_coach import router as voice_coach_router
 from api.coaching.video import router as video_router
 from api.coaching.assessment import router as assessment_router
+from config.stripe_config import configure_stripe
+from config.openai_config import close_openai_client
+from config.database import engine, warm_pool
 
 app = FastAPI(
     title="XploraKodo API",
@@ -74,6 +79,21 @@ app.include_router(voice_coach_router)
 app.include_router(video_router)
 app.include_router(assessment_router)
 
+@app.on_event("startup")
+async def startup():
+    """Initialise shared clients and open database connections once per worker"""
+    # Sync (def) handlers run in anyio's worker threads; the default of 40 is too low
+    # for blocking DB calls under load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    configure_stripe()
+    await run_in_threadpool(warm_pool)
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close pooled database and OpenAI connections"""
+    engine.dispose()
+    await close_openai_client()
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
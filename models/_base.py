@@ -0,0 +1,12 @@
+﻿"""
+Shared Model Bases
+Common Pydantic base classes for response schemas
+"""
+from pydantic import BaseModel
+
+
+class ORMModel(BaseModel):
+    """Response schema that can be built straight from a database row"""
+    
+    class Config:
+        orm_mode = True
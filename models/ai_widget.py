@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 
+from models._base import ORMModel
+from models.i18n import LanguageCode
+
 
 class ChatMessageCreate(BaseModel):
     """Create a new chat message"""
@@ -13,7 +16,7 @@ class ChatMessageCreate(BaseModel):
     audio_url: Optional[str] = None
 
 
-class ChatMessageResponse(BaseModel):
+class ChatMessageResponse(ORMModel):
     """Chat message response"""
     message_id: str
     conversation_id: str
@@ -21,18 +24,15 @@ class ChatMessageResponse(BaseModel):
     content: str
     audio_url: Optional[str] = None
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class ChatConversationCreate(BaseModel):
     """Create a new chat conversation"""
     title: Optional[str] = None
-    language_code: str = Field(default="en", regex="^(ne|en|ja)$")
+    language_code: LanguageCode = "en"
 
 
-class ChatConversationResponse(BaseModel):
+class ChatConversationResponse(ORMModel):
     """Chat conversation response"""
     conversation_id: str
     user_id: str
@@ -40,9 +40,6 @@ class ChatConversationResponse(BaseModel):
     language_code: str
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class ChatConversationWithMessages(BaseModel):
@@ -75,7 +72,7 @@ class AIWidgetSessionCreate(BaseModel):
     session_type: str = Field(..., regex="^(text|voice|avatar)$")
 
 
-class AIWidgetSessionResponse(BaseModel):
+class AIWidgetSessionResponse(ORMModel):
     """AI widget session response"""
     session_id: str
     session_type: str
@@ -84,16 +81,13 @@ class AIWidgetSessionResponse(BaseModel):
     cost_tokens: int
     started_at: datetime
     ended_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
 
 
 class ChatRequest(BaseModel):
     """Request for AI chat"""
     conversation_id: Optional[str] = None
     message: str = Field(..., min_length=1, max_length=5000)
-    language: Optional[str] = Field(default=None, regex="^(ne|en|ja)$")
+    language: Optional[LanguageCode] = None
     use_voice: bool = False
     use_avatar: bool = False
 
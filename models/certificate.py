@@ -2,21 +2,21 @@
 Certificate Model
 Pydantic models for certificate data
 """
-from pydantic import BaseModel
+from dataclasses import dataclass
 from datetime import datetime
 
+from models._base import ORMModel
 
-class CertificateResponse(BaseModel):
+
+class CertificateResponse(ORMModel):
     certificate_id: str
     user_id: str
     lesson_id: str
     issued_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class CertificateRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CertificateRecord:
     certificate_id: str
     user_id: str
     lesson_id: str
@@ -2,27 +2,27 @@
 Enrollment Models (Pydantic)
 Request/Response schemas for API
 """
+from dataclasses import dataclass
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+
+from models._base import ORMModel
 
 
 class EnrollmentCreate(BaseModel):
     lesson_id: str
 
 
-class EnrollmentResponse(BaseModel):
+class EnrollmentResponse(ORMModel):
     enrollment_id: str
     user_id: str
     lesson_id: str
     status: str
     enrolled_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class EnrollmentRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class EnrollmentRecord:
     enrollment_id: str
     user_id: str
     lesson_id: str
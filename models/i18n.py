@@ -3,27 +3,29 @@ Internationalization (i18n) Models
 Request/Response schemas for multilingual API
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Optional, Dict, Literal
 from datetime import datetime
 
+from models._base import ORMModel
 
-class LanguageInfo(BaseModel):
+# Supported languages; a Literal is a plain set-membership check rather than a regex match
+LanguageCode = Literal["ne", "en", "ja"]
+
+
+class LanguageInfo(ORMModel):
     """Language information"""
-    language_code: str = Field(..., regex="^(ne|en|ja)$")
+    language_code: LanguageCode
     language_name_en: str
     language_name_native: str
     is_active: bool = True
     display_order: int = 0
-    
-    class Config:
-        from_attributes = True
 
 
 class TranslationCreate(BaseModel):
     """Create a new translation"""
     content_type: str = Field(..., max_length=50)
     content_id: str
-    language_code: str = Field(..., regex="^(ne|en|ja)$")
+    language_code: LanguageCode
     translated_text: str
     audio_url: Optional[str] = None
 
@@ -34,7 +36,7 @@ class TranslationUpdate(BaseModel):
     audio_url: Optional[str] = None
 
 
-class TranslationResponse(BaseModel):
+class TranslationResponse(ORMModel):
     """Translation response"""
     translation_id: str
     content_type: str
@@ -44,9 +46,6 @@ class TranslationResponse(BaseModel):
     audio_url: Optional[str] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class ContentTranslations(BaseModel):
@@ -58,7 +57,7 @@ class ContentTranslations(BaseModel):
 
 class UserLanguagePreference(BaseModel):
     """User's language preference"""
-    preferred_language: str = Field(..., regex="^(ne|en|ja)$")
+    preferred_language: LanguageCode
 
 
 class MultilingualContent(BaseModel):
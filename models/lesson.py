@@ -2,22 +2,20 @@
 Lesson Model
 Pydantic models for lesson data
 """
-from pydantic import BaseModel, validator
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Optional, List, Literal
 from datetime import datetime
 
+from models._base import ORMModel
+
+JLPTLevel = Literal["N5", "N4", "N3", "N2", "N1"]
+
 
 class LessonBase(BaseModel):
-    level: str
+    level: JLPTLevel
     title: str
     description: Optional[str] = None
-    content_json: Dict[str, Any] = {}
-    
-    @validator("level")
-    def validate_level(cls, v):
-        if v not in ["N5", "N4", "N3", "N2", "N1"]:
-            raise ValueError("Level must be N5, N4, N3, N2, or N1")
-        return v
+    content_json: dict = {}  # free-form; a plain dict skips per-key validation
 
 
 class LessonCreate(LessonBase):
@@ -28,14 +26,20 @@ class LessonUpdate(LessonBase):
     pass
 
 
-class LessonResponse(LessonBase):
+class LessonResponse(LessonBase, ORMModel):
     lesson_id: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class LessonInDB(LessonBase):
-    lesson_id: str
-    created_at: datetime
+class LessonBatchRequest(BaseModel):
+    """Lesson IDs to load in one request (e.g. for a course overview page)"""
+    lesson_ids: List[str] = Field(..., min_items=1, max_items=200)
+
+
+class LessonBulkResponse(BaseModel):
+    created: int
+    lesson_ids: List[str]
+
+
+# Same fields as LessonResponse; one class means one validator built at import
+LessonInDB = LessonResponse
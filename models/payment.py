@@ -2,9 +2,11 @@
 Payment Models (Pydantic)
 Request/Response schemas for API
 """
+from dataclasses import dataclass
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+
+from models._base import ORMModel
 
 
 class PaymentIntentCreate(BaseModel):
@@ -21,19 +23,17 @@ class PaymentIntentResponse(BaseModel):
     status: str
 
 
-class PaymentHistoryResponse(BaseModel):
+class PaymentHistoryResponse(ORMModel):
     payment_id: str
     payment_intent_id: str
     amount: float
     currency: str
     status: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class PaymentRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PaymentRecord:
     payment_id: str
     user_id: str
     payment_intent_id: str
@@ -2,10 +2,13 @@
 Progress Models (Pydantic)
 Request/Response schemas for API
 """
+from dataclasses import dataclass
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 
+from models._base import ORMModel
+
 
 class ProgressCreate(BaseModel):
     lesson_id: str
@@ -18,22 +21,20 @@ class ProgressUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class ProgressResponse(BaseModel):
+class ProgressResponse(ORMModel):
     progress_id: str
     user_id: str
     lesson_id: str
     completed_percentage: int
     notes: Optional[str] = None
     last_updated: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class ProgressRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ProgressRecord:
     progress_id: str
     user_id: str
     lesson_id: str
     completed_percentage: int
-    notes: Optional[str] = None
     last_updated: datetime
+    notes: Optional[str] = None
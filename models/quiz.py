@@ -2,12 +2,21 @@
 Quiz Models (Pydantic)
 Request/Response schemas for API
 """
-from pydantic import BaseModel
+from dataclasses import dataclass
+from pydantic import BaseModel, conlist, constr, validator
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union, TypedDict
 
+from models._base import ORMModel
 
-class QuizQuestion(BaseModel):
+MAX_QUIZ_ANSWERS = 200
+MAX_ANSWER_LENGTH = 64
+
+Answer = constr(max_length=MAX_ANSWER_LENGTH)
+
+
+class QuizQuestion(TypedDict):
+    """Shape of one entry in a quiz's questions list (a plain dict; no model built per question)"""
     id: str
     question: str
     options: List[str]
@@ -17,37 +26,53 @@ class QuizQuestion(BaseModel):
 class QuizCreate(BaseModel):
     lesson_id: str
     title: str
-    questions: List[Dict[str, Any]]
+    questions: List[dict]  # shaped like QuizQuestion; plain dicts skip per-key validation
 
 
-class QuizResponse(BaseModel):
+class QuizResponse(ORMModel):
+    quiz_id: str
+    lesson_id: str
+    title: str
+    questions: List[dict]
+    created_at: datetime
+
+
+class QuizSummaryResponse(ORMModel):
+    """Quiz listing entry without the (potentially large) questions payload"""
     quiz_id: str
     lesson_id: str
     title: str
-    questions: List[Dict[str, Any]]
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class QuizSubmission(BaseModel):
-    answers: Dict[str, str]
+    """
+    Submitted answers, either index-ordered (["A", "C"]) or keyed by index ({"0": "A"})
+    
+    Sizes are capped so oversized payloads are rejected before any DB work.
+    """
+    answers: Union[
+        conlist(Answer, max_items=MAX_QUIZ_ANSWERS),
+        Dict[constr(max_length=8), Answer]
+    ] = []
+    
+    @validator("answers")
+    def validate_answer_count(cls, v):
+        if len(v) > MAX_QUIZ_ANSWERS:
+            raise ValueError(f"At most {MAX_QUIZ_ANSWERS} answers are allowed")
+        return v
 
 
-class QuizResultResponse(BaseModel):
+class QuizResultResponse(ORMModel):
     attempt_id: str
     quiz_id: str
     score: float
     total_questions: int
     correct_answers: int
     submitted_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class QuizAttemptResponse(BaseModel):
+class QuizAttemptResponse(ORMModel):
     attempt_id: str
     quiz_id: str
     user_id: str
@@ -55,12 +80,10 @@ class QuizAttemptResponse(BaseModel):
     total_questions: int
     correct_answers: int
     submitted_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class QuizRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class QuizRecord:
     quiz_id: str
     lesson_id: str
     title: str
@@ -68,7 +91,8 @@ class QuizRecord(BaseModel):
     created_at: datetime
 
 
-class QuizAttemptRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class QuizAttemptRecord:
     attempt_id: str
     quiz_id: str
     user_id: str
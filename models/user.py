@@ -2,10 +2,24 @@
 User Models (Pydantic)
 Request/Response schemas for API
 """
-from pydantic import BaseModel, EmailStr
+from dataclasses import dataclass
+from pydantic import BaseModel, constr, validator
 from datetime import datetime
 from enum import Enum
 
+from models._base import ORMModel
+
+
+# Structural check only (one @, no spaces, dotted domain); unlike EmailStr this
+# needs no email-validator import at startup
+Email = constr(strip_whitespace=True, max_length=254, regex=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def normalize_email(value: str) -> str:
+    """Lower-case the domain like EmailStr did, so addresses differing only in domain case match"""
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
 
 class UserRole(str, Enum):
     student = "student"
@@ -13,27 +27,29 @@ class UserRole(str, Enum):
 
 
 class UserCreate(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
     role: UserRole = UserRole.student
+    
+    _normalize_email = validator("email", allow_reuse=True)(normalize_email)
 
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
+    
+    _normalize_email = validator("email", allow_reuse=True)(normalize_email)
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMModel):
     user_id: str
     email: str
     role: UserRole
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class UserRecord(BaseModel):
+@dataclass(frozen=True, slots=True)
+class UserRecord:
     user_id: str
     email: str
     hashed_password: str
@@ -2,22 +2,31 @@
 Run migration 004: Japanese Training Tables
 """
 import sys
-from sqlalchemy import text
-from config.database import SessionLocal
+from config.database import engine
+
+MIGRATION_FILE = 'db_migrations/004_add_japanese_training.sql'
 
 def run_migration():
+    # Read migration file as bytes: psycopg2 sends them unchanged, so the script
+    # is never decoded to str and re-encoded (a missing file fails before connecting)
+    with open(MIGRATION_FILE, 'rb') as f:
+        sql = f.read()
+    
     try:
-        # Get database session
-        db = SessionLocal()
-        
-        # Read migration file
-        with open('db_migrations/004_add_japanese_training.sql', 'r', encoding='utf-8') as f:
-            sql = f.read()
+        # Raw DBAPI connection: the script is sent as-is, without text()'s bind-parameter parsing
+        connection = engine.raw_connection()
         
-        # Execute migration
-        db.execute(text(sql))
-        db.commit()
-        db.close()
+        # Execute migration in one transaction; psycopg2 runs a multi-statement
+        # string in a single round trip, sqlite3 needs executescript (str only)
+        try:
+            cursor = connection.cursor()
+            if engine.dialect.name == "sqlite":
+                cursor.executescript(sql.decode('utf-8'))
+            else:
+                cursor.execute(sql)
+            connection.commit()
+        finally:
+            connection.close()
         
         print("✓ Migration 004 executed successfully")
         print("✓ Created 20 Japanese training tables")
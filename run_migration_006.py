@@ -12,13 +12,16 @@ from db_models.wallet import (
 
 def run_migration():
     print("Creating coaching system tables...")
-    Base.metadata.create_all(engine, tables=[
-        UserWallet.__table__,
-        WalletTransaction.__table__,
-        VoiceCoachingSession.__table__,
-        VideoSession.__table__,
-        AssessmentResult.__table__
-    ])
+    # The tables are new in this migration, so skip the per-table existence checks;
+    # one transaction means a failure leaves none of them behind
+    with engine.begin() as connection:
+        Base.metadata.create_all(connection, tables=[
+            UserWallet.__table__,
+            WalletTransaction.__table__,
+            VoiceCoachingSession.__table__,
+            VideoSession.__table__,
+            AssessmentResult.__table__
+        ], checkfirst=False)
     print("Migration complete!")
 
 if __name__ == "__main__":
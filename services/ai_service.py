@@ -2,14 +2,11 @@
 AI Service
 OpenAI integration for chat widget
 """
-import os
 from typing import List, Dict, Optional
-import openai
-from dotenv import load_dotenv
 
-load_dotenv()
+from config.openai_config import get_openai_client
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
+TITLE_MAX_LENGTH = 50
 
 
 class AIService:
@@ -61,15 +58,11 @@ Be friendly, encouraging, and concise. Always respond in English unless asked ot
         Returns:
             Tuple of (response_content, tokens_used)
         """
-        # Add system prompt
-        system_prompt = AIService.SYSTEM_PROMPTS.get(language, AIService.SYSTEM_PROMPTS["en"])
-        
-        full_messages = [
-            {"role": "system", "content": system_prompt}
-        ] + messages
+        # Add system prompt (message dicts are prebuilt per language)
+        full_messages = [SYSTEM_MESSAGES.get(language, SYSTEM_MESSAGES["en"]), *messages]
         
         try:
-            response = await openai.ChatCompletion.acreate(
+            response = await get_openai_client().chat.completions.create(
                 model=model,
                 messages=full_messages,
                 temperature=0.7,
@@ -106,7 +99,7 @@ Be friendly, encouraging, and concise. Always respond in English unless asked ot
         }
         
         try:
-            response = await openai.ChatCompletion.acreate(
+            response = await get_openai_client().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "Generate a very short conversation title. Respond with ONLY the title, no quotes or punctuation."},
@@ -117,8 +110,16 @@ Be friendly, encouraging, and concise. Always respond in English unless asked ot
             )
             
             title = response.choices[0].message.content.strip().strip('"').strip("'")
-            return title[:50]  # Ensure max 50 chars
+            return title[:TITLE_MAX_LENGTH]
             
         except Exception:
-            # Fallback to simple title
-            return first_message[:47] + "..." if len(first_message) > 47 else first_message
+            # Fallback to simple title (single-character ellipsis, so it still fits TITLE_MAX_LENGTH)
+            if len(first_message) > TITLE_MAX_LENGTH:
+                return first_message[:TITLE_MAX_LENGTH - 1] + "…"
+            return first_message
+
+
+SYSTEM_MESSAGES = {
+    language: {"role": "system", "content": prompt}
+    for language, prompt in AIService.SYSTEM_PROMPTS.items()
+}
@@ -2,14 +2,24 @@
 Assessment Service
 Business logic for evaluating student answers using GPT-4 with rubric-based scoring
 """
-import os
-import openai
-from dotenv import load_dotenv
-from typing import Dict
-from decimal import Decimal
+import asyncio
+import json
+from typing import Dict, List
 
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+from config.openai_config import get_openai_client
+from config.uuid_type import json_loads
+
+# JSON mode (response_format) needs a GPT-4-class model that supports it; base gpt-4 does not
+ASSESSMENT_MODEL = "gpt-4o"
+
+# Upper bound of each rubric score in the model's JSON response
+SCORE_LIMITS = {
+    "grammar": 25,
+    "keigo_appropriateness": 25,
+    "contextual_fit": 25,
+    "overall_quality": 25,
+    "overall": 100
+}
 
 
 class AssessmentService:
@@ -71,93 +81,48 @@ Give constructive feedback in 2-3 sentences."""
         Returns:
             dict with rubric scores, overall score, and feedback
         """
-        # Get rubric prompt for track
-        rubric_prompt = AssessmentService.RUBRIC_PROMPTS.get(
-            track.lower(),
-            AssessmentService.RUBRIC_PROMPTS["caregiving"]
-        )
-        
-        # Build assessment prompt
-        assessment_prompt = f"""{rubric_prompt}
-
-Question: {question_text}
+        # Rubric and response format are prebuilt per track; only the answer details vary per call
+        system_message = RUBRIC_SYSTEM_MESSAGES.get(track.lower(), RUBRIC_SYSTEM_MESSAGES["caregiving"])
+        user_message = {
+            "role": "user",
+            "content": f"""Question: {question_text}
 Expected Keigo Level: {expected_keigo_level}
 Question Type: {question_type}
 
-Student Answer: {student_answer}
-
-Evaluate the answer and provide:
-1. Grammar score (0-25)
-2. Keigo Appropriateness score (0-25)
-3. Contextual Fit score (0-25)
-4. Overall Quality score (0-25)
-5. Overall score (0-100)
-6. Feedback text (2-3 sentences)
-
-Respond in JSON format:
-{{
-    "grammar": <score>,
-    "keigo_appropriateness": <score>,
-    "contextual_fit": <score>,
-    "overall_quality": <score>,
-    "overall": <score>,
-    "feedback": "<feedback text>"
-}}"""
+Student Answer: {student_answer}"""
+        }
         
         try:
-            # Call GPT-4
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a Japanese language assessment expert. Always respond with valid JSON."},
-                    {"role": "user", "content": assessment_prompt}
-                ],
+            # Call GPT-4 in JSON mode: the reply is a bare JSON object, never fenced markdown
+            response = await get_openai_client().chat.completions.create(
+                model=ASSESSMENT_MODEL,
+                messages=[system_message, user_message],
+                response_format={"type": "json_object"},
                 temperature=0.3,
                 max_tokens=300
             )
             
-            response_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            import json
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
+            response_text = response.choices[0].message.content
             
-            assessment_data = json.loads(response_text)
+            # Parse JSON response (orjson when available; its errors subclass json.JSONDecodeError)
+            assessment_data = json_loads(response_text)
             
-            # Validate and format scores
-            grammar = float(assessment_data.get("grammar", 0))
-            keigo_appropriateness = float(assessment_data.get("keigo_appropriateness", 0))
-            contextual_fit = float(assessment_data.get("contextual_fit", 0))
-            overall_quality = float(assessment_data.get("overall_quality", 0))
-            overall = float(assessment_data.get("overall", 0))
-            feedback = assessment_data.get("feedback", "No feedback provided.")
-            
-            # Ensure scores are in valid ranges
-            grammar = max(0, min(25, grammar))
-            keigo_appropriateness = max(0, min(25, keigo_appropriateness))
-            contextual_fit = max(0, min(25, contextual_fit))
-            overall_quality = max(0, min(25, overall_quality))
-            overall = max(0, min(100, overall))
+            # Clamp each score into its rubric range
+            scores = {
+                name: round(max(0, min(limit, float(assessment_data.get(name, 0)))), 2)
+                for name, limit in SCORE_LIMITS.items()
+            }
             
             return {
                 "question_id": question_id,
-                "grammar": round(grammar, 2),
-                "keigo_appropriateness": round(keigo_appropriateness, 2),
-                "contextual_fit": round(contextual_fit, 2),
-                "overall_quality": round(overall_quality, 2),
-                "overall": round(overall, 2),
-                "feedback": feedback,
+                **scores,
+                "feedback": assessment_data.get("feedback", "No feedback provided."),
                 "track": track,
                 "expected_keigo_level": expected_keigo_level
             }
             
         except json.JSONDecodeError as e:
-            # Fallback if JSON parsing fails
+            # Fallback if the reply was cut off at max_tokens (the only way JSON mode yields invalid JSON)
             return {
                 "question_id": question_id,
                 "grammar": 0.0,
@@ -171,4 +136,58 @@ Respond in JSON format:
             }
         except Exception as e:
             raise Exception(f"Assessment error: {str(e)}")
+    
+    @staticmethod
+    async def evaluate_answers_batch(items: List[Dict], concurrency: int = 16) -> List:
+        """
+        Evaluate many answers concurrently, at most `concurrency` OpenAI calls in flight
+        
+        Keep concurrency within the account's OpenAI rate limits (requests/tokens per minute);
+        all calls share the pooled client from config.openai_config.
+        
+        Args:
+            items: evaluate_answer keyword arguments, one dict per answer
+            concurrency: Maximum simultaneous requests
+            
+        Returns:
+            Results in input order; a failed item's entry is its exception
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def evaluate(item: Dict) -> Dict:
+            async with semaphore:
+                return await AssessmentService.evaluate_answer(**item)
+        
+        return await asyncio.gather(*(evaluate(item) for item in items), return_exceptions=True)
+
+
+# Shared tail of every rubric system prompt
+RESPONSE_INSTRUCTIONS = """Evaluate the answer and provide:
+1. Grammar score (0-25)
+2. Keigo Appropriateness score (0-25)
+3. Contextual Fit score (0-25)
+4. Overall Quality score (0-25)
+5. Overall score (0-100)
+6. Feedback text (2-3 sentences)
 
+Respond in JSON format:
+{
+    "grammar": <score>,
+    "keigo_appropriateness": <score>,
+    "contextual_fit": <score>,
+    "overall_quality": <score>,
+    "overall": <score>,
+    "feedback": "<feedback text>"
+}"""
+
+RUBRIC_SYSTEM_MESSAGES = {
+    track: {
+        "role": "system",
+        "content": f"""You are a Japanese language assessment expert. Always respond with valid JSON.
+
+{rubric_prompt}
+
+{RESPONSE_INSTRUCTIONS}"""
+    }
+    for track, rubric_prompt in AssessmentService.RUBRIC_PROMPTS.items()
+}
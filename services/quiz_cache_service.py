@@ -0,0 +1,110 @@
+"""
+Quiz Cache Service
+Read-through Redis cache for quiz content (quizzes only change on admin writes)
+"""
+from sqlalchemy import select, bindparam
+from sqlalchemy.orm import Session
+from typing import Optional, List
+
+from db_models.quiz import QuizDB
+from config.cache import cache_get, cache_set, cache_delete
+
+QUIZ_TTL = 3600  # seconds
+
+GET_QUIZ = select(QuizDB).where(QuizDB.quiz_id == bindparam("quiz_id"))
+GET_ANSWER_KEY = select(QuizDB.answer_key).where(QuizDB.quiz_id == bindparam("quiz_id"))
+GET_LESSON_QUIZZES = select(
+    QuizDB.quiz_id,
+    QuizDB.lesson_id,
+    QuizDB.title,
+    QuizDB.created_at
+).where(QuizDB.lesson_id == bindparam("lesson_id")).order_by(QuizDB.created_at)
+
+
+class QuizCacheService:
+    """Service for cached quiz lookups; falls back to the database when Redis is not configured"""
+    
+    @staticmethod
+    def quiz_key(quiz_id: str) -> str:
+        return f"quiz:{quiz_id}"
+    
+    @staticmethod
+    def answer_key_key(quiz_id: str) -> str:
+        return f"quiz:{quiz_id}:answer_key"
+    
+    @staticmethod
+    def lesson_key(lesson_id: str) -> str:
+        return f"quizzes:lesson:{lesson_id}"
+    
+    @staticmethod
+    def get_quiz(db: Session, quiz_id: str) -> Optional[dict]:
+        """
+        Get a quiz with its questions
+        
+        Returns:
+            dict with quiz_id, lesson_id, title, questions, created_at (ISO string), or None
+        """
+        key = QuizCacheService.quiz_key(quiz_id)
+        quiz = cache_get(key)
+        if quiz is not None:
+            return quiz
+        
+        row = db.execute(GET_QUIZ, {"quiz_id": quiz_id}).scalars().first()
+        if not row:
+            return None
+        
+        quiz = {
+            "quiz_id": row.quiz_id,
+            "lesson_id": row.lesson_id,
+            "title": row.title,
+            "questions": row.questions,
+            "created_at": row.created_at.isoformat()
+        }
+        cache_set(key, quiz, QUIZ_TTL)
+        return quiz
+    
+    @staticmethod
+    def get_answer_key(db: Session, quiz_id: str) -> Optional[List[str]]:
+        """Get the ordered correct answers for a quiz (without loading questions), or None"""
+        key = QuizCacheService.answer_key_key(quiz_id)
+        answer_key = cache_get(key)
+        if answer_key is not None:
+            return answer_key
+        
+        answer_key = db.execute(GET_ANSWER_KEY, {"quiz_id": quiz_id}).scalar()
+        if answer_key is None:
+            return None
+        
+        cache_set(key, answer_key, QUIZ_TTL)
+        return answer_key
+    
+    @staticmethod
+    def get_lesson_quizzes(db: Session, lesson_id: str) -> List[dict]:
+        """Get quiz summaries (no questions) for a lesson"""
+        key = QuizCacheService.lesson_key(lesson_id)
+        quizzes = cache_get(key)
+        if quizzes is not None:
+            return quizzes
+        
+        rows = db.execute(GET_LESSON_QUIZZES, {"lesson_id": lesson_id}).all()
+        
+        quizzes = [
+            {
+                "quiz_id": row.quiz_id,
+                "lesson_id": row.lesson_id,
+                "title": row.title,
+                "created_at": row.created_at.isoformat()
+            }
+            for row in rows
+        ]
+        cache_set(key, quizzes, QUIZ_TTL)
+        return quizzes
+    
+    @staticmethod
+    def invalidate(quiz_id: str, lesson_id: str) -> None:
+        """Drop cached entries after a quiz is written"""
+        cache_delete(
+            QuizCacheService.quiz_key(quiz_id),
+            QuizCacheService.answer_key_key(quiz_id),
+            QuizCacheService.lesson_key(lesson_id)
+        )
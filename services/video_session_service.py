@@ -2,7 +2,9 @@
 Video Session Service
 Business logic for video sessions with timeline events and interactions
 """
+from sqlalchemy import select, bindparam, text
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 from decimal import Decimal
 from typing import Optional, Dict, List
 import uuid
@@ -10,15 +12,45 @@ from datetime import datetime
 
 from db_models.wallet import (
     VideoSession,
-    SessionStatus
+    UserWallet,
+    SessionStatus,
+    OPEN_SESSION_STATUSES
 )
 from services.wallet_service import WalletService
 from services.assessment_service import AssessmentService
 from config.costs import (
     VIDEO_SESSION_COST_PER_MINUTE,
+    VIDEO_SESSION_COSTS,
     MIN_VIDEO_SESSION_DURATION,
     MAX_VIDEO_SESSION_DURATION
 )
+from config.uuid_type import uuid7, json_dumps
+
+# Session plus its owner's wallet in one round trip, for settling the session's charges
+SESSION_WITH_WALLET = select(VideoSession, UserWallet).outerjoin(
+    UserWallet, UserWallet.user_id == VideoSession.user_id
+).where(
+    VideoSession.session_id == bindparam("session_id"),
+    VideoSession.user_id == bindparam("user_id")
+)
+
+# On PostgreSQL answers and progress are merged into the metadata JSONB in place,
+# so each write sends only the changed entry rather than the whole document
+# (jsonb_set returns NULL for a NULL document, hence the coalesce)
+SET_ANSWER = text(
+    "UPDATE video_sessions SET metadata = jsonb_set(coalesce(metadata, '{}'::jsonb), '{answers}', "
+    "coalesce(metadata->'answers', '{}'::jsonb) || jsonb_build_object(:question_id, CAST(:entry AS jsonb))) "
+    "WHERE session_id = :session_id AND status IN ('reserved', 'active')"
+).bindparams(bindparam("session_id", type_=VideoSession.session_id.type))
+SET_PROGRESS = text(
+    "UPDATE video_sessions SET metadata = jsonb_set(coalesce(metadata, '{}'::jsonb), '{progress}', "
+    "coalesce(metadata->'progress', '{}'::jsonb) || CAST(:progress AS jsonb)) "
+    "WHERE session_id = :session_id"
+).bindparams(bindparam("session_id", type_=VideoSession.session_id.type))
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
 
 
 class VideoSessionService:
@@ -101,6 +133,12 @@ class VideoSessionService:
         }
     }
     
+    # event_id -> event per video, so answering a question is a dict lookup
+    TIMELINE_EVENT_INDEX = {
+        video_id: {event["event_id"]: event for event in metadata["timeline_events"]}
+        for video_id, metadata in VIDEO_METADATA.items()
+    }
+    
     @staticmethod
     def get_video_metadata(video_id: str) -> Optional[Dict]:
         """
@@ -145,46 +183,45 @@ class VideoSessionService:
         
         # Calculate cost
         duration_minutes = metadata["duration_minutes"]
-        estimated_cost = VIDEO_SESSION_COST_PER_MINUTE * Decimal(str(duration_minutes))
-        
-        # Create session record
-        session_id = uuid.uuid4()
-        session = VideoSession(
-            session_id=session_id,
-            user_id=user_id,
-            duration_minutes=duration_minutes,
-            cost=estimated_cost,
-            status=SessionStatus.reserved.value,
-            reserved_at=datetime.utcnow(),
-            video_session_metadata={
-                "video_id": video_id,
-                "language": language,
-                "track": metadata["track"],
-                "title": metadata["title"],
-                "timeline_events": metadata["timeline_events"],
-                "answers": {},  # Store answers by question_id
-                "progress": {
-                    "current_timestamp": 0,
-                    "completion_percentage": 0.0
-                }
-            }
-        )
-        db.add(session)
-        db.flush()
+        estimated_cost = VIDEO_SESSION_COSTS[duration_minutes]
         
-        # Reserve balance
+        # Reserve balance and create the session record in one transaction
+        session_id = uuid7()
         try:
             transaction = WalletService.reserve_balance(
                 db=db,
                 user_id=user_id,
                 amount=estimated_cost,
                 session_id=session_id,
-                description=f"Reserved {estimated_cost} NPR for video session"
+                description=f"Reserved {estimated_cost} NPR for video session",
+                commit=False
             )
+            # The session references the transaction, so its row must be written first
+            db.flush()
             
-            session.transaction_id = transaction.transaction_id
+            reserved_at = datetime.utcnow()
+            db.add(VideoSession(
+                session_id=session_id,
+                user_id=user_id,
+                duration_minutes=duration_minutes,
+                cost=estimated_cost,
+                status=SessionStatus.reserved.value,
+                reserved_at=reserved_at,
+                transaction_id=transaction.transaction_id,
+                video_session_metadata={
+                    "video_id": video_id,
+                    "language": language,
+                    "track": metadata["track"],
+                    "title": metadata["title"],
+                    # Timeline events are looked up from VIDEO_METADATA by video_id, not stored per session
+                    "answers": {},  # Store answers by question_id
+                    "progress": {
+                        "current_timestamp": 0,
+                        "completion_percentage": 0.0
+                    }
+                }
+            ))
             db.commit()
-            db.refresh(session)
             
             return {
                 "session_id": str(session_id),
@@ -196,8 +233,8 @@ class VideoSessionService:
                 "duration_minutes": duration_minutes,
                 "timeline_events": metadata["timeline_events"],
                 "reserved_amount": float(estimated_cost),
-                "status": session.status,
-                "reserved_at": session.reserved_at.isoformat() if session.reserved_at else None
+                "status": SessionStatus.reserved.value,
+                "reserved_at": reserved_at.isoformat()
             }
             
         except ValueError as e:
@@ -241,17 +278,28 @@ class VideoSessionService:
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        if session.status not in ["reserved", "active"]:
+        if session.status not in OPEN_SESSION_STATUSES:
             raise ValueError(f"Session is in {session.status} status and cannot receive answers")
         
+        # One timestamp for the whole request: the answer is recorded as given when it arrived,
+        # not after assessment returns
+        now = datetime.utcnow()
+        
         # Update session to active if needed
         if session.status == "reserved":
             session.status = "active"
-            session.started_at = datetime.utcnow()
+            session.started_at = now
         
-        # Get question from timeline events
-        timeline_events = session.video_session_metadata.get("timeline_events", [])
-        question = next((e for e in timeline_events if e.get("event_id") == question_id), None)
+        # Get question from timeline events; only older sessions (which stored a copy of the
+        # timeline) for videos no longer in VIDEO_METADATA need a scan
+        event_index = VideoSessionService.TIMELINE_EVENT_INDEX.get(
+            session.video_session_metadata.get("video_id")
+        )
+        if event_index is not None:
+            question = event_index.get(question_id)
+        else:
+            timeline_events = session.video_session_metadata.get("timeline_events", [])
+            question = next((e for e in timeline_events if e.get("event_id") == question_id), None)
         
         if not question:
             raise ValueError(f"Question {question_id} not found in timeline")
@@ -263,8 +311,12 @@ class VideoSessionService:
         track = session.video_session_metadata.get("track", "caregiving")
         expected_keigo_level = question.get("expected_keigo_level", "teineigo")
         
-        # Call assessment service
-        assessment_result = AssessmentService.evaluate_answer(
+        # End the transaction (saving any status change) so the pooled connection is not
+        # held while the assessment model runs
+        db.commit()
+        
+        # Call assessment service; awaiting it leaves the event loop free for other requests
+        assessment_result = await AssessmentService.evaluate_answer(
             question_id=question_id,
             student_answer=answer,
             track=track,
@@ -273,19 +325,33 @@ class VideoSessionService:
             question_type=question.get("question_type", "general")
         )
         
-        # Save answer in session metadata
-        if "answers" not in session.video_session_metadata:
-            session.video_session_metadata["answers"] = {}
-        
-        session.video_session_metadata["answers"][question_id] = {
+        # Save answer in session metadata, unless the session was completed during assessment
+        entry = {
             "answer": answer,
             "answer_mode": answer_mode,
-            "answered_at": datetime.utcnow().isoformat(),
+            "answered_at": now.isoformat(),
             "assessment": assessment_result
         }
         
+        if _is_postgres(db):
+            # The status check and the write are one statement
+            saved = db.execute(SET_ANSWER, {
+                "session_id": session.session_id,
+                "question_id": question_id,
+                "entry": json_dumps(entry)
+            }).rowcount == 1
+        else:
+            # Reload so the merge starts from the stored row, not the copy read before assessment
+            db.refresh(session)
+            saved = session.status in OPEN_SESSION_STATUSES
+            if saved:
+                session.video_session_metadata.setdefault("answers", {})[question_id] = entry
+                flag_modified(session, "video_session_metadata")
+        
+        if not saved:
+            raise ValueError(f"Session {session_id} was closed before the answer could be saved")
+        
         db.commit()
-        db.refresh(session)
         
         return {
             "question_id": question_id,
@@ -323,21 +389,27 @@ class VideoSessionService:
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        # Update progress in metadata
-        if "progress" not in session.video_session_metadata:
-            session.video_session_metadata["progress"] = {}
+        now = datetime.utcnow()
         
-        session.video_session_metadata["progress"]["current_timestamp"] = current_timestamp
-        session.video_session_metadata["progress"]["completion_percentage"] = completion_percentage
-        session.video_session_metadata["progress"]["last_updated"] = datetime.utcnow().isoformat()
+        # Update progress in metadata (the loaded dict is updated too, so it stays current)
+        progress = {
+            "current_timestamp": current_timestamp,
+            "completion_percentage": completion_percentage,
+            "last_updated": now.isoformat()
+        }
+        session.video_session_metadata.setdefault("progress", {}).update(progress)
+        
+        if _is_postgres(db):
+            db.execute(SET_PROGRESS, {"session_id": session.session_id, "progress": json_dumps(progress)})
+        else:
+            flag_modified(session, "video_session_metadata")
         
         # Update session status to active if not already
         if session.status == "reserved":
             session.status = "active"
-            session.started_at = datetime.utcnow()
+            session.started_at = now
         
         db.commit()
-        db.refresh(session)
         
         return {
             "session_id": str(session_id),
@@ -364,13 +436,11 @@ class VideoSessionService:
         Returns:
             dict with completion details
         """
-        session = db.query(VideoSession).filter(
-            VideoSession.session_id == session_id,
-            VideoSession.user_id == user_id
-        ).first()
+        row = db.execute(SESSION_WITH_WALLET, {"session_id": session_id, "user_id": user_id}).first()
         
-        if not session:
+        if not row:
             raise ValueError(f"Session {session_id} not found")
+        session, wallet = row
         
         if session.status == "completed":
             raise ValueError("Session is already completed")
@@ -384,44 +454,50 @@ class VideoSessionService:
         actual_cost = VIDEO_SESSION_COST_PER_MINUTE * actual_duration_minutes
         reserved_amount = session.cost
         
-        # Finalize reservation and charge actual amount
+        # Refund if actual cost is less than reserved
+        refund_amount = reserved_amount - actual_cost if actual_cost < reserved_amount else Decimal("0.00")
+        
+        # Finalize reservation, refund and update session in one transaction
         try:
             charge_transaction = WalletService.finalize_reservation(
                 db=db,
                 user_id=user_id,
                 reserved_amount=reserved_amount,
                 actual_amount=actual_cost,
-                session_id=session_id
+                session_id=session_id,
+                commit=False,
+                wallet=wallet
             )
             
-            # Calculate refund if actual cost is less than reserved
-            refund_amount = Decimal("0.00")
-            if actual_cost < reserved_amount:
-                refund_amount = reserved_amount - actual_cost
+            if refund_amount:
                 WalletService.refund(
                     db=db,
                     user_id=user_id,
                     amount=refund_amount,
                     session_id=session_id,
-                    description=f"Refund for incomplete video session: {refund_amount} NPR"
+                    description=f"Refund for incomplete video session: {refund_amount} NPR",
+                    commit=False,
+                    wallet=wallet
                 )
+            # The session references the charge, so its row must be written first
+            db.flush()
             
             # Update session
+            completed_at = datetime.utcnow()
             session.status = SessionStatus.completed.value
-            session.completed_at = datetime.utcnow()
+            session.completed_at = completed_at
             session.transaction_id = charge_transaction.transaction_id
             
             db.commit()
-            db.refresh(session)
             
             return {
                 "session_id": str(session_id),
-                "status": session.status,
+                "status": SessionStatus.completed.value,
                 "reserved_amount": float(reserved_amount),
                 "actual_cost": float(actual_cost),
                 "refund_amount": float(refund_amount),
                 "completion_percentage": completion_percentage,
-                "completed_at": session.completed_at.isoformat() if session.completed_at else None
+                "completed_at": completed_at.isoformat()
             }
             
         except Exception as e:
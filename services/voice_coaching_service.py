@@ -2,29 +2,54 @@
 Voice Coaching Service
 Business logic for voice coaching sessions with Standard and Realtime modes
 """
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 from decimal import Decimal
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, AsyncIterator
 import uuid
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
-import os
-import openai
-from dotenv import load_dotenv
 
 from db_models.wallet import (
     VoiceCoachingSession,
-    SessionStatus
+    UserWallet,
+    SessionStatus,
+    OPEN_SESSION_STATUSES
 )
 from services.wallet_service import WalletService
 from config.costs import (
     VOICE_COACHING_STANDARD_COST_PER_MINUTE,
     VOICE_COACHING_REALTIME_COST_PER_MINUTE,
+    VOICE_COACHING_STANDARD_COSTS,
+    VOICE_COACHING_REALTIME_COSTS,
     MIN_VOICE_SESSION_DURATION,
     MAX_VOICE_SESSION_DURATION
 )
+from config.openai_config import get_openai_client
+from config.uuid_type import uuid7
 
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# Session plus its owner's wallet in one round trip, for settling the session's charges
+SESSION_WITH_WALLET = select(VoiceCoachingSession, UserWallet).outerjoin(
+    UserWallet, UserWallet.user_id == VoiceCoachingSession.user_id
+).where(
+    VoiceCoachingSession.session_id == bindparam("session_id"),
+    VoiceCoachingSession.user_id == bindparam("user_id")
+)
+
+# Per-mode cost tables: (cost by whole minutes, cost per minute for anything else)
+MODE_COSTS = {
+    "standard": (VOICE_COACHING_STANDARD_COSTS, VOICE_COACHING_STANDARD_COST_PER_MINUTE),
+    "realtime": (VOICE_COACHING_REALTIME_COSTS, VOICE_COACHING_REALTIME_COST_PER_MINUTE)
+}
+
+# Replies to opening turns (no history), keyed by track + normalized input; oldest evicted first
+REPLY_CACHE_SIZE = 2000
+_reply_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+# Cap on conversation history sent with each turn; oldest turns are dropped first.
+# Measured in characters (roughly one token each for Japanese text) so no tokenizer is needed
+MAX_HISTORY_CHARS = 6000
 
 
 class VoiceCoachingService:
@@ -78,12 +103,16 @@ Keep responses concise (2-3 sentences max) and encourage the student to think an
         Returns:
             Cost in NPR
         """
-        if mode.lower() == "standard":
-            return VOICE_COACHING_STANDARD_COST_PER_MINUTE * Decimal(str(duration_minutes))
-        elif mode.lower() == "realtime":
-            return VOICE_COACHING_REALTIME_COST_PER_MINUTE * Decimal(str(duration_minutes))
-        else:
+        mode_costs = MODE_COSTS.get(mode.lower())
+        if mode_costs is None:
             raise ValueError(f"Invalid mode: {mode}. Must be 'standard' or 'realtime'")
+        costs, cost_per_minute = mode_costs
+        
+        # Whole minutes within the allowed range are precomputed
+        cost = costs.get(duration_minutes)
+        if cost is None:
+            cost = cost_per_minute * Decimal(str(duration_minutes))
+        return cost
     
     @staticmethod
     def get_socratic_prompt(track: str) -> str:
@@ -136,54 +165,54 @@ Keep responses concise (2-3 sentences max) and encourage the student to think an
             raise ValueError(f"Duration must not exceed {MAX_VOICE_SESSION_DURATION} minutes")
         
         # Validate mode
-        if mode.lower() not in ["standard", "realtime"]:
+        mode = mode.lower()
+        if mode not in MODE_COSTS:
             raise ValueError("Mode must be 'standard' or 'realtime'")
         
         # Calculate cost
         estimated_cost = VoiceCoachingService.calculate_cost(mode, estimated_duration_minutes)
         
-        # Create session record
-        session_id = uuid.uuid4()
-        session = VoiceCoachingSession(
-            session_id=session_id,
-            user_id=user_id,
-            mode=mode.lower(),
-            duration_minutes=estimated_duration_minutes,
-            cost=estimated_cost,
-            status=SessionStatus.reserved.value,
-            reserved_at=datetime.utcnow(),
-            metadata={
-                "track": track,
-                "language": language,
-                "estimated_duration_minutes": estimated_duration_minutes
-            }
-        )
-        db.add(session)
-        db.flush()  # Flush to get session_id
-        
-        # Reserve balance
+        # Reserve balance and create the session record in one transaction
+        session_id = uuid7()
         try:
             transaction = WalletService.reserve_balance(
                 db=db,
                 user_id=user_id,
                 amount=estimated_cost,
                 session_id=session_id,
-                description=f"Reserved {estimated_cost} NPR for {mode} voice coaching session"
+                description=f"Reserved {estimated_cost} NPR for {mode} voice coaching session",
+                commit=False
             )
+            # The session references the transaction, so its row must be written first
+            db.flush()
             
-            session.transaction_id = transaction.transaction_id
+            reserved_at = datetime.utcnow()
+            db.add(VoiceCoachingSession(
+                session_id=session_id,
+                user_id=user_id,
+                mode=mode,
+                duration_minutes=estimated_duration_minutes,
+                cost=estimated_cost,
+                status=SessionStatus.reserved.value,
+                reserved_at=reserved_at,
+                transaction_id=transaction.transaction_id,
+                metadata={
+                    "track": track,
+                    "language": language,
+                    "estimated_duration_minutes": estimated_duration_minutes
+                }
+            ))
             db.commit()
-            db.refresh(session)
             
             return {
                 "session_id": str(session_id),
-                "mode": mode.lower(),
+                "mode": mode,
                 "track": track,
                 "language": language,
                 "estimated_duration_minutes": estimated_duration_minutes,
                 "reserved_amount": float(estimated_cost),
-                "status": session.status,
-                "reserved_at": session.reserved_at.isoformat() if session.reserved_at else None
+                "status": SessionStatus.reserved.value,
+                "reserved_at": reserved_at.isoformat()
             }
             
         except ValueError as e:
@@ -194,37 +223,44 @@ Keep responses concise (2-3 sentences max) and encourage the student to think an
             raise Exception(f"Error starting session: {str(e)}")
     
     @staticmethod
-    async def handle_standard_mode(
-        session_id: uuid.UUID,
-        audio_input: Optional[bytes],
-        text_input: Optional[str],
-        track: str,
-        conversation_history: Optional[List[Dict[str, str]]] = None
-    ) -> Dict:
+    def trim_history(conversation_history: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
-        Handle standard mode coaching (Whisper → GPT-4 → TTS pipeline)
-        
-        For now, uses GPT-4 text completion directly (Whisper/TTS to be added later)
+        Keep the most recent turns that fit within MAX_HISTORY_CHARS
         
         Args:
-            session_id: Session ID
-            audio_input: Optional audio bytes (not yet processed)
-            text_input: Optional text input
-            track: Track type (caregiving, academic, food_tech)
-            conversation_history: Optional conversation history
+            conversation_history: Conversation history, oldest first
             
         Returns:
-            dict with response_text and tokens_used
+            Trailing slice of the history
+        """
+        remaining = MAX_HISTORY_CHARS
+        start = len(conversation_history)
+        while start > 0:
+            remaining -= len(str(conversation_history[start - 1].get("content", "")))
+            if remaining < 0:
+                break
+            start -= 1
+        return conversation_history[start:]
+    
+    @staticmethod
+    def build_standard_messages(
+        audio_input: Optional[bytes],
+        text_input: Optional[str],
+        track: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
         """
-        # Get Socratic prompt for track
-        system_prompt = VoiceCoachingService.get_socratic_prompt(track)
+        Build the chat messages for a standard mode turn
         
-        # Prepare messages
-        messages = [{"role": "system", "content": system_prompt}]
+        Raises:
+            ValueError: If neither audio_input nor text_input is provided
+        """
+        # Prepare messages, starting from the prebuilt Socratic system message for the track
+        messages = [SOCRATIC_MESSAGES.get(track.lower(), SOCRATIC_MESSAGES["caregiving"])]
         
-        # Add conversation history if provided
+        # Add conversation history if provided (most recent turns only)
         if conversation_history:
-            messages.extend(conversation_history)
+            messages.extend(VoiceCoachingService.trim_history(conversation_history))
         
         # Add current user input
         user_input = text_input
@@ -237,10 +273,57 @@ Keep responses concise (2-3 sentences max) and encourage the student to think an
             raise ValueError("Either audio_input or text_input must be provided")
         
         messages.append({"role": "user", "content": user_input})
+        return messages
+    
+    @staticmethod
+    async def handle_standard_mode(
+        session_id: uuid.UUID,
+        audio_input: Optional[bytes],
+        text_input: Optional[str],
+        track: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        bypass_cache: bool = False
+    ) -> Dict:
+        """
+        Handle standard mode coaching (Whisper → GPT-4 → TTS pipeline)
+        
+        For now, uses GPT-4 text completion directly (Whisper/TTS to be added later).
+        Opening turns (text input, no history) are answered from an in-process cache
+        when the same prompt was seen recently on the same track.
+        
+        Args:
+            session_id: Session ID
+            audio_input: Optional audio bytes (not yet processed)
+            text_input: Optional text input
+            track: Track type (caregiving, academic, food_tech)
+            conversation_history: Optional conversation history
+            bypass_cache: Always generate a fresh reply
+            
+        Returns:
+            dict with response_text, tokens_used and cache_hit
+        """
+        messages = VoiceCoachingService.build_standard_messages(
+            audio_input, text_input, track, conversation_history
+        )
+        
+        # Later turns depend on the history, so only opening turns are cacheable
+        cache_key = None
+        if text_input and not conversation_history and not bypass_cache:
+            normalized = f"{track.lower()}\x1e{text_input.strip().lower()}"
+            cache_key = hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+            cached = _reply_cache.get(cache_key)
+            if cached is not None:
+                _reply_cache.move_to_end(cache_key)
+                return {
+                    "response_text": cached,
+                    "tokens_used": 0,
+                    "audio_url": None,
+                    "cache_hit": True
+                }
         
         try:
             # Call GPT-4
-            response = await openai.ChatCompletion.acreate(
+            response = await get_openai_client().chat.completions.create(
                 model="gpt-4",
                 messages=messages,
                 temperature=0.7,
@@ -250,18 +333,77 @@ Keep responses concise (2-3 sentences max) and encourage the student to think an
             response_text = response.choices[0].message.content
             tokens_used = response.usage.total_tokens
             
+            if cache_key is not None:
+                _reply_cache[cache_key] = response_text
+                if len(_reply_cache) > REPLY_CACHE_SIZE:
+                    _reply_cache.popitem(last=False)
+            
             # TODO: Convert response to audio using TTS API
             # For now, return text only
             
             return {
                 "response_text": response_text,
                 "tokens_used": tokens_used,
-                "audio_url": None  # Will be added when TTS is implemented
+                "audio_url": None,  # Will be added when TTS is implemented
+                "cache_hit": False
             }
             
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
     
+    @staticmethod
+    async def stream_standard_mode(
+        session_id: uuid.UUID,
+        audio_input: Optional[bytes],
+        text_input: Optional[str],
+        track: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Handle standard mode coaching, streaming the reply as it is generated
+        
+        The request is sent before this returns, so input and API errors are raised
+        here rather than part-way through the stream. Closing the returned iterator
+        closes the upstream response.
+        
+        Args:
+            session_id: Session ID
+            audio_input: Optional audio bytes (not yet processed)
+            text_input: Optional text input
+            track: Track type (caregiving, academic, food_tech)
+            conversation_history: Optional conversation history
+            
+        Returns:
+            async iterator of dicts with delta (text) and finish_reason
+        """
+        messages = VoiceCoachingService.build_standard_messages(
+            audio_input, text_input, track, conversation_history
+        )
+        
+        try:
+            stream = await get_openai_client().chat.completions.create(
+                model="gpt-4",
+                messages=messages,
+                temperature=0.7,
+                max_tokens=200,
+                stream=True
+            )
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+        
+        async def deltas() -> AsyncIterator[Dict]:
+            try:
+                async for chunk in stream:
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        yield {"delta": choice.delta.content or "", "finish_reason": choice.finish_reason}
+            finally:
+                # Closing the response ends the upstream stream (and its token usage) if the
+                # consumer stops early
+                await stream.response.aclose()
+        
+        return deltas()
+    
     @staticmethod
     async def handle_realtime_mode(
         session_id: uuid.UUID,
@@ -310,64 +452,73 @@ Keep responses concise (2-3 sentences max) and encourage the student to think an
             dict with final cost, refund amount, and session status
         """
         # Get session
-        session = db.query(VoiceCoachingSession).filter(
-            VoiceCoachingSession.session_id == session_id,
-            VoiceCoachingSession.user_id == user_id
-        ).first()
+        row = db.execute(SESSION_WITH_WALLET, {"session_id": session_id, "user_id": user_id}).first()
         
-        if not session:
+        if not row:
             raise ValueError(f"Session {session_id} not found")
+        session, wallet = row
         
-        if session.status != SessionStatus.reserved.value and session.status != SessionStatus.active.value:
+        if session.status not in OPEN_SESSION_STATUSES:
             raise ValueError(f"Session is in {session.status} status and cannot be ended")
         
         # Calculate actual cost
         actual_cost = VoiceCoachingService.calculate_cost(session.mode, actual_duration_minutes)
         reserved_amount = session.cost
         
-        # Finalize reservation and charge actual amount
+        # Refund if actual cost is less than reserved
+        refund_amount = reserved_amount - actual_cost if actual_cost < reserved_amount else Decimal("0.00")
+        
+        # Finalize reservation, refund and update session in one transaction
         try:
             charge_transaction = WalletService.finalize_reservation(
                 db=db,
                 user_id=user_id,
                 reserved_amount=reserved_amount,
                 actual_amount=actual_cost,
-                session_id=session_id
+                session_id=session_id,
+                commit=False,
+                wallet=wallet
             )
             
-            # Calculate refund if actual cost is less than reserved
-            refund_amount = Decimal("0.00")
-            if actual_cost < reserved_amount:
-                refund_amount = reserved_amount - actual_cost
+            if refund_amount:
                 WalletService.refund(
                     db=db,
                     user_id=user_id,
                     amount=refund_amount,
                     session_id=session_id,
-                    description=f"Refund for unused time: {refund_amount} NPR"
+                    description=f"Refund for unused time: {refund_amount} NPR",
+                    commit=False,
+                    wallet=wallet
                 )
+            # The session references the charge, so its row must be written first
+            db.flush()
             
             # Update session
+            completed_at = datetime.utcnow()
             session.status = SessionStatus.completed.value
-            session.completed_at = datetime.utcnow()
+            session.completed_at = completed_at
             session.duration_minutes = actual_duration_minutes
             session.cost = actual_cost
             session.transaction_id = charge_transaction.transaction_id
             
             db.commit()
-            db.refresh(session)
             
             return {
                 "session_id": str(session_id),
-                "status": session.status,
+                "status": SessionStatus.completed.value,
                 "reserved_amount": float(reserved_amount),
                 "actual_cost": float(actual_cost),
                 "refund_amount": float(refund_amount),
                 "actual_duration_minutes": actual_duration_minutes,
-                "completed_at": session.completed_at.isoformat() if session.completed_at else None
+                "completed_at": completed_at.isoformat()
             }
             
         except Exception as e:
             db.rollback()
             raise Exception(f"Error ending session: {str(e)}")
 
+
+SOCRATIC_MESSAGES = {
+    track: {"role": "system", "content": prompt}
+    for track, prompt in VoiceCoachingService.SOCRATIC_PROMPTS.items()
+}
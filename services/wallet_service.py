@@ -3,7 +3,9 @@ Wallet Service
 Business logic for wallet operations: balance management, reservations, transactions
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import func, select, update, bindparam, case, literal, event
 from decimal import Decimal
 from typing import Optional
 import uuid
@@ -22,27 +24,130 @@ from config.costs import (
     TOPUP_BONUS_TIER_2_AMOUNT,
     TOPUP_BONUS_TIER_2_PERCENTAGE
 )
+from config.uuid_type import uuid7
+from config.cache import cache_get, cache_set, cache_delete
 
+BALANCE_TTL = 3  # seconds; the balance endpoint is polled, and committed writes invalidate it
+
+GET_WALLET = select(UserWallet).where(UserWallet.user_id == bindparam("user_id"))
+
+# Balance reads only need these columns; plain rows skip ORM hydration and the identity map
+GET_BALANCE = select(
+    UserWallet.balance,
+    UserWallet.reserved_balance,
+    UserWallet.currency
+).where(UserWallet.user_id == bindparam("user_id"))
+
+# Debits are conditional UPDATEs: the funds check and the write are one statement, so two
+# concurrent debits can't both pass the check against the same balance. Amounts are bound
+# as MoneyType so they are converted to minor units like the columns they are compared to.
+WALLETS = UserWallet.__table__
+_amount = bindparam("amount", type_=WALLETS.c.balance.type)
+_reserved_amount = bindparam("reserved_amount", type_=WALLETS.c.balance.type)
+
+RESERVE_BALANCE = update(WALLETS).where(
+    WALLETS.c.wallet_id == bindparam("wallet_id"),
+    WALLETS.c.balance - WALLETS.c.reserved_balance >= _amount
+).values(
+    reserved_balance=WALLETS.c.reserved_balance + _amount,
+    updated_at=bindparam("updated_at")
+)
+
+# Releases the reservation (never below zero) and charges the actual amount
+FINALIZE_RESERVATION = update(WALLETS).where(
+    WALLETS.c.wallet_id == bindparam("wallet_id"),
+    WALLETS.c.balance >= _amount
+).values(
+    balance=WALLETS.c.balance - _amount,
+    reserved_balance=case(
+        (WALLETS.c.reserved_balance >= _reserved_amount, WALLETS.c.reserved_balance - _reserved_amount),
+        else_=literal(Decimal("0.00"), WALLETS.c.balance.type)
+    ),
+    updated_at=bindparam("updated_at")
+)
+
+# Credits add in SQL too, so concurrent credits and debits on one wallet never overwrite each other
+CREDIT_BALANCE = update(WALLETS).where(
+    WALLETS.c.wallet_id == bindparam("wallet_id")
+).values(
+    balance=WALLETS.c.balance + _amount,
+    updated_at=bindparam("updated_at")
+)
+
+# Session.info key collecting the users whose balance the current transaction changed
+CHANGED_BALANCES = "wallet_changed_balances"
+
+GET_BALANCES = select(WALLETS.c.balance, WALLETS.c.reserved_balance).where(
+    WALLETS.c.wallet_id == bindparam("wallet_id")
+)
 
 class WalletService:
     """Service for managing user wallets and transactions"""
     
     @staticmethod
-    def get_or_create_wallet(db: Session, user_id: str) -> UserWallet:
-        """Get existing wallet or create a new one for the user"""
-        wallet = db.query(UserWallet).filter(UserWallet.user_id == user_id).first()
+    def apply_balance_update(db: Session, statement, params: dict, wallet: UserWallet):
+        """
+        Run a conditional wallet UPDATE and sync the loaded wallet with the result
+        
+        Returns:
+            Row with the new balance and reserved_balance, or None if the guard did not match
+        """
+        params = {**params, "wallet_id": wallet.wallet_id}
+        if db.get_bind().dialect.name == "postgresql":
+            row = db.execute(statement.returning(WALLETS.c.balance, WALLETS.c.reserved_balance), params).first()
+        elif db.execute(statement, params).rowcount == 1:
+            row = db.execute(GET_BALANCES, {"wallet_id": wallet.wallet_id}).first()
+        else:
+            row = None
+        
+        if row is not None:
+            # Already written: update the loaded object without marking it dirty
+            set_committed_value(wallet, "balance", row.balance)
+            set_committed_value(wallet, "reserved_balance", row.reserved_balance)
+            # The cached balance is dropped when this transaction commits (see invalidate_committed_balances)
+            db.info.setdefault(CHANGED_BALANCES, set()).add(wallet.user_id)
+        return row
+    
+    @staticmethod
+    def balance_key(user_id: str) -> str:
+        return f"wallet:v1:{user_id}:balance"
+    
+    @staticmethod
+    def get_or_create_wallet(db: Session, user_id: str, commit: bool = True) -> UserWallet:
+        """
+        Get existing wallet or create a new one for the user
+        
+        With commit=False a new wallet is written in the caller's transaction (and is
+        visible to the balance UPDATEs that follow) but not committed.
+        """
+        wallet = db.execute(GET_WALLET, {"user_id": user_id}).scalars().first()
         
         if not wallet:
-            wallet = UserWallet(
-                wallet_id=uuid.uuid4(),
-                user_id=user_id,
-                balance=Decimal("0.00"),
-                reserved_balance=Decimal("0.00"),
-                currency="NPR"
-            )
-            db.add(wallet)
-            db.commit()
-            db.refresh(wallet)
+            if db.get_bind().dialect.name == "postgresql":
+                # Two first requests for one user may both get here: the later insert is
+                # skipped instead of failing on the unique user_id, and both read the same row
+                db.execute(
+                    pg_insert(UserWallet).values(
+                        wallet_id=uuid7(),
+                        user_id=user_id,
+                        balance=Decimal("0.00"),
+                        reserved_balance=Decimal("0.00"),
+                        currency="NPR"
+                    ).on_conflict_do_nothing(index_elements=[UserWallet.user_id])
+                )
+                wallet = db.execute(GET_WALLET, {"user_id": user_id}).scalars().first()
+            else:
+                wallet = UserWallet(
+                    wallet_id=uuid7(),
+                    user_id=user_id,
+                    balance=Decimal("0.00"),
+                    reserved_balance=Decimal("0.00"),
+                    currency="NPR"
+                )
+                db.add(wallet)
+                db.flush()
+            if commit:
+                db.commit()
         
         return wallet
     
@@ -54,16 +159,26 @@ class WalletService:
         Returns:
             dict with balance, reserved_balance, available_balance, currency
         """
-        wallet = WalletService.get_or_create_wallet(db, user_id)
+        key = WalletService.balance_key(user_id)
+        balance = cache_get(key)
+        if balance is not None:
+            return balance
         
-        available_balance = wallet.balance - wallet.reserved_balance
+        row = db.execute(GET_BALANCE, {"user_id": user_id}).first()
+        if row is None:
+            # First read for this user: the new wallet has the same fields
+            row = WalletService.get_or_create_wallet(db, user_id)
         
-        return {
-            "balance": float(wallet.balance),
-            "reserved_balance": float(wallet.reserved_balance),
+        available_balance = row.balance - row.reserved_balance
+        
+        balance = {
+            "balance": float(row.balance),
+            "reserved_balance": float(row.reserved_balance),
             "available_balance": float(available_balance),
-            "currency": wallet.currency
+            "currency": row.currency
         }
+        cache_set(key, balance, BALANCE_TTL)
+        return balance
     
     @staticmethod
     def reserve_balance(
@@ -71,7 +186,9 @@ class WalletService:
         user_id: str,
         amount: Decimal,
         session_id: Optional[uuid.UUID] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        commit: bool = True,
+        wallet: Optional[UserWallet] = None
     ) -> WalletTransaction:
         """
         Reserve balance for a session
@@ -82,6 +199,9 @@ class WalletService:
             amount: Amount to reserve
             session_id: Optional session ID
             description: Optional transaction description
+            commit: Commit now; pass False to leave the changes pending in the
+                caller's transaction
+            wallet: The user's wallet if the caller already loaded it
             
         Returns:
             WalletTransaction object
@@ -89,22 +209,24 @@ class WalletService:
         Raises:
             ValueError: If insufficient balance
         """
-        wallet = WalletService.get_or_create_wallet(db, user_id)
-        
-        available_balance = wallet.balance - wallet.reserved_balance
+        if wallet is None:
+            wallet = WalletService.get_or_create_wallet(db, user_id, commit=False)
         
-        if available_balance < amount:
+        # Update reserved balance, only if the available balance covers the amount
+        row = WalletService.apply_balance_update(
+            db, RESERVE_BALANCE, {"amount": amount, "updated_at": datetime.utcnow()}, wallet
+        )
+        if row is None:
+            db.refresh(wallet)
+            available_balance = wallet.balance - wallet.reserved_balance
             raise ValueError(f"Insufficient balance. Available: {available_balance}, Required: {amount}")
         
-        # Update reserved balance
-        balance_before = wallet.reserved_balance
-        wallet.reserved_balance += amount
-        balance_after = wallet.reserved_balance
-        wallet.updated_at = datetime.utcnow()
+        balance_after = row.reserved_balance
+        balance_before = balance_after - amount
         
         # Create transaction record
         transaction = WalletTransaction(
-            transaction_id=uuid.uuid4(),
+            transaction_id=uuid7(),
             wallet_id=wallet.wallet_id,
             user_id=user_id,
             transaction_type=TransactionType.reserve.value,
@@ -116,8 +238,8 @@ class WalletService:
         )
         
         db.add(transaction)
-        db.commit()
-        db.refresh(transaction)
+        if commit:
+            db.commit()
         
         return transaction
     
@@ -127,7 +249,9 @@ class WalletService:
         user_id: str,
         reserved_amount: Decimal,
         actual_amount: Decimal,
-        session_id: uuid.UUID
+        session_id: uuid.UUID,
+        commit: bool = True,
+        wallet: Optional[UserWallet] = None
     ) -> WalletTransaction:
         """
         Finalize a reservation by charging the actual amount
@@ -138,31 +262,33 @@ class WalletService:
             reserved_amount: Amount that was reserved
             actual_amount: Actual amount to charge
             session_id: Session ID
+            commit: Commit now; pass False to leave the changes pending in the
+                caller's transaction
+            wallet: The user's wallet if the caller already loaded it
             
         Returns:
             WalletTransaction object for the charge
         """
-        wallet = WalletService.get_or_create_wallet(db, user_id)
-        
-        # Release reserved amount
-        if wallet.reserved_balance >= reserved_amount:
-            wallet.reserved_balance -= reserved_amount
-        else:
-            # Handle edge case where reserved balance is less than expected
-            wallet.reserved_balance = Decimal("0.00")
-        
-        # Charge actual amount
-        if wallet.balance < actual_amount:
+        if wallet is None:
+            wallet = WalletService.get_or_create_wallet(db, user_id, commit=False)
+        
+        # Release reserved amount and charge actual amount, only if the balance covers it
+        row = WalletService.apply_balance_update(
+            db,
+            FINALIZE_RESERVATION,
+            {"amount": actual_amount, "reserved_amount": reserved_amount, "updated_at": datetime.utcnow()},
+            wallet
+        )
+        if row is None:
+            db.refresh(wallet)
             raise ValueError(f"Insufficient balance. Balance: {wallet.balance}, Required: {actual_amount}")
         
-        balance_before = wallet.balance
-        wallet.balance -= actual_amount
-        balance_after = wallet.balance
-        wallet.updated_at = datetime.utcnow()
+        balance_after = row.balance
+        balance_before = balance_after + actual_amount
         
         # Create charge transaction
         transaction = WalletTransaction(
-            transaction_id=uuid.uuid4(),
+            transaction_id=uuid7(),
             wallet_id=wallet.wallet_id,
             user_id=user_id,
             transaction_type=TransactionType.charge.value,
@@ -174,8 +300,8 @@ class WalletService:
         )
         
         db.add(transaction)
-        db.commit()
-        db.refresh(transaction)
+        if commit:
+            db.commit()
         
         return transaction
     
@@ -185,7 +311,9 @@ class WalletService:
         user_id: str,
         amount: Decimal,
         session_id: Optional[uuid.UUID] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        commit: bool = True,
+        wallet: Optional[UserWallet] = None
     ) -> WalletTransaction:
         """
         Refund amount to user wallet
@@ -196,19 +324,24 @@ class WalletService:
             amount: Amount to refund
             session_id: Optional session ID
             description: Optional transaction description
+            commit: Commit now; pass False to leave the changes pending in the
+                caller's transaction
+            wallet: The user's wallet if the caller already loaded it
             
         Returns:
             WalletTransaction object
         """
-        wallet = WalletService.get_or_create_wallet(db, user_id)
+        if wallet is None:
+            wallet = WalletService.get_or_create_wallet(db, user_id, commit=False)
         
-        balance_before = wallet.balance
-        wallet.balance += amount
-        balance_after = wallet.balance
-        wallet.updated_at = datetime.utcnow()
+        row = WalletService.apply_balance_update(
+            db, CREDIT_BALANCE, {"amount": amount, "updated_at": datetime.utcnow()}, wallet
+        )
+        balance_after = row.balance
+        balance_before = balance_after - amount
         
         transaction = WalletTransaction(
-            transaction_id=uuid.uuid4(),
+            transaction_id=uuid7(),
             wallet_id=wallet.wallet_id,
             user_id=user_id,
             transaction_type=TransactionType.refund.value,
@@ -220,8 +353,8 @@ class WalletService:
         )
         
         db.add(transaction)
-        db.commit()
-        db.refresh(transaction)
+        if commit:
+            db.commit()
         
         return transaction
     
@@ -244,7 +377,7 @@ class WalletService:
         Returns:
             dict with transaction details and bonus information
         """
-        wallet = WalletService.get_or_create_wallet(db, user_id)
+        wallet = WalletService.get_or_create_wallet(db, user_id, commit=False)
         
         # Calculate bonus based on tier
         bonus_amount = Decimal("0.00")
@@ -260,14 +393,15 @@ class WalletService:
         total_amount = amount_npr + bonus_amount
         
         # Update wallet balance
-        balance_before = wallet.balance
-        wallet.balance += total_amount
-        balance_after = wallet.balance
-        wallet.updated_at = datetime.utcnow()
+        row = WalletService.apply_balance_update(
+            db, CREDIT_BALANCE, {"amount": total_amount, "updated_at": datetime.utcnow()}, wallet
+        )
+        balance_after = row.balance
+        balance_before = balance_after - total_amount
         
         # Create topup transaction
         topup_transaction = WalletTransaction(
-            transaction_id=uuid.uuid4(),
+            transaction_id=uuid7(),
             wallet_id=wallet.wallet_id,
             user_id=user_id,
             transaction_type=TransactionType.topup.value,
@@ -286,7 +420,7 @@ class WalletService:
             bonus_balance_before = wallet.balance
             # Note: Balance already includes bonus, so we just record it
             bonus_transaction = WalletTransaction(
-                transaction_id=uuid.uuid4(),
+                transaction_id=uuid7(),
                 wallet_id=wallet.wallet_id,
                 user_id=user_id,
                 transaction_type=TransactionType.bonus.value,
@@ -299,9 +433,6 @@ class WalletService:
             db.add(bonus_transaction)
         
         db.commit()
-        db.refresh(topup_transaction)
-        if bonus_transaction:
-            db.refresh(bonus_transaction)
         
         return {
             "transaction_id": str(topup_transaction.transaction_id),
@@ -314,3 +445,16 @@ class WalletService:
             "bonus_transaction_id": str(bonus_transaction.transaction_id) if bonus_transaction else None
         }
 
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_balances(db: Session) -> None:
+    """Drop cached balances changed by the committed transaction, whichever code committed it"""
+    user_ids = db.info.pop(CHANGED_BALANCES, None)
+    if user_ids:
+        cache_delete(*(WalletService.balance_key(user_id) for user_id in user_ids))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_rolled_back_balances(db: Session) -> None:
+    """Rolled-back writes never reached the database, so the cached balances are still valid"""
+    db.info.pop(CHANGED_BALANCES, None)
@@ -3,7 +3,7 @@ Test configuration and fixtures
 """
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from main import app
@@ -113,6 +113,19 @@ def test_db():
         db.close()
 
 
+@pytest.fixture
+def query_counter():
+    """Record SQL statements executed against the test database"""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
 # Auto-imported additions
 """
 Additional fixtures for AI/ML and Japanese training tests
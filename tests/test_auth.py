@@ -57,6 +57,22 @@ class TestUserRegistration:
 class TestUserLogin:
     """Test user login endpoint"""
     
+    def test_login_email_domain_case_insensitive(self, client):
+        """Test that the email domain is matched case-insensitively"""
+        client.post("/api/auth/register", json={
+            "email": "CaseUser@Example.COM",
+            "password": "SecurePass123!",
+            "role": "student"
+        })
+        
+        response = client.post("/api/auth/login", json={
+            "email": "CaseUser@example.com",
+            "password": "SecurePass123!"
+        })
+        
+        assert response.status_code == 200
+        assert response.json()["email"] == "CaseUser@example.com"
+    
     def test_login_success(self, client):
         """Test successful login with correct credentials"""
         # First register a user
@@ -120,3 +136,27 @@ class TestPasswordSecurity:
         # Password should not appear in response
         response_str = str(response.json())
         assert "MySecretPass123!" not in response_str
+
+
+class TestTokenVerification:
+    """Test JWT verification caching"""
+    
+    def test_cached_verification_returns_payload(self):
+        """Test that repeated verification of a valid token returns the same claims"""
+        from config.auth import create_access_token
+        from config.dependencies import verify_token_cached
+        
+        token = create_access_token({"user_id": "cache_user", "role": "student"})
+        
+        first = verify_token_cached(token)
+        second = verify_token_cached(token)
+        
+        assert first["user_id"] == "cache_user"
+        assert second == first
+    
+    def test_invalid_token_is_not_cached(self):
+        """Test that invalid tokens are rejected every time"""
+        from config.dependencies import verify_token_cached
+        
+        assert verify_token_cached("not-a-jwt") is None
+        assert verify_token_cached("not-a-jwt") is None
@@ -289,6 +289,40 @@ def test_practice_kanji(client):
     assert "times_practiced" in data
 
 
+# ==================== QUIZ TESTS ====================
+
+def test_get_quiz_questions_after_create_and_update(client):
+    """Test that questions of a newly created quiz can be paged, and follow updates"""
+    db = TestingSessionLocal()
+    quiz = JapaneseQuizDB(
+        quiz_title="Greetings",
+        quiz_type="lesson",
+        questions=[
+            {"type": "multiple_choice", "question": f"Question {i}", "options": ["a", "b"], "correct_answer": "a"}
+            for i in range(3)
+        ]
+    )
+    db.add(quiz)
+    db.commit()
+    quiz_id = quiz.quiz_id
+    
+    response = client.get(f"/api/japanese/quizzes/{quiz_id}/questions", params={"offset": 1, "limit": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["question_index"] == 1
+    assert data[0]["prompt"] == "Question 1"
+    assert "correct_answer" not in data[0]
+    
+    quiz.questions = [{"type": "text", "question": "Only question"}]
+    db.commit()
+    db.close()
+    
+    response = client.get(f"/api/japanese/quizzes/{quiz_id}/questions")
+    assert response.status_code == 200
+    assert [q["prompt"] for q in response.json()] == ["Only question"]
+
+
 # ==================== PROGRESS TESTS ====================
 
 def test_get_progress_overview(client):
@@ -5,6 +5,8 @@ Tests MUST be written BEFORE implementation code
 from fastapi.testclient import TestClient
 import pytest
 
+from api.lessons import MAX_BULK_LESSONS
+
 
 class TestLessonCreation:
     """Test lesson creation (admin only)"""
@@ -97,6 +99,72 @@ class TestLessonCreation:
         
         assert response.status_code == 403  # Forbidden (no token provided)
 
+    def test_bulk_create_lessons_as_admin(self, client):
+        """
+        Test that admin can import several lessons in one request
+        """
+        client.post("/api/auth/register", json={
+            "email": "admin_bulk@example.com",
+            "password": "AdminPass123!",
+            "role": "admin"
+        })
+        login_response = client.post("/api/auth/login", json={
+            "email": "admin_bulk@example.com",
+            "password": "AdminPass123!"
+        })
+        token = login_response.json()["access_token"]
+
+        response = client.post(
+            "/api/lessons/bulk",
+            json=[
+                {"level": "N5", "title": f"Lesson {i}", "description": "Test", "content_json": {"n": i}}
+                for i in range(3)
+            ],
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 3
+        assert len(data["lesson_ids"]) == 3
+
+        lesson = client.get(f"/api/lessons/{data['lesson_ids'][2]}").json()
+        assert lesson["content_json"] == {"n": 2}
+
+    def test_bulk_create_lessons_requires_admin(self, client):
+        """
+        Test that bulk import is admin only
+        """
+        response = client.post(
+            "/api/lessons/bulk",
+            json=[{"level": "N5", "title": "Test", "description": "Test", "content_json": {}}]
+        )
+
+        assert response.status_code == 403
+
+    def test_bulk_create_lessons_rejects_oversized_import(self, client):
+        """
+        Test that an import over the bulk size limit is rejected before touching the database
+        """
+        client.post("/api/auth/register", json={
+            "email": "admin_bulk_limit@example.com",
+            "password": "AdminPass123!",
+            "role": "admin"
+        })
+        login_response = client.post("/api/auth/login", json={
+            "email": "admin_bulk_limit@example.com",
+            "password": "AdminPass123!"
+        })
+        token = login_response.json()["access_token"]
+
+        response = client.post(
+            "/api/lessons/bulk",
+            json=[{"level": "N5", "title": "Test", "content_json": {}}] * (MAX_BULK_LESSONS + 1),
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 422
+
 
 class TestLessonRetrieval:
     """Test lesson retrieval (all users)"""
@@ -158,9 +226,54 @@ class TestLessonRetrieval:
         RED - This test SHOULD FAIL
         """
         response = client.get("/api/lessons/nonexistent-id")
-        
+
         assert response.status_code == 404
 
+    def test_get_lessons_batch(self, client):
+        """
+        Test loading several lessons in one request, keyed by lesson_id
+        """
+        client.post("/api/auth/register", json={
+            "email": "admin_batch@example.com",
+            "password": "AdminPass123!",
+            "role": "admin"
+        })
+        login_response = client.post("/api/auth/login", json={
+            "email": "admin_batch@example.com",
+            "password": "AdminPass123!"
+        })
+        token = login_response.json()["access_token"]
+
+        lesson_ids = []
+        for title in ["Greetings", "Numbers"]:
+            create_response = client.post(
+                "/api/lessons",
+                json={"level": "N5", "title": title, "description": "Test", "content_json": {}},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            lesson_ids.append(create_response.json()["lesson_id"])
+
+        response = client.post(
+            "/api/lessons/batch",
+            json={"lesson_ids": lesson_ids + ["nonexistent-id"]}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == set(lesson_ids)
+        assert data[lesson_ids[1]]["title"] == "Numbers"
+
+    def test_get_lessons_batch_caps_input(self, client):
+        """
+        Test that batch requests over 200 IDs are rejected
+        """
+        response = client.post(
+            "/api/lessons/batch",
+            json={"lesson_ids": [f"lesson-{i}" for i in range(201)]}
+        )
+
+        assert response.status_code == 422
+
 
 class TestLessonUpdate:
     """Test lesson updates (admin only)"""
@@ -138,6 +138,13 @@ class TestQuizRetrieval:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 1
+        assert "questions" not in data[0]
+        
+        # Full quiz (with questions) is fetched by ID
+        response = client.get(f"/api/quizzes/{data[0]['quiz_id']}")
+        
+        assert response.status_code == 200
+        assert len(response.json()["questions"]) == 1
 
 
 class TestQuizSubmission:
@@ -271,6 +278,86 @@ class TestQuizSubmission:
         data = response.json()
         assert data["score"] == 50  # 1/2 correct = 50%
         assert data["correct_answers"] == 1
+    
+    def test_submit_quiz_score_matches_stored_attempt(self, client):
+        """
+        Test that a non-integer percentage is returned as stored (1/3 correct = 33%)
+        """
+        client.post("/api/auth/register", json={
+            "email": "admin_thirds@example.com",
+            "password": "AdminPass123!",
+            "role": "admin"
+        })
+        admin_login = client.post("/api/auth/login", json={
+            "email": "admin_thirds@example.com",
+            "password": "AdminPass123!"
+        })
+        admin_token = admin_login.json()["access_token"]
+        
+        quiz_response = client.post(
+            "/api/quizzes",
+            json={
+                "lesson_id": "lesson-thirds",
+                "title": "Thirds",
+                "questions": [
+                    {"question_text": f"Q{i}", "options": ["A", "B"], "correct_answer": "A"}
+                    for i in range(3)
+                ]
+            },
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        quiz_id = quiz_response.json()["quiz_id"]
+        
+        response = client.post(
+            f"/api/quizzes/{quiz_id}/submit",
+            json={"answers": ["A", "B", "B"]},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        
+        assert response.status_code == 201
+        assert response.json()["score"] == 33
+        
+        attempts = client.get(
+            "/api/quizzes/my-attempts",
+            headers={"Authorization": f"Bearer {admin_token}"}
+        ).json()
+        assert attempts[0]["score"] == response.json()["score"]
+    
+    def test_submit_quiz_rejects_oversized_payload(self, client):
+        """
+        Test that oversized submissions are rejected before grading
+        """
+        client.post("/api/auth/register", json={
+            "email": "student_big@example.com",
+            "password": "StudentPass123!",
+            "role": "student"
+        })
+        student_login = client.post("/api/auth/login", json={
+            "email": "student_big@example.com",
+            "password": "StudentPass123!"
+        })
+        student_token = student_login.json()["access_token"]
+        
+        response = client.post(
+            "/api/quizzes/any-quiz/submit",
+            json={"answers": ["A"] * 201},
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        assert response.status_code == 422
+        
+        response = client.post(
+            "/api/quizzes/any-quiz/submit",
+            json={"answers": {str(i): "A" for i in range(201)}},
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        assert response.status_code == 422
+        
+        response = client.post(
+            "/api/quizzes/any-quiz/submit",
+            json={"answers": ["A" * 65]},
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        assert response.status_code == 422
 
 
 class TestQuizAttempts:
@@ -346,3 +433,77 @@ class TestQuizAttempts:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 2
+        assert all(isinstance(attempt["score"], float) for attempt in data)
+        
+        # Page through one attempt at a time
+        first_page = client.get(
+            "/api/quizzes/my-attempts?limit=1",
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        assert len(first_page.json()) == 1
+        cursor = first_page.headers["X-Next-Cursor"]
+        
+        second_page = client.get(
+            f"/api/quizzes/my-attempts?limit=1&cursor={cursor}",
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        assert len(second_page.json()) == 1
+        assert second_page.json()[0]["attempt_id"] != first_page.json()[0]["attempt_id"]
+        
+        last_page = client.get(
+            f"/api/quizzes/my-attempts?limit=1&cursor={second_page.headers['X-Next-Cursor']}",
+            headers={"Authorization": f"Bearer {student_token}"}
+        )
+        assert last_page.json() == []
+        assert "X-Next-Cursor" not in last_page.headers
+    
+    def test_list_endpoints_query_count(self, client, query_counter):
+        """
+        Test that list endpoints use a constant number of queries (no N+1)
+        """
+        client.post("/api/auth/register", json={
+            "email": "admin6@example.com",
+            "password": "AdminPass123!",
+            "role": "admin"
+        })
+        admin_login = client.post("/api/auth/login", json={
+            "email": "admin6@example.com",
+            "password": "AdminPass123!"
+        })
+        admin_token = admin_login.json()["access_token"]
+        
+        lesson_response = client.post(
+            "/api/lessons",
+            json={"level": "N5", "title": "Test", "description": "Test", "content_json": {}},
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        lesson_id = lesson_response.json()["lesson_id"]
+        
+        for title in ["Quiz 1", "Quiz 2", "Quiz 3"]:
+            quiz_response = client.post(
+                "/api/quizzes",
+                json={
+                    "lesson_id": lesson_id,
+                    "title": title,
+                    "questions": [{"question_text": "Q", "options": ["A", "B", "C", "D"], "correct_answer": "A"}]
+                },
+                headers={"Authorization": f"Bearer {admin_token}"}
+            )
+            client.post(
+                f"/api/quizzes/{quiz_response.json()['quiz_id']}/submit",
+                json={"answers": ["A"]},
+                headers={"Authorization": f"Bearer {admin_token}"}
+            )
+        
+        query_counter.clear()
+        response = client.get(
+            "/api/quizzes/my-attempts",
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+        assert len(response.json()) == 3
+        assert len(query_counter) <= 2
+        
+        query_counter.clear()
+        response = client.get(f"/api/quizzes/lesson/{lesson_id}")
+        assert len(response.json()) == 3
+        assert len(query_counter) <= 2
@@ -8,6 +8,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from services.video_session_service import VideoSessionService
+from db_models.wallet import VideoSession, UserWallet
 from services.wallet_service import WalletService
 from config.costs import VIDEO_SESSION_COST_PER_MINUTE
 
@@ -162,6 +163,92 @@ class TestVideoSessionService:
         assert result["current_timestamp"] == 300
         assert result["completion_percentage"] == 25.0
     
+    @pytest.mark.asyncio
+    async def test_answer_and_progress_are_saved(self, test_db, test_user):
+        """Test that answers and progress are written to the stored session metadata"""
+        user_id = test_user.user_id
+        
+        WalletService.topup(
+            db=test_db,
+            user_id=user_id,
+            amount_npr=Decimal("500.00"),
+            payment_method_id="test_pm_123"
+        )
+        start_result = VideoSessionService.start_session(
+            db=test_db,
+            user_id=user_id,
+            video_id="caregiving_n5_lesson_01_ja",
+            language="ja"
+        )
+        session_id = start_result["session_id"]
+        
+        with patch('services.video_session_service.AssessmentService.evaluate_answer') as mock_assess:
+            mock_assess.return_value = {"question_id": "q1", "overall": 86.0}
+            await VideoSessionService.answer_question(
+                db=test_db,
+                session_id=session_id,
+                user_id=user_id,
+                question_id="q1",
+                answer="患者さんに水が必要です"
+            )
+        
+        VideoSessionService.update_progress(
+            db=test_db,
+            session_id=session_id,
+            user_id=user_id,
+            current_timestamp=300,
+            completion_percentage=25.0
+        )
+        
+        # Read the row back rather than the in-memory copy
+        test_db.expire_all()
+        stored = test_db.query(VideoSession).filter(VideoSession.session_id == session_id).one()
+        metadata = stored.video_session_metadata
+        
+        assert metadata["answers"]["q1"]["answer"] == "患者さんに水が必要です"
+        assert metadata["answers"]["q1"]["assessment"]["overall"] == 86.0
+        assert metadata["progress"]["current_timestamp"] == 300
+        assert metadata["progress"]["completion_percentage"] == 25.0
+        assert stored.status == "active"
+    
+    @pytest.mark.asyncio
+    async def test_answer_not_saved_if_session_completed_during_assessment(self, test_db, test_user):
+        """Test that an answer is rejected when the session is completed while it is being assessed"""
+        user_id = test_user.user_id
+        
+        WalletService.topup(
+            db=test_db,
+            user_id=user_id,
+            amount_npr=Decimal("500.00"),
+            payment_method_id="test_pm_123"
+        )
+        start_result = VideoSessionService.start_session(
+            db=test_db,
+            user_id=user_id,
+            video_id="caregiving_n5_lesson_01_ja",
+            language="ja"
+        )
+        session_id = start_result["session_id"]
+        
+        def complete_then_assess(**kwargs):
+            VideoSessionService.complete_session(db=test_db, session_id=session_id, user_id=user_id)
+            return {"question_id": "q1", "overall": 86.0}
+        
+        with patch('services.video_session_service.AssessmentService.evaluate_answer', side_effect=complete_then_assess):
+            with pytest.raises(ValueError, match="closed"):
+                await VideoSessionService.answer_question(
+                    db=test_db,
+                    session_id=session_id,
+                    user_id=user_id,
+                    question_id="q1",
+                    answer="患者さんに水が必要です"
+                )
+        
+        test_db.expire_all()
+        stored = test_db.query(VideoSession).filter(VideoSession.session_id == session_id).one()
+        assert stored.status == "completed"
+        assert "q1" not in stored.video_session_metadata.get("answers", {})
+    
     def test_complete_session(self, test_db, test_user):
         """Test completing a video session"""
         user_id = test_user.user_id
@@ -206,6 +293,81 @@ class TestVideoSessionService:
         assert result["refund_amount"] == 150.0  # Refund for unused portion
 
 
+class TestVideoSessionSettlement:
+    """Test the wallet updates that settle a video session"""
+    
+    def test_finalize_clamps_reserved_balance_at_zero(self, test_db, test_user):
+        """Test that releasing more than is reserved leaves reserved_balance at zero"""
+        user_id = test_user.user_id
+        
+        WalletService.topup(
+            db=test_db,
+            user_id=user_id,
+            amount_npr=Decimal("100.00"),
+            payment_method_id="test_pm_123"
+        )
+        WalletService.reserve_balance(db=test_db, user_id=user_id, amount=Decimal("30.00"))
+        
+        transaction = WalletService.finalize_reservation(
+            db=test_db,
+            user_id=user_id,
+            reserved_amount=Decimal("50.00"),
+            actual_amount=Decimal("20.00"),
+            session_id=None
+        )
+        
+        assert transaction.balance_before == Decimal("100.00")
+        assert transaction.balance_after == Decimal("80.00")
+        
+        test_db.expire_all()
+        wallet = WalletService.get_or_create_wallet(test_db, user_id)
+        assert wallet.balance == Decimal("80.00")
+        assert wallet.reserved_balance == Decimal("0.00")
+    
+    def test_finalize_insufficient_balance_leaves_wallet_unchanged(self, test_db, test_user):
+        """Test that a charge larger than the balance raises and changes nothing"""
+        user_id = test_user.user_id
+        
+        WalletService.topup(
+            db=test_db,
+            user_id=user_id,
+            amount_npr=Decimal("100.00"),
+            payment_method_id="test_pm_123"
+        )
+        WalletService.reserve_balance(db=test_db, user_id=user_id, amount=Decimal("30.00"))
+        
+        with pytest.raises(ValueError, match="Insufficient balance"):
+            WalletService.finalize_reservation(
+                db=test_db,
+                user_id=user_id,
+                reserved_amount=Decimal("30.00"),
+                actual_amount=Decimal("150.00"),
+                session_id=None
+            )
+        
+        test_db.rollback()
+        wallet = WalletService.get_or_create_wallet(test_db, user_id)
+        assert wallet.balance == Decimal("100.00")
+        assert wallet.reserved_balance == Decimal("30.00")
+
+
+    def test_wallet_created_inside_the_operation_transaction(self, test_db, test_user):
+        """Test that a wallet created on first use commits or rolls back with the operation"""
+        user_id = test_user.user_id
+        
+        # Rolled back with the refund that created it
+        WalletService.refund(db=test_db, user_id=user_id, amount=Decimal("10.00"), commit=False)
+        test_db.rollback()
+        assert test_db.query(UserWallet).filter(UserWallet.user_id == user_id).count() == 0
+        
+        # Committed together with the refund
+        WalletService.refund(db=test_db, user_id=user_id, amount=Decimal("10.00"), commit=False)
+        test_db.commit()
+        test_db.expire_all()
+        wallet = test_db.query(UserWallet).filter(UserWallet.user_id == user_id).one()
+        assert wallet.balance == Decimal("10.00")
+
+
 class TestVideoSessionAPI:
     """Test video session API endpoints"""
     
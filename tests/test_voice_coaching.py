@@ -4,8 +4,12 @@ Tests for voice coaching service and API endpoints
 """
 from fastapi.testclient import TestClient
 import pytest
+import uuid
 from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
+from services import voice_coaching_service
 from services.voice_coaching_service import VoiceCoachingService
 from services.wallet_service import WalletService
 from config.costs import (
@@ -43,6 +47,153 @@ class TestVoiceCoachingCostCalculation:
             VoiceCoachingService.calculate_cost("invalid", 10)
 
 
+class TestVoiceCoachingHistory:
+    """Test conversation history trimming"""
+    
+    def test_trim_history_keeps_short_history(self):
+        """Test that history within the budget is passed through unchanged"""
+        history = [
+            {"role": "user", "content": "こんにちは"},
+            {"role": "assistant", "content": "こんにちは！お元気ですか？"}
+        ]
+        
+        assert VoiceCoachingService.trim_history(history) == history
+    
+    def test_trim_history_drops_oldest_turns(self):
+        """Test that the oldest turns are dropped once the budget is exceeded"""
+        history = [{"role": "user", "content": "あ" * 4000} for _ in range(3)]
+        
+        trimmed = VoiceCoachingService.trim_history(history)
+        
+        assert trimmed == history[-1:]
+
+
+class TestVoiceCoachingReplyCache:
+    """Test the opening-turn reply cache in standard mode"""
+    
+    @pytest.fixture(autouse=True)
+    def openai_create(self):
+        """Empty cache and a mocked OpenAI client; yields the mocked create call"""
+        voice_coaching_service._reply_cache.clear()
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="はい、どうぞ。"))],
+            usage=SimpleNamespace(total_tokens=42)
+        )
+        create = AsyncMock(return_value=response)
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        with patch("services.voice_coaching_service.get_openai_client", return_value=client):
+            yield create
+        voice_coaching_service._reply_cache.clear()
+    
+    async def reply(self, text_input, **kwargs):
+        return await VoiceCoachingService.handle_standard_mode(
+            session_id=uuid.uuid4(),
+            audio_input=None,
+            text_input=text_input,
+            track="caregiving",
+            **kwargs
+        )
+    
+    @pytest.mark.asyncio
+    async def test_identical_opening_turns_call_upstream_once(self, openai_create):
+        """Test that a repeated opening turn is served from the cache"""
+        first = await self.reply("こんにちは")
+        second = await self.reply("  こんにちは ")
+        
+        assert openai_create.await_count == 1
+        assert first["cache_hit"] is False
+        assert first["tokens_used"] == 42
+        assert second["cache_hit"] is True
+        assert second["tokens_used"] == 0  # no tokens spent; the session is still billed per minute
+        assert second["response_text"] == first["response_text"]
+    
+    @pytest.mark.asyncio
+    async def test_bypass_cache(self, openai_create):
+        """Test that bypass_cache always calls upstream"""
+        await self.reply("こんにちは")
+        result = await self.reply("こんにちは", bypass_cache=True)
+        
+        assert openai_create.await_count == 2
+        assert result["cache_hit"] is False
+    
+    @pytest.mark.asyncio
+    async def test_turns_with_history_are_not_cached(self, openai_create):
+        """Test that replies depending on conversation history are never cached"""
+        history = [{"role": "user", "content": "はじめまして"}]
+        await self.reply("こんにちは", conversation_history=history)
+        result = await self.reply("こんにちは", conversation_history=history)
+        
+        assert openai_create.await_count == 2
+        assert result["cache_hit"] is False
+        assert len(voice_coaching_service._reply_cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_least_recently_used_reply_is_evicted(self, openai_create):
+        """Test that the cache evicts the least recently used reply when full"""
+        with patch("services.voice_coaching_service.REPLY_CACHE_SIZE", 2):
+            await self.reply("一")
+            await self.reply("二")
+            await self.reply("一")  # hit; "二" is now least recently used
+            await self.reply("三")  # evicts "二"
+            assert openai_create.await_count == 3
+            
+            assert (await self.reply("一"))["cache_hit"] is True
+            assert (await self.reply("二"))["cache_hit"] is False
+            assert openai_create.await_count == 4
+
+
+class TestWalletBalanceCache:
+    """Test that cached wallet balances are dropped when wallet writes commit"""
+    
+    @pytest.fixture
+    def balance_cache(self):
+        """In-memory stand-in for Redis behind WalletService's cache calls"""
+        store = {}
+        with patch("services.wallet_service.cache_get", side_effect=store.get), \
+                patch("services.wallet_service.cache_set", side_effect=lambda key, value, ttl: store.__setitem__(key, value)), \
+                patch("services.wallet_service.cache_delete", side_effect=lambda *keys: [store.pop(key, None) for key in keys]):
+            yield store
+    
+    def test_balance_is_fresh_after_each_write(self, test_db, test_user, balance_cache):
+        """Test reading, writing and reading again through topup, session start and session end"""
+        user_id = test_user.user_id
+        
+        assert WalletService.get_balance(test_db, user_id)["balance"] == 0.0
+        assert WalletService.balance_key(user_id) in balance_cache
+        
+        WalletService.topup(
+            db=test_db,
+            user_id=user_id,
+            amount_npr=Decimal("100.00"),
+            payment_method_id="test_pm_123"
+        )
+        assert WalletService.get_balance(test_db, user_id)["available_balance"] == 100.0
+        
+        start_result = VoiceCoachingService.start_session(
+            db=test_db,
+            user_id=user_id,
+            mode="standard",
+            track="caregiving",
+            language="en",
+            estimated_duration_minutes=15
+        )
+        balance = WalletService.get_balance(test_db, user_id)
+        assert balance["reserved_balance"] == 30.0
+        assert balance["available_balance"] == 70.0
+        
+        VoiceCoachingService.end_session(
+            db=test_db,
+            session_id=start_result["session_id"],
+            user_id=user_id,
+            actual_duration_minutes=10
+        )
+        balance = WalletService.get_balance(test_db, user_id)
+        test_db.expire_all()
+        wallet = WalletService.get_or_create_wallet(test_db, user_id)
+        assert balance["balance"] == float(wallet.balance)
+        assert balance["reserved_balance"] == 0.0
+
+
 class TestVoiceCoachingSessionLifecycle:
     """Test voice coaching session lifecycle"""
     
@@ -67,6 +218,32 @@ class TestVoiceCoachingSessionLifecycle:
                 estimated_duration_minutes=15
             )
     
+    def test_insufficient_balance_leaves_wallet_unchanged(self, test_db, test_user):
+        """Test that a reservation the balance can't cover changes nothing"""
+        user_id = test_user.user_id
+        
+        WalletService.topup(
+            db=test_db,
+            user_id=user_id,
+            amount_npr=Decimal("20.00"),
+            payment_method_id="test_pm_123"
+        )
+        
+        with pytest.raises(ValueError, match="Insufficient balance"):
+            VoiceCoachingService.start_session(
+                db=test_db,
+                user_id=user_id,
+                mode="standard",
+                track="caregiving",
+                language="en",
+                estimated_duration_minutes=15
+            )
+        
+        test_db.expire_all()
+        wallet = WalletService.get_or_create_wallet(test_db, user_id)
+        assert wallet.balance == Decimal("20.00")
+        assert wallet.reserved_balance == Decimal("0.00")
+    
     def test_start_session_sufficient_balance(self, test_db, test_user):
         """Test starting session with sufficient balance"""
         user_id = test_user.user_id
@@ -311,3 +488,81 @@ class TestVoiceCoachingAPI:
         assert data["actual_cost"] == 20.0
         assert data["refund_amount"] == 10.0
 
+    
+    def test_stream_message_unknown_session(self, client):
+        """Test that streaming to a session the user does not own returns 404"""
+        client.post("/api/auth/register", json={
+            "email": "stream@example.com",
+            "password": "TestPass123!",
+            "role": "student"
+        })
+        login_response = client.post("/api/auth/login", json={
+            "email": "stream@example.com",
+            "password": "TestPass123!"
+        })
+        token = login_response.json()["access_token"]
+        
+        response = client.post(
+            "/api/coaching/voice/00000000-0000-0000-0000-000000000000/message/stream",
+            json={"text_input": "こんにちは", "track": "caregiving"},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        
+        assert response.status_code == 404
+
+
+class TestAssessmentBatchAPI:
+    """Test batch answer evaluation endpoint"""
+    
+    def test_failed_item_does_not_drop_the_others(self, client):
+        """Test that one failed evaluation is reported per item and the rest are returned"""
+        client.post("/api/auth/register", json={
+            "email": "batch@example.com",
+            "password": "TestPass123!",
+            "role": "student"
+        })
+        login_response = client.post("/api/auth/login", json={
+            "email": "batch@example.com",
+            "password": "TestPass123!"
+        })
+        token = login_response.json()["access_token"]
+        
+        async def evaluate_answer(question_id, track, expected_keigo_level, **kwargs):
+            if question_id == "q2":
+                raise Exception("OpenAI API error: rate limited")
+            return {
+                "question_id": question_id,
+                "grammar": 20.0,
+                "keigo_appropriateness": 20.0,
+                "contextual_fit": 20.0,
+                "overall_quality": 20.0,
+                "overall": 80.0,
+                "feedback": "よくできました",
+                "track": track,
+                "expected_keigo_level": expected_keigo_level
+            }
+        
+        answers = [
+            {
+                "question_id": question_id,
+                "student_answer": "患者さんに水が必要です",
+                "track": "caregiving",
+                "expected_keigo_level": "teineigo"
+            }
+            for question_id in ("q1", "q2", "q3")
+        ]
+        with patch("services.assessment_service.AssessmentService.evaluate_answer", side_effect=evaluate_answer):
+            response = client.post(
+                "/api/coaching/assessment/evaluate/batch",
+                json=answers,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+        
+        assert response.status_code == 207
+        data = response.json()
+        assert [item["question_id"] for item in data] == ["q1", "q2", "q3"]
+        assert data[0]["evaluation"]["overall"] == 80.0
+        assert data[0]["error"] is None
+        assert data[1]["evaluation"] is None
+        assert "rate limited" in data[1]["error"]
+        assert data[2]["evaluation"]["overall"] == 80.0